@@ -0,0 +1,137 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from population_model import DEFAULT_DEGREES
+from internet_usage_model import fit_logistic, logistic_function, DEFAULT_P0, DEFAULT_BOUNDS
+
+logger = logging.getLogger(__name__)
+
+def _backtest_block(years, values, origins, degrees, horizon, include_logistic, p0, bounds):
+    """
+    Fungsi pekerja untuk mengevaluasi sekelompok titik asal (origin) yang berurutan.
+    
+    Matriks normal V^T V dan V^T y untuk derajat tertinggi diperbarui secara bertahap
+    ketika titik asal bergeser, sehingga fitting setiap derajat pada setiap titik asal
+    hanya membutuhkan penyelesaian sistem berukuran (derajat + 1). Fitting logistik
+    dimulai dari parameter titik asal sebelumnya (warm start).
+    
+    Parameter:
+        years: Array tahun yang sudah diskalakan untuk polinomial dan tahun asli untuk logistik,
+               berupa tuple (tahun terskala, tahun asli)
+        values: Array nilai (terurut menurut tahun)
+        origins: Array indeks titik asal yang berurutan; data latih adalah values[:origin]
+        degrees: Derajat polinomial kandidat
+        horizon: Jumlah observasi yang diprediksi setelah setiap titik asal
+        include_logistic: Jika True, model logistik ikut dievaluasi
+        p0: Parameter awal logistik untuk titik asal pertama
+        bounds: Batasan parameter logistik
+    Return:
+        Tuple (dictionary kandidat -> jumlah kuadrat galat, jumlah titik prediksi)
+    """
+    scaled_years, raw_years = years
+    n_terms = max(degrees) + 1
+    V = np.vander(scaled_years, n_terms, increasing=True)
+    
+    sse = {degree: 0.0 for degree in degrees}
+    if include_logistic:
+        sse['logistic'] = 0.0
+    n_points = 0
+    
+    gram = np.zeros((n_terms, n_terms))
+    rhs = np.zeros(n_terms)
+    used = 0
+    params = np.asarray(p0, dtype=float)
+    
+    for origin in origins:
+        # Menambahkan observasi baru sejak titik asal sebelumnya ke persamaan normal
+        new_rows = V[used:origin]
+        gram += new_rows.T @ new_rows
+        rhs += new_rows.T @ values[used:origin]
+        used = origin
+        
+        target = slice(origin, min(origin + horizon, len(values)))
+        actual = values[target]
+        n_points += len(actual)
+        
+        for degree in degrees:
+            coeffs = np.linalg.solve(gram[:degree + 1, :degree + 1], rhs[:degree + 1])
+            forecast = V[target, :degree + 1] @ coeffs
+            sse[degree] += float(((forecast - actual) ** 2).sum())
+        
+        if include_logistic:
+            fit = fit_logistic(raw_years[:origin], values[:origin], params, bounds)
+            if not fit['success']:
+                # Kandidat logistik gugur jika fitting pada salah satu titik asal tidak konvergen
+                logger.warning("Fitting logistik pada titik asal %d tidak konvergen: %s", 
+                               origin, fit['message'])
+                sse['logistic'] = np.inf
+                include_logistic = False
+                continue
+            params = fit['params']
+            forecast = logistic_function(raw_years[target], *params)
+            sse['logistic'] += float(((forecast - actual) ** 2).sum())
+    
+    return sse, n_points
+
+def rolling_origin_backtest(years, values, degrees=DEFAULT_DEGREES, include_logistic=False, min_train=20, 
+                            horizon=10, step=1, p0=DEFAULT_P0, bounds=DEFAULT_BOUNDS, processes=None):
+    """
+    Fungsi untuk memilih model berdasarkan galat prediksi di luar sampel (rolling origin).
+    
+    Untuk setiap titik asal, setiap kandidat di-fit pada data sebelum titik asal dan
+    dinilai dari galat prediksi pada horizon observasi berikutnya. Titik asal dibagi
+    menjadi blok-blok berurutan yang dikerjakan paralel; di dalam blok fitting
+    diperbarui secara bertahap (lihat _backtest_block).
+    
+    Parameter:
+        years: Array tahun
+        values: Array nilai
+        degrees: Derajat polinomial kandidat
+        include_logistic: Jika True, model logistik ikut menjadi kandidat (hanya untuk data
+                          persentase; batasan bawaan membatasi L pada 0-100)
+        min_train: Jumlah observasi minimum sebelum titik asal pertama
+        horizon: Jumlah observasi yang diprediksi setelah setiap titik asal
+        step: Jarak antar titik asal (dalam jumlah observasi)
+        p0: Parameter awal logistik
+        bounds: Batasan parameter logistik
+        processes: Jumlah proses pekerja (opsional, bawaan jumlah CPU)
+    Return:
+        Dictionary berisi tahun titik asal, RMSE setiap kandidat dan kandidat terbaik
+    """
+    years = np.asarray(years, dtype=float).ravel()
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(years, kind='stable')
+    years, values = years[order], values[order]
+    
+    degrees = list(degrees)
+    min_train = max(min_train, max(degrees) + 1)
+    origins = np.arange(min_train, len(values), step)
+    if len(origins) == 0:
+        raise ValueError(f"Data terlalu sedikit untuk backtesting: {len(values)} observasi, "
+                         f"minimal {min_train + 1}")
+    
+    # Skala tahun tetap untuk semua titik asal agar persamaan normal dapat dijumlahkan
+    year_scale = years.std() or 1.0
+    scaled_years = (years - years.mean()) / year_scale
+    
+    workers = min(processes or os.cpu_count() or 1, len(origins))
+    blocks = [block for block in np.array_split(origins, workers) if len(block)]
+    args = [((scaled_years, years), values, block, degrees, horizon, include_logistic, p0, bounds) 
+            for block in blocks]
+    
+    if workers == 1:
+        results = [_backtest_block(*block_args) for block_args in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_backtest_block, *zip(*args)))
+    
+    n_points = sum(count for _, count in results)
+    rmse = {candidate: float(np.sqrt(sum(sse[candidate] for sse, _ in results) / n_points)) 
+            for candidate in results[0][0]}
+    
+    return {
+        'origins': years[origins],
+        'rmse': rmse,
+        'best': min(rmse, key=rmse.get)
+    }
@@ -0,0 +1,352 @@
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+# Ukuran data sintetis: (jumlah deret, jumlah tahun per deret)
+SCALES = {
+    'tiny': (1, 60),          # seukuran file data asli
+    'small': (100, 64),
+    'medium': (2000, 64),
+    'large': (20000, 100),    # 2 juta baris
+    'huge': (100000, 100)     # 10 juta baris
+}
+
+HISTORY_FILE = 'benchmark_history.jsonl'
+FIRST_YEAR = 1960
+
+def generate_synthetic_data(path, n_series, n_years, missing_rate=0.05, seed=0, block_series=1000):
+    """
+    Fungsi untuk membuat file CSV data panel sintetis untuk benchmark.
+    
+    Populasi setiap deret mengikuti pertumbuhan eksponensial yang melambat dan
+    persentase internet mengikuti kurva logistik dengan derau. Sebagian baris
+    dihapus dan sebagian nilai dikosongkan sesuai missing_rate. File ditulis per
+    blok deret sehingga memori tidak bergantung pada ukuran file.
+    
+    Parameter:
+        path: Path file CSV keluaran
+        n_series: Jumlah deret
+        n_years: Jumlah tahun per deret (mulai dari FIRST_YEAR)
+        missing_rate: Proporsi baris yang hilang dan nilai yang kosong
+        seed: Seed generator acak
+        block_series: Jumlah deret yang dibuat per blok
+    Return:
+        Jumlah baris yang ditulis
+    """
+    rng = np.random.default_rng(seed)
+    years = np.arange(FIRST_YEAR, FIRST_YEAR + n_years)
+    t = years - FIRST_YEAR
+    n_rows = 0
+    
+    with open(path, 'w') as f:
+        f.write('Series,Year,Percentage_Internet_User,Population\n')
+        for start in range(0, n_series, block_series):
+            count = min(block_series, n_series - start)
+            
+            base = rng.uniform(1e5, 1e8, (count, 1))
+            growth = rng.uniform(0.005, 0.03, (count, 1))
+            population = base * np.exp(growth * t - 0.0001 * t ** 2)
+            population *= 1 + rng.normal(0, 0.002, population.shape)
+            
+            L = rng.uniform(60, 100, (count, 1))
+            k = rng.uniform(0.15, 0.45, (count, 1))
+            x0 = rng.uniform(2005, 2020, (count, 1))
+            internet = L / (1 + np.exp(-k * (years - x0))) + rng.normal(0, 0.5, (count, n_years))
+            internet = np.clip(internet, 0, 100)
+            
+            population[rng.random(population.shape) < missing_rate / 2] = np.nan
+            internet[rng.random(internet.shape) < missing_rate / 2] = np.nan
+            present = rng.random((count, n_years)) >= missing_rate / 2
+            
+            series_ids, columns = np.nonzero(present)
+            lines = [f'S{start + s},{years[c]},{i:.4f},{p:.0f}' 
+                     for s, c, i, p in zip(series_ids, columns, internet[present], population[present])]
+            f.write('\n'.join(lines).replace('nan', ''))
+            f.write('\n')
+            n_rows += len(lines)
+    
+    return n_rows
+
+def _to_grid(series_ids, years, values, n_series):
+    """
+    Fungsi untuk menyusun nilai per baris menjadi matriks (deret × tahun) dengan NaN untuk data hilang.
+    """
+    first_year = years.min()
+    grid = np.full((n_series, years.max() - first_year + 1), np.nan)
+    grid[series_ids, years - first_year] = values
+    return np.arange(first_year, years.max() + 1), grid
+
+def _stage_peak_rss(function):
+    """
+    Fungsi untuk mengukur puncak RSS sebuah tahap beserta proses pekerjanya.
+    
+    tracemalloc hanya melihat alokasi Python di proses utama, sehingga tahap dengan
+    process pool (atau alokasi di luar Python, misalnya buffer Agg) tampak hampir 0 MiB.
+    Tahap dijalankan di proses anak (fork) sehingga getrusage untuk proses itu dan
+    anak-anaknya hanya mencakup tahap ini.
+    Return:
+        Puncak RSS (byte), maksimum dari proses tahap dan proses pekerjanya
+    """
+    context = multiprocessing.get_context('fork')
+    reader, writer = context.Pipe(duplex=False)
+    
+    def measure():
+        function()
+        writer.send(max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) * 1024)
+    
+    process = context.Process(target=measure)
+    process.start()
+    peak_rss_bytes = reader.recv()
+    process.join()
+    return peak_rss_bytes
+
+def _run_stage(name, function, measure_memory, processes=False):
+    """
+    Fungsi untuk menjalankan satu tahap dan mengukur waktu serta (opsional) puncak memorinya.
+    
+    Waktu diukur tanpa tracemalloc; puncak memori diukur pada eksekusi kedua
+    agar overhead tracemalloc tidak memengaruhi waktu. Untuk tahap dengan process pool
+    (processes=True) puncak RSS termasuk proses pekerja juga diukur (_stage_peak_rss).
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+        
+        peak_bytes = peak_rss_bytes = None
+        if measure_memory:
+            tracemalloc.start()
+            function()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if processes:
+                peak_rss_bytes = _stage_peak_rss(function)
+    
+    print(f"{name:<34} {seconds:10.4f} s" + (f" {peak_bytes / 2 ** 20:10.1f} MiB" if peak_bytes else '')
+          + (f" {peak_rss_bytes / 2 ** 20:10.1f} MiB RSS" if peak_rss_bytes else ''))
+    return result, {'seconds': seconds, 'peak_bytes': peak_bytes, 'peak_rss_bytes': peak_rss_bytes}
+
+def run_benchmark(scale, measure_memory=True, logistic_series=200, plot_series=2, chunksize=1_000_000, 
+                  work_dir=None):
+    """
+    Fungsi untuk menjalankan benchmark seluruh tahap alur analisis pada data sintetis.
+    
+    Parameter:
+        scale: Nama ukuran data (lihat SCALES)
+        measure_memory: Jika True, puncak memori setiap tahap juga diukur
+        logistic_series: Jumlah maksimum deret untuk tahap fitting logistik per deret
+        plot_series: Jumlah deret yang digambar pada tahap visualisasi
+        chunksize: Ukuran chunk untuk tahap load_data streaming
+        work_dir: Direktori untuk file sementara (opsional)
+    Return:
+        Dictionary hasil benchmark (satu record riwayat)
+    """
+    from data_loader import load_data, convert_to_store
+    from population_model import train_population_model, train_population_models_batch
+    from internet_usage_model import train_internet_model, train_internet_models_parallel
+    from estimation import (estimate_missing_values, estimate_missing_values_spline, 
+                            predict_future_values, print_summary)
+    from predictors import LogisticPredictor, population_predictor
+    from visualization import render_charts_parallel
+    
+    n_series, n_years = SCALES[scale]
+    with tempfile.TemporaryDirectory(dir=work_dir) as temp_dir:
+        csv_path = os.path.join(temp_dir, 'synthetic.csv')
+        n_rows = generate_synthetic_data(csv_path, n_series, n_years)
+        print(f"Skala {scale}: {n_series} deret, {n_rows} baris")
+        
+        stages = {}
+        dataset, stages['load_data'] = _run_stage('load_data', lambda: load_data(csv_path), 
+                                                    measure_memory)
+        _, stages['load_data_streaming'] = _run_stage(
+            'load_data (streaming)', lambda: load_data(csv_path, chunksize=chunksize), measure_memory)
+        convert_to_store(csv_path)
+        _, stages['load_data_store'] = _run_stage(
+            'load_data (store)', lambda: load_data(csv_path, use_store=True), measure_memory)
+        
+        series_ids = dataset.series_ids
+        years = dataset.all_years
+        population = dataset.population
+        internet = dataset.internet
+        year_axis, pop_grid = _to_grid(series_ids, years, population, n_series)
+        _, internet_grid = _to_grid(series_ids, years, internet, n_series)
+        
+        first_valid = ~np.isnan(pop_grid[0])
+        pop_model, stages['train_population_model'] = _run_stage(
+            'train_population_model', 
+            lambda: train_population_model(year_axis[first_valid].reshape(-1, 1), 
+                                           pop_grid[0][first_valid]), measure_memory)
+        pop_models, stages['train_population_models_batch'] = _run_stage(
+            'train_population_models_batch', 
+            lambda: train_population_models_batch(year_axis, pop_grid), measure_memory)
+        
+        def train_internet_series():
+            models = []
+            for row in internet_grid[:logistic_series]:
+                valid = ~np.isnan(row)
+                models.append(train_internet_model(year_axis[valid], row[valid]))
+            return models
+        
+        fitted, stages['train_internet_model'] = _run_stage(
+            f'train_internet_model (x{min(logistic_series, n_series)})', train_internet_series, 
+            measure_memory)
+        internet_models = [fitted[i % len(fitted)] for i in range(n_series)]
+        _, stages['train_internet_models_parallel'] = _run_stage(
+            f'train_internet_models_parallel (x{min(logistic_series, n_series)})', 
+            lambda: train_internet_models_parallel(year_axis, internet_grid[:logistic_series]), 
+            measure_memory, processes=True)
+        
+        estimation_results, stages['estimate_missing_values'] = _run_stage(
+            'estimate_missing_values', 
+            lambda: estimate_missing_values(pop_models, internet_models, dataset.missing_index), 
+            measure_memory)
+        _, stages['estimate_missing_values_spline'] = _run_stage(
+            'estimate_missing_values (pchip)', lambda: estimate_missing_values_spline(dataset), 
+            measure_memory)
+        
+        future_years = np.arange(2024, 2101)
+        prediction_results, stages['predict_future_values'] = _run_stage(
+            'predict_future_values', 
+            lambda: predict_future_values(pop_model, internet_models[0], future_years), 
+            measure_memory)
+        
+        # Ringkasan deret pertama seperti pada alur analisis (estimasi dihitung di luar pengukuran)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            first_estimates = estimate_missing_values(
+                pop_model, internet_models[0], dataset.missing_index[dataset.missing_index[:, 0] == 0])
+        _, stages['print_summary'] = _run_stage(
+            'print_summary', 
+            lambda: print_summary(pop_model, internet_models[0], first_estimates, prediction_results), 
+            measure_memory)
+        
+        # Masukan grafik seperti pada alur analisis: hasil estimasi nilai hilang dan
+        # prediksi masing-masing deret (dihitung di luar pengukuran tahap plot)
+        rendered_series = np.arange(min(plot_series, n_series))
+        missing_index = dataset.missing_index
+        series_predictions = {
+            'population': population_predictor(pop_models[:len(rendered_series)])(
+                future_years, rendered_series[:, None]),
+            'internet': LogisticPredictor.from_model_info(internet_models[:len(rendered_series)])(
+                future_years, rendered_series[:, None])
+        }
+        
+        series_list = []
+        for series in rendered_series:
+            pop_valid = ~np.isnan(pop_grid[series])
+            internet_valid = ~np.isnan(internet_grid[series])
+            missing = missing_index[:, 0] == series
+            series_list.append({
+                'name': f'S{series}',
+                'pop_years': year_axis[pop_valid],
+                'pop_values': pop_grid[series][pop_valid],
+                'internet_years': year_axis[internet_valid],
+                'internet_values': internet_grid[series][internet_valid],
+                'pop_model_info': pop_models[series],
+                'internet_model_info': internet_models[series],
+                'missing_years': missing_index[missing, 1],
+                'estimated_population': estimation_results['estimated_population'][missing],
+                'estimated_internet': estimation_results['estimated_internet'][missing],
+                'future_years': future_years,
+                'predicted_population': series_predictions['population'][series],
+                'predicted_internet_percentage': series_predictions['internet'][series],
+                'all_years': year_axis
+            })
+        
+        # Grafik digambar oleh process pool seperti pada perintah plot untuk data panel
+        _, stages['plot'] = _run_stage(f'plot (x{min(plot_series, n_series)})', 
+                                       lambda: render_charts_parallel(series_list, temp_dir), 
+                                       measure_memory, processes=True)
+    
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _git_commit(),
+        'scale': scale,
+        'n_series': n_series,
+        'n_rows': n_rows,
+        'logistic_series': min(logistic_series, n_series),
+        'plot_series': min(plot_series, n_series),
+        'stages': stages
+    }
+
+def _git_commit():
+    try:
+        output = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, 
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        return output.stdout.strip() or None
+    except OSError:
+        return None
+
+def find_regressions(record, history_path=HISTORY_FILE, tolerance=0.25):
+    """
+    Fungsi untuk membandingkan hasil benchmark dengan record sebelumnya pada skala yang sama.
+    Parameter:
+        record: Dictionary hasil run_benchmark
+        history_path: Path file riwayat (JSON lines)
+        tolerance: Kenaikan relatif waktu yang masih diterima (0.25 = 25%)
+    Return:
+        List string deskripsi tahap yang melambat
+    """
+    previous = None
+    if os.path.exists(history_path):
+        with open(history_path) as f:
+            for line in f:
+                entry = json.loads(line)
+                if (entry['scale'] == record['scale'] 
+                        and entry['logistic_series'] == record['logistic_series']
+                        and entry['plot_series'] == record['plot_series']):
+                    previous = entry
+    if previous is None:
+        return []
+    
+    regressions = []
+    for stage, result in record['stages'].items():
+        before = previous['stages'].get(stage)
+        if before and result['seconds'] > before['seconds'] * (1 + tolerance):
+            regressions.append(f"{stage}: {before['seconds']:.4f} s -> {result['seconds']:.4f} s "
+                               f"(commit {previous.get('commit')})")
+    return regressions
+
+def append_history(record, history_path=HISTORY_FILE):
+    """
+    Fungsi untuk menambahkan hasil benchmark ke file riwayat (satu baris JSON per run).
+    """
+    with open(history_path, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark seluruh tahap alur analisis')
+    parser.add_argument('--scale', choices=list(SCALES), action='append', 
+                        help='Ukuran data (dapat diulang, bawaan tiny dan small)')
+    parser.add_argument('--no-memory', action='store_true', help='Tidak mengukur puncak memori')
+    parser.add_argument('--logistic-series', type=int, default=200)
+    parser.add_argument('--plot-series', type=int, default=2)
+    parser.add_argument('--history', default=HISTORY_FILE)
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args(argv)
+    
+    regressed = False
+    for scale in args.scale or ['tiny', 'small']:
+        record = run_benchmark(scale, measure_memory=not args.no_memory, 
+                               logistic_series=args.logistic_series, plot_series=args.plot_series)
+        regressions = find_regressions(record, args.history, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESI {regression}")
+        regressed = regressed or bool(regressions)
+        append_history(record, args.history)
+    
+    if regressed and args.fail_on_regression:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
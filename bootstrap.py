@@ -0,0 +1,119 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from population_model import search_polynomial_degree
+from internet_usage_model import fit_logistic, logistic_function, DEFAULT_BOUNDS
+from predictors import PolynomialPredictor, LogisticPredictor
+
+logger = logging.getLogger(__name__)
+
+def _resample_residuals(years, values, fitted, n_boot, rng):
+    """
+    Fungsi untuk membuat sampel bootstrap dengan menambahkan residual yang diambil ulang ke nilai fitting.
+    Return:
+        Matriks sampel berukuran (n_boot × jumlah tahun)
+    """
+    residuals = values - fitted
+    return fitted + residuals[rng.integers(0, len(residuals), size=(n_boot, len(residuals)))]
+
+def _fit_logistic_chunk(years, samples, p0, bounds):
+    """
+    Fungsi pekerja untuk melakukan fitting logistik pada sekelompok sampel bootstrap.
+    Setiap fitting dimulai dari parameter model asli (warm start).
+    Return:
+        Array parameter berukuran (jumlah sampel × 3); baris sampel yang fittingnya
+        tidak konvergen bernilai NaN
+    """
+    params = np.full((len(samples), 3), np.nan)
+    for i, sample in enumerate(samples):
+        fit = fit_logistic(years, sample, p0, bounds)
+        if fit['success']:
+            params[i] = fit['params']
+    return params
+
+def bootstrap_intervals(pop_years, pop_values, internet_years, internet_values, pop_model_info, 
+                        internet_model_info, target_years, n_boot=1000, confidence=0.95, 
+                        bounds=DEFAULT_BOUNDS, processes=None, seed=0):
+    """
+    Fungsi untuk menghitung interval kepercayaan bootstrap untuk estimasi dan prediksi.
+    
+    Residual setiap model diambil ulang (residual bootstrap) lalu model di-fit ulang
+    sebanyak n_boot kali. Semua fitting polinomial diselesaikan sekaligus dengan
+    search_polynomial_degree pada derajat model asli, sedangkan fitting logistik
+    dibagi ke beberapa proses dan dimulai dari parameter model asli.
+    
+    Parameter:
+        pop_years: Array tahun untuk data populasi
+        pop_values: Array nilai populasi
+        internet_years: Array tahun untuk data internet
+        internet_values: Array nilai persentase pengguna internet
+        pop_model_info: Dictionary hasil train_population_model
+        internet_model_info: Dictionary hasil train_internet_model
+        target_years: Array tahun yang diestimasi atau diprediksi
+        n_boot: Jumlah sampel bootstrap
+        confidence: Tingkat kepercayaan interval (misalnya 0.95)
+        bounds: Batasan parameter logistik
+        processes: Jumlah proses untuk fitting logistik (opsional, bawaan jumlah CPU)
+        seed: Seed generator acak
+    Return:
+        Dictionary berisi tahun serta batas bawah dan atas untuk populasi,
+        persentase internet dan jumlah pengguna internet
+    """
+    rng = np.random.default_rng(seed)
+    pop_years = np.asarray(pop_years, dtype=float).ravel()
+    pop_values = np.asarray(pop_values, dtype=float)
+    internet_years = np.asarray(internet_years, dtype=float)
+    internet_values = np.asarray(internet_values, dtype=float)
+    target_years = np.asarray(target_years, dtype=float).ravel()
+    
+    # Populasi: semua sampel di-fit dalam satu dekomposisi QR
+    if pop_model_info.get('family', 'polynomial') != 'polynomial':
+        raise ValueError("Interval bootstrap hanya mendukung model populasi polinomial")
+    degree = pop_model_info['degree']
+    pop_fitted = PolynomialPredictor.from_model_info(pop_model_info)(pop_years)
+    pop_samples = _resample_residuals(pop_years, pop_values, pop_fitted, n_boot, rng)
+    search = search_polynomial_degree(pop_years, pop_samples, [degree])
+    pop_boot = PolynomialPredictor(search['fits'][degree]['scaled_coeffs'], search['year_center'], 
+                                   search['year_scale'])
+    pop_curves = pop_boot(target_years[None, :], np.arange(n_boot)[:, None])
+    
+    # Internet: fitting logistik dibagi ke beberapa proses
+    internet_predictor = LogisticPredictor.from_model_info(internet_model_info)
+    internet_fitted = internet_predictor(internet_years)
+    internet_samples = _resample_residuals(internet_years, internet_values, internet_fitted, n_boot, rng)
+    p0 = [internet_model_info['L'], internet_model_info['k'], internet_model_info['x0']]
+    
+    workers = processes or os.cpu_count() or 1
+    chunks = np.array_split(internet_samples, min(n_boot, 4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        params = np.vstack(list(executor.map(_fit_logistic_chunk, [internet_years] * len(chunks), 
+                                             chunks, [p0] * len(chunks), [bounds] * len(chunks))))
+    
+    # Sampel yang fitting logistiknya tidak konvergen tidak diikutkan dalam interval
+    converged = ~np.isnan(params[:, 0])
+    if not converged.any():
+        raise RuntimeError("Tidak ada fitting logistik bootstrap yang konvergen")
+    if not converged.all():
+        logger.warning("%d dari %d fitting logistik bootstrap tidak konvergen dan dilewati", 
+                       n_boot - converged.sum(), n_boot)
+    params = params[converged]
+    internet_curves = logistic_function(target_years, params[:, [0]], params[:, [1]], params[:, [2]])
+    
+    users_curves = internet_curves / 100 * pop_curves[converged]
+    
+    alpha = (1 - confidence) / 2
+    percentiles = [100 * alpha, 100 * (1 - alpha)]
+    pop_lower, pop_upper = np.percentile(pop_curves, percentiles, axis=0)
+    internet_lower, internet_upper = np.percentile(internet_curves, percentiles, axis=0)
+    users_lower, users_upper = np.percentile(users_curves, percentiles, axis=0)
+    
+    return {
+        'years': target_years,
+        'population_lower': pop_lower,
+        'population_upper': pop_upper,
+        'internet_lower': internet_lower,
+        'internet_upper': internet_upper,
+        'users_lower': users_lower,
+        'users_upper': users_upper
+    }
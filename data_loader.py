@@ -1,59 +1,285 @@
+import io
+import logging
 import pandas as pd
 import numpy as np
+from data_store import default_store_path, open_store, write_store
+from dataset import Dataset, compact_years
+from instrumentation import instrumented, record_metrics
 
-def load_data(file_path):
+logger = logging.getLogger(__name__)
+
+# Tipe data eksplisit untuk setiap kolom agar pandas tidak perlu menebak tipe
+COLUMN_DTYPES = {
+    'Year': 'int64',
+    'Percentage_Internet_User': 'float64',
+    'Population': 'float64'
+}
+
+# Kolom opsional berisi nama deret (misalnya wilayah) untuk data panel
+SERIES_COLUMN = 'Series'
+
+# Kunci array kode deret per baris dan daftar nama deret pada dictionary kolom
+SERIES_IDS = 'series_ids'
+SERIES_LABELS = 'series_labels'
+
+def _is_used_column(column):
+    return column in COLUMN_DTYPES or column == SERIES_COLUMN
+
+def _read_dtypes():
+    return {**COLUMN_DTYPES, SERIES_COLUMN: 'str'}
+
+def _frame_columns(data):
+    """
+    Fungsi untuk mengambil array kolom yang digunakan dari sebuah DataFrame.
+    """
+    columns = {name: data[name].values for name in COLUMN_DTYPES}
+    if SERIES_COLUMN in data:
+        codes, labels = pd.factorize(data[SERIES_COLUMN], sort=True)
+        columns[SERIES_IDS] = codes.astype(np.min_scalar_type(max(len(labels) - 1, 0)))
+        columns[SERIES_LABELS] = np.asarray(labels, dtype=str)
+    return columns
+
+def _print_diagnostics(data, diagnostics):
+    """
+    Fungsi untuk menampilkan informasi data sesuai tingkat diagnostik.
+    Parameter:
+        data: DataFrame data lengkap
+        diagnostics: 0 = tidak ada, 1 = nilai yang hilang, 2 = lengkap (head, info, describe)
+    """
+    # Ringkasan data hanya dihitung jika log level INFO aktif
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    if diagnostics >= 2:
+        # Menampilkan informasi data
+        info = io.StringIO()
+        data.info(buf=info)
+        logger.info("Data head:\n%s", data.head())
+        logger.info("\nInformasi data:\n%s", info.getvalue().rstrip())
+        logger.info("\nDeskripsi statistik data:\n%s", data.describe())
+    
+    if diagnostics >= 1:
+        # Memeriksa nilai yang hilang
+        logger.info("\nNilai yang hilang:\n%s", data.isnull().sum())
+        logger.info("Tahun dengan nilai yang hilang:\n%s", data[data.isnull().any(axis=1)]['Year'])
+
+def _count_rows(file_path, block_size=1 << 20):
+    """
+    Fungsi untuk menghitung batas atas jumlah baris data file CSV tanpa mem-parsing isinya.
+    Parameter:
+        file_path: Path ke file CSV
+        block_size: Ukuran blok baca dalam byte (opsional)
+    Return:
+        Jumlah karakter baris baru (paling sedikit sama dengan jumlah baris data)
+    """
+    count = 0
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            count += block.count(b'\n')
+    return count
+
+def _series_codes(codes, labels):
+    """
+    Fungsi untuk mengurutkan nama deret dan memetakan ulang kode integer setiap baris.
+    
+    Hanya daftar nama (kecil) yang diurutkan; kode baris dipetakan dengan satu indeks
+    tabel tanpa membentuk array teks per baris.
+    Parameter:
+        codes: Array kode deret untuk setiap baris (indeks ke labels)
+        labels: Daftar nama deret sesuai urutan kode
+    Return:
+        Tuple (id deret per baris dengan tipe integer terkecil, array nama deret terurut)
+    """
+    labels = np.array(labels, dtype=str)
+    order = np.argsort(labels, kind='stable')
+    rank = np.empty(len(labels), dtype=np.min_scalar_type(max(len(labels) - 1, 0)))
+    rank[order] = np.arange(len(labels))
+    return rank[codes], labels[order]
+
+def _read_chunks(file_path, chunksize):
+    """
+    Fungsi untuk membaca file CSV per bagian (chunk) langsung ke array kolom yang
+    sudah dialokasikan.
+    
+    Jumlah baris dihitung lebih dulu sehingga setiap kolom dialokasikan sekali; hanya
+    satu chunk DataFrame yang berada di memori pada satu waktu. Nama deret disimpan
+    sebagai kode integer dan dikembalikan bersama daftar namanya (SERIES_IDS dan
+    SERIES_LABELS), tanpa array teks per baris.
+    Parameter:
+        file_path: Path ke file CSV
+        chunksize: Jumlah baris per chunk
+    Return:
+        Dictionary nama kolom -> array nilai
+    """
+    capacity = _count_rows(file_path)
+    columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+    series_codes = None
+    series_labels = {}
+    n_rows = 0
+    
+    reader = pd.read_csv(file_path, usecols=_is_used_column, dtype=_read_dtypes(), 
+                         chunksize=chunksize)
+    for chunk in reader:
+        stop = n_rows + len(chunk)
+        for name in COLUMN_DTYPES:
+            columns[name][n_rows:stop] = chunk[name].values
+        
+        if SERIES_COLUMN in chunk:
+            if series_codes is None:
+                series_codes = np.empty(capacity, dtype=np.int32)
+            codes, labels = pd.factorize(chunk[SERIES_COLUMN])
+            label_ids = np.array([series_labels.setdefault(label, len(series_labels)) 
+                                  for label in labels], dtype=np.int32)
+            series_codes[n_rows:stop] = label_ids[codes]
+        n_rows = stop
+    
+    columns = {name: values[:n_rows] for name, values in columns.items()}
+    if series_codes is not None:
+        columns[SERIES_IDS], columns[SERIES_LABELS] = _series_codes(series_codes[:n_rows], 
+                                                                    list(series_labels))
+    return columns
+
+def _columns_frame(columns):
+    """
+    Fungsi untuk menyusun DataFrame dari array kolom tanpa menyalin nilainya.
+    Digunakan agar diagnostik data dari penyimpanan biner sama dengan pembacaan CSV.
+    Parameter:
+        columns: Dictionary nama kolom -> array nilai
+    Return:
+        DataFrame dengan tipe kolom sesuai COLUMN_DTYPES
+    """
+    frame = pd.DataFrame({name: np.asarray(columns[name]) for name in COLUMN_DTYPES}, copy=False)
+    
+    # Kolom nama deret diletakkan pertama seperti pada file CSV panel
+    if SERIES_IDS in columns:
+        frame.insert(0, SERIES_COLUMN, columns[SERIES_LABELS][columns[SERIES_IDS]])
+    return frame.astype({name: dtype for name, dtype in _read_dtypes().items() if name in frame})
+
+def convert_to_store(file_path, store_path=None, chunksize=None):
+    """
+    Fungsi untuk mengonversi file CSV menjadi penyimpanan biner kolumnar.
+    
+    Kolom Year, Population dan Percentage_Internet_User beserta mask validitasnya
+    ditulis sebagai file .npy sehingga run berikutnya dapat membukanya secara
+    memory-mapped tanpa mem-parsing teks CSV. Kolom Series (jika ada) disimpan sebagai
+    kode deret per baris dan daftar nama deret sehingga tidak perlu diurutkan ulang.
+    Parameter:
+        file_path: Path ke file CSV
+        store_path: Direktori penyimpanan (opsional, bawaan dari default_store_path)
+        chunksize: Jika diisi, CSV dibaca bertahap dengan jumlah baris ini per chunk (opsional)
+    Return:
+        Path direktori penyimpanan
+    """
+    if store_path is None:
+        store_path = default_store_path(file_path)
+    
+    if chunksize is None:
+        data = pd.read_csv(file_path, usecols=_is_used_column, dtype=_read_dtypes())
+        columns = _frame_columns(data)
+    else:
+        columns = _read_chunks(file_path, chunksize)
+    
+    # Tahun disimpan sebagai int16 agar dapat dibuka tanpa konversi oleh Dataset
+    columns['Year'] = compact_years(columns['Year'])
+    write_store(store_path, columns, file_path)
+    return store_path
+
+def detect_missing_values(series_ids, years, valid, n_series):
+    """
+    Fungsi untuk mendeteksi tahun dengan nilai yang hilang pada semua deret sekaligus.
+    
+    Baris data dipetakan ke grid (deret × tahun). Sebuah sel dianggap hilang jika
+    barisnya tidak ada atau nilainya kosong, dan berada di antara tahun pertama
+    dan terakhir yang tersedia untuk deret tersebut.
+    
+    Parameter:
+        series_ids: Array id deret (0 .. n_series - 1) untuk setiap baris
+        years: Array tahun untuk setiap baris
+        valid: Array boolean, True jika semua nilai pada baris tersedia
+        n_series: Jumlah deret
+    Return:
+        Array berukuran (jumlah nilai hilang × 2) berisi pasangan [id deret, tahun]
+    """
+    if len(years) == 0:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    first_year = years.min()
+    observed = np.zeros((n_series, years.max() - first_year + 1), dtype=bool)
+    observed[series_ids, years - first_year] = valid
+    
+    # Hanya celah di antara data pertama dan terakhir setiap deret
+    seen_before = np.logical_or.accumulate(observed, axis=1)
+    seen_after = np.logical_or.accumulate(observed[:, ::-1], axis=1)[:, ::-1]
+    gap_series, gap_columns = np.nonzero(~observed & seen_before & seen_after)
+    
+    return np.column_stack((gap_series, gap_columns + first_year)).astype(np.int32)
+
+@instrumented('load_data')
+def load_data(file_path, chunksize=None, diagnostics=0, use_store=False, store_path=None, 
+              value_dtype=np.float64):
     """
     Fungsi untuk memuat dan memproses data.
     Parameter:
         file_path: Path ke file CSV
+        chunksize: Jika diisi, file dibaca bertahap dengan jumlah baris ini per chunk
+                   dan DataFrame lengkap tidak disimpan (opsional)
+        diagnostics: Tingkat informasi yang ditampilkan, 0 = tidak ada,
+                     1 = nilai yang hilang, 2 = lengkap (opsional)
+        use_store: Jika True, data dibuka secara memory-mapped dari penyimpanan biner;
+                   CSV hanya di-parsing ulang jika hash file sumber berubah (opsional)
+        store_path: Direktori penyimpanan biner (opsional, bawaan dari default_store_path)
+        value_dtype: Tipe data nilai populasi dan internet; np.float32 menghemat
+                     separuh memori dengan presisi lebih rendah (opsional)
     Return:
-        Dictionary berisi data yang sudah diproses
-    """
-    # Memuat data dari file CSV
-    data = pd.read_csv(file_path)
-    
-    # Menampilkan informasi data
-    print("Data head:")
-    print(data.head())
-    print("\nInformasi data:")
-    print(data.info())
-    print("\nDeskripsi statistik data:")
-    print(data.describe())
-    
-    # Memeriksa nilai yang hilang
-    print("\nNilai yang hilang:")
-    print(data.isnull().sum())
-    print("Tahun dengan nilai yang hilang:")
-    print(data[data.isnull().any(axis=1)]['Year'])
-    
-    # Mempersiapkan dataset untuk analisis
-    # Dataset populasi: menghilangkan baris dengan nilai populasi yang hilang
-    pop_data = data.dropna(subset=['Population'])
-    pop_years = pop_data['Year'].values.reshape(-1, 1)
-    pop_values = pop_data['Population'].values
-    
-    # Dataset internet: menghilangkan baris dengan nilai persentase internet yang hilang
-    internet_data = data.dropna(subset=['Percentage_Internet_User'])
-    internet_years = internet_data['Year'].values
-    internet_values = internet_data['Percentage_Internet_User'].values
-    
-    # Tahun-tahun dengan nilai yang hilang
-    missing_years = np.array([2005, 2006, 2015, 2016]).reshape(-1, 1)
-    missing_years_array = np.array([2005, 2006, 2015, 2016])
-    all_years = data['Year'].values
-    all_years_reshape = all_years.reshape(-1, 1)
-    
-    # Mengembalikan dictionary berisi semua data yang telah diproses
-    return {
-        'data': data,
-        'pop_data': pop_data,
-        'pop_years': pop_years,
-        'pop_values': pop_values,
-        'internet_data': internet_data,
-        'internet_years': internet_years,
-        'internet_values': internet_values,
-        'missing_years': missing_years,
-        'missing_years_array': missing_years_array,
-        'all_years': all_years,
-        'all_years_reshape': all_years_reshape
-    }
\ No newline at end of file
+        Dataset berisi data yang sudah diproses
+    """
+    data = None
+    if use_store:
+        if store_path is None:
+            store_path = default_store_path(file_path)
+        
+        # Membuat ulang penyimpanan hanya jika belum ada atau file sumber berubah
+        store = open_store(store_path, file_path)
+        if store is None:
+            convert_to_store(file_path, store_path, chunksize)
+            store = open_store(store_path, file_path)
+        columns, valid = store
+        
+        pop_valid = valid['Population']
+        internet_valid = valid['Percentage_Internet_User']
+        if diagnostics and logger.isEnabledFor(logging.INFO):
+            logger.info("Data dimuat dari penyimpanan biner: %d baris", len(columns['Year']))
+            _print_diagnostics(_columns_frame(columns), diagnostics)
+    else:
+        if chunksize is None:
+            # Memuat data dari file CSV
+            data = pd.read_csv(file_path, dtype=_read_dtypes())
+            _print_diagnostics(data, diagnostics)
+            columns = _frame_columns(data)
+        else:
+            # Mode streaming: hanya array kolom yang disusun, tanpa DataFrame lengkap
+            columns = _read_chunks(file_path, chunksize)
+            if diagnostics and logger.isEnabledFor(logging.INFO):
+                _print_diagnostics(_columns_frame(columns), diagnostics)
+        
+        pop_valid = ~np.isnan(columns['Population'])
+        internet_valid = ~np.isnan(columns['Percentage_Internet_User'])
+    
+    years = compact_years(columns['Year'])
+    
+    # Id deret untuk setiap baris; tanpa kolom Series semua baris adalah satu deret
+    if SERIES_IDS in columns:
+        series_labels, series_ids = columns[SERIES_LABELS], columns[SERIES_IDS]
+    else:
+        series_labels = np.array([''])
+        series_ids = np.zeros(len(years), dtype=np.uint8)
+    
+    # Tahun-tahun dengan nilai yang hilang, dideteksi dari mask validitas data
+    missing_index = detect_missing_values(series_ids, years, pop_valid & internet_valid, 
+                                          len(series_labels))
+    record_metrics(rows=len(years), series=len(series_labels), missing=len(missing_index))
+    
+    # Setiap kolom disimpan sekali; dataset per model berupa view dari kolom-kolom ini
+    return Dataset(years, columns['Population'], columns['Percentage_Internet_User'], 
+                   pop_valid, internet_valid, series_ids, series_labels, missing_index, 
+                   data=data, value_dtype=value_dtype)
\ No newline at end of file
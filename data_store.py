@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import numpy as np
+
+META_FILE = 'meta.json'
+
+# Dinaikkan jika susunan kolom yang ditulis berubah sehingga penyimpanan lama dibuat ulang
+STORE_VERSION = 2
+
+def file_hash(file_path, block_size=1 << 20):
+    """
+    Fungsi untuk menghitung hash SHA-256 dari isi sebuah file secara bertahap.
+    Parameter:
+        file_path: Path ke file
+        block_size: Ukuran blok yang dibaca per langkah (byte)
+    Return:
+        String heksadesimal hash file
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def source_identity(source_path):
+    """
+    Fungsi untuk mencatat identitas file sumber (hash isi, ukuran dan waktu modifikasi).
+    Parameter:
+        source_path: Path file sumber
+    Return:
+        Dictionary berisi source_hash, source_size dan source_mtime_ns
+    """
+    stat = os.stat(source_path)
+    return {
+        'source_hash': file_hash(source_path),
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns
+    }
+
+def source_unchanged(identity, source_path):
+    """
+    Fungsi untuk memeriksa apakah file sumber masih sama dengan identitas yang dicatat.
+    
+    Jika ukuran dan waktu modifikasi tidak berubah, hash tidak dihitung ulang.
+    Parameter:
+        identity: Dictionary hasil source_identity
+        source_path: Path file sumber
+    Return:
+        True jika isi file sumber tidak berubah
+    """
+    stat = os.stat(source_path)
+    if stat.st_size == identity['source_size'] and stat.st_mtime_ns == identity['source_mtime_ns']:
+        return True
+    return file_hash(source_path) == identity['source_hash']
+
+def default_store_path(file_path):
+    """
+    Fungsi untuk menentukan lokasi penyimpanan biner bawaan untuk sebuah file CSV.
+    Parameter:
+        file_path: Path ke file CSV sumber
+    Return:
+        Path direktori penyimpanan (nama file CSV dengan akhiran .store)
+    """
+    return os.path.splitext(file_path)[0] + '.store'
+
+def write_store(store_path, columns, source_path):
+    """
+    Fungsi untuk menulis kolom-kolom data ke penyimpanan biner kolumnar.
+    
+    Setiap kolom disimpan sebagai file .npy tersendiri beserta mask validitasnya
+    (True jika nilainya tidak hilang). File meta.json ditulis paling akhir dan
+    mencatat hash file sumber sehingga penyimpanan yang belum lengkap tidak terbaca.
+    
+    Parameter:
+        store_path: Direktori penyimpanan
+        columns: Dictionary nama kolom -> array nilai
+        source_path: Path file CSV sumber
+    """
+    os.makedirs(store_path, exist_ok=True)
+    meta_path = os.path.join(store_path, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    
+    for name, values in columns.items():
+        values = np.ascontiguousarray(values)
+        if values.dtype == object:
+            values = values.astype(str)
+        np.save(os.path.join(store_path, f'{name}.npy'), values)
+        if values.dtype.kind == 'f':
+            valid = ~np.isnan(values)
+        else:
+            valid = np.ones(values.shape, dtype=bool)
+        np.save(os.path.join(store_path, f'{name}_valid.npy'), valid)
+    
+    meta = {
+        'version': STORE_VERSION,
+        **source_identity(source_path),
+        'columns': list(columns)
+    }
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+
+def _is_fresh(store_path, meta, source_path):
+    """
+    Fungsi untuk memeriksa apakah penyimpanan masih sesuai dengan file sumber.
+    
+    Jika ukuran dan waktu modifikasi file sumber tidak berubah, hash tidak dihitung ulang.
+    Jika berubah, hash isi file dibandingkan dan meta.json diperbarui bila isinya sama.
+    """
+    stat = os.stat(source_path)
+    if stat.st_size == meta['source_size'] and stat.st_mtime_ns == meta['source_mtime_ns']:
+        return True
+    if not source_unchanged(meta, source_path):
+        return False
+    
+    meta['source_size'] = stat.st_size
+    meta['source_mtime_ns'] = stat.st_mtime_ns
+    with open(os.path.join(store_path, META_FILE), 'w') as f:
+        json.dump(meta, f)
+    return True
+
+def open_store(store_path, source_path):
+    """
+    Fungsi untuk membuka penyimpanan biner secara memory-mapped (tanpa menyalin data).
+    Parameter:
+        store_path: Direktori penyimpanan
+        source_path: Path file CSV sumber yang digunakan untuk memeriksa kesesuaian
+    Return:
+        Tuple (kolom, mask validitas) berupa dictionary array memory-mapped (hanya baca),
+        atau None jika penyimpanan belum ada atau file sumber telah berubah
+    """
+    meta_path = os.path.join(store_path, META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta.get('version') != STORE_VERSION or not _is_fresh(store_path, meta, source_path):
+        return None
+    
+    columns = {}
+    valid = {}
+    for name in meta['columns']:
+        columns[name] = np.load(os.path.join(store_path, f'{name}.npy'), mmap_mode='r')
+        valid[name] = np.load(os.path.join(store_path, f'{name}_valid.npy'), mmap_mode='r')
+    return columns, valid
@@ -0,0 +1,168 @@
+import numpy as np
+
+# Tipe data ringkas untuk kolom tahun
+YEAR_DTYPE = np.int16
+
+def compact_years(years):
+    """
+    Fungsi untuk mengubah array tahun ke tipe data ringkas (int16).
+    Parameter:
+        years: Array tahun
+    Return:
+        Array tahun bertipe YEAR_DTYPE (tanpa salinan jika tipenya sudah sesuai)
+    """
+    years = np.asarray(years)
+    if years.dtype == YEAR_DTYPE:
+        return years
+    
+    limits = np.iinfo(YEAR_DTYPE)
+    if len(years) and (years.min() < limits.min or years.max() > limits.max):
+        raise ValueError(f"Tahun di luar rentang {YEAR_DTYPE.__name__}: "
+                         f"{years.min()} .. {years.max()}")
+    return years.astype(YEAR_DTYPE)
+
+class Dataset:
+    """
+    Dataset kolumnar hasil load_data.
+    
+    Setiap kolom disimpan sekali dengan tipe data ringkas (tahun int16, nilai float64
+    atau float32, id deret dengan tipe integer terkecil) beserta mask validitasnya.
+    Atribut lama seperti pop_years, internet_values atau missing_years tersedia sebagai
+    properti; jika tidak ada nilai yang hilang, properti tersebut berupa view tanpa salinan.
+    Jika ada, array terfilter dibuat sekali saat pertama diakses lalu disimpan.
+    Akses dengan kunci (dataset['pop_years']) juga didukung untuk kode lama.
+    """
+    __slots__ = ('years', 'population', 'internet', 'pop_valid', 'internet_valid',
+                 'series_ids', 'series_labels', 'missing_index', 'data',
+                 '_pop_all_valid', '_internet_all_valid', '_pop_years', '_pop_values',
+                 '_internet_years', '_internet_values')
+    
+    # Kunci dictionary yang dikembalikan load_data versi lama
+    KEYS = ('data', 'pop_data', 'pop_years', 'pop_values', 'internet_data', 'internet_years',
+            'internet_values', 'series_labels', 'series_ids', 'missing_index', 'missing_years',
+            'missing_years_array', 'all_years', 'all_years_reshape')
+    
+    def __init__(self, years, population, internet, pop_valid, internet_valid, series_ids,
+                 series_labels, missing_index, data=None, value_dtype=np.float64):
+        """
+        Parameter:
+            years: Array tahun untuk setiap baris
+            population: Array nilai populasi
+            internet: Array persentase pengguna internet
+            pop_valid: Mask boolean, True jika nilai populasi tersedia
+            internet_valid: Mask boolean, True jika persentase internet tersedia
+            series_ids: Array id deret untuk setiap baris
+            series_labels: Array nama deret (indeks sesuai id deret)
+            missing_index: Array (jumlah nilai hilang × 2) berisi pasangan [id deret, tahun]
+            data: DataFrame lengkap jika data dibaca sekaligus (opsional)
+            value_dtype: Tipe data nilai, np.float64 atau np.float32 (opsional)
+        """
+        self.years = compact_years(years)
+        self.population = np.asarray(population).astype(value_dtype, copy=False)
+        self.internet = np.asarray(internet).astype(value_dtype, copy=False)
+        self.pop_valid = np.asarray(pop_valid, dtype=bool)
+        self.internet_valid = np.asarray(internet_valid, dtype=bool)
+        self.series_labels = np.asarray(series_labels)
+        self.series_ids = np.asarray(series_ids).astype(
+            np.min_scalar_type(max(len(self.series_labels) - 1, 0)), copy=False)
+        self.missing_index = missing_index
+        self.data = data
+        
+        # Tanpa nilai yang hilang, dataset per model cukup berupa view dari kolom asli
+        self._pop_all_valid = bool(self.pop_valid.all())
+        self._internet_all_valid = bool(self.internet_valid.all())
+        self._pop_years = self._pop_values = None
+        self._internet_years = self._internet_values = None
+    
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __len__(self):
+        return len(self.years)
+    
+    def _select(self, slot, values, mask, all_valid):
+        """
+        Fungsi untuk mengambil nilai yang tersedia; hasil filter disimpan pada slot
+        sehingga mask hanya diterapkan sekali.
+        """
+        selected = getattr(self, slot)
+        if selected is None:
+            selected = values if all_valid else values[mask]
+            setattr(self, slot, selected)
+        return selected
+    
+    @property
+    def pop_years(self):
+        """Tahun dengan nilai populasi tersedia, berukuran (n × 1)."""
+        return self._select('_pop_years', self.years, self.pop_valid, 
+                            self._pop_all_valid).reshape(-1, 1)
+    
+    @property
+    def pop_values(self):
+        """Nilai populasi yang tersedia."""
+        return self._select('_pop_values', self.population, self.pop_valid, self._pop_all_valid)
+    
+    @property
+    def internet_years(self):
+        """Tahun dengan persentase internet tersedia."""
+        return self._select('_internet_years', self.years, self.internet_valid, 
+                            self._internet_all_valid)
+    
+    @property
+    def internet_values(self):
+        """Persentase pengguna internet yang tersedia."""
+        return self._select('_internet_values', self.internet, self.internet_valid, 
+                            self._internet_all_valid)
+    
+    @property
+    def missing_years_array(self):
+        """Tahun dengan nilai yang hilang (view dari missing_index)."""
+        return self.missing_index[:, 1]
+    
+    @property
+    def missing_years(self):
+        """Tahun dengan nilai yang hilang, berukuran (n × 1)."""
+        return self.missing_years_array.reshape(-1, 1)
+    
+    @property
+    def all_years(self):
+        """Semua tahun pada data."""
+        return self.years
+    
+    @property
+    def all_years_reshape(self):
+        """Semua tahun pada data, berukuran (n × 1)."""
+        return self.years.reshape(-1, 1)
+    
+    @property
+    def pop_data(self):
+        """DataFrame tanpa baris dengan populasi hilang (hanya jika data dibaca sekaligus)."""
+        return self.data.dropna(subset=['Population']) if self.data is not None else None
+    
+    @property
+    def internet_data(self):
+        """DataFrame tanpa baris dengan persentase internet hilang (hanya jika data dibaca sekaligus)."""
+        return self.data.dropna(subset=['Percentage_Internet_User']) if self.data is not None else None
+    
+    def to_grid(self, values):
+        """
+        Fungsi untuk menyusun nilai per baris menjadi matriks (deret × tahun).
+        Parameter:
+            values: Array nilai per baris (misalnya population atau internet)
+        Return:
+            Tuple (array tahun untuk kolom matriks, matriks nilai dengan NaN untuk data hilang)
+        """
+        first_year = int(self.years.min())
+        last_year = int(self.years.max())
+        grid = np.full((len(self.series_labels), last_year - first_year + 1), np.nan)
+        grid[self.series_ids, self.years - first_year] = values
+        return np.arange(first_year, last_year + 1), grid
+    
+    @property
+    def nbytes(self):
+        """Jumlah byte yang digunakan oleh kolom-kolom array."""
+        return sum(getattr(self, name).nbytes for name in
+                   ('years', 'population', 'internet', 'pop_valid', 'internet_valid',
+                    'series_ids', 'missing_index'))
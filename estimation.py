@@ -1,39 +1,87 @@
 import pandas as pd
 import numpy as np
+from predictors import LogisticPredictor, FAMILY_LABELS, population_predictor
+from instrumentation import instrumented, metrics_enabled, record_metrics
 
-def estimate_missing_values(pop_model_info, internet_model_info, missing_years, missing_years_array):
+def _interval_columns(intervals, names):
+    """
+    Fungsi untuk menyusun kolom batas bawah/atas dari hasil bootstrap_intervals.
+    Parameter:
+        intervals: Dictionary hasil bootstrap_intervals, atau None
+        names: Dictionary awalan kunci interval -> awalan nama kolom
+    Return:
+        Dictionary nama kolom -> array batas
+    """
+    if intervals is None:
+        return {}
+    columns = {}
+    for key, column in names.items():
+        columns[f'{column}_Lower'] = intervals[f'{key}_lower']
+        columns[f'{column}_Upper'] = intervals[f'{key}_upper']
+    return columns
+
+def _monte_carlo_columns(monte_carlo):
+    """
+    Fungsi untuk menyusun kolom rata-rata dan kuantil dari hasil simulate_internet_users.
+    Parameter:
+        monte_carlo: Dictionary hasil simulate_internet_users, atau None
+    Return:
+        Dictionary nama kolom -> array nilai
+    """
+    if monte_carlo is None:
+        return {}
+    results_df = monte_carlo['results_df']
+    return {column: results_df[column].to_numpy() for column in results_df.columns 
+            if column.startswith('Users_')}
+
+@instrumented('estimate_missing_values')
+def estimate_missing_values(pop_model_info, internet_model_info, missing_index, intervals=None):
     """
     Fungsi untuk mengestimasi nilai yang hilang untuk populasi dan penggunaan internet.
     
     Menggunakan model polinomial untuk mengestimasi populasi dan model logistik untuk
-    mengestimasi persentase pengguna internet.
+    mengestimasi persentase pengguna internet. Semua nilai yang hilang dari semua deret
+    dievaluasi dalam satu perhitungan tervektorisasi per jenis model.
     
     Parameter:
-        pop_model_info: Dictionary berisi informasi model populasi
-        internet_model_info: Dictionary berisi informasi model internet
-        missing_years: Array tahun dengan nilai yang hilang (reshape untuk model populasi)
-        missing_years_array: Array tahun dengan nilai yang hilang (flat untuk model internet)
+        pop_model_info: Dictionary berisi informasi model populasi, atau list dictionary
+                        (satu per deret, indeks sesuai id deret)
+        internet_model_info: Dictionary berisi informasi model internet, atau list dictionary
+                             (satu per deret, indeks sesuai id deret)
+        missing_index: Array berukuran (jumlah nilai hilang × 2) berisi pasangan
+                       [id deret, tahun] dari load_data
+        intervals: Hasil bootstrap_intervals untuk tahun yang sama, ditambahkan sebagai
+                   kolom batas bawah dan atas (opsional)
     Return:
         Dictionary berisi hasil estimasi
     """
+    pop_predictor = population_predictor(pop_model_info)
+    internet_predictor = LogisticPredictor.from_model_info(internet_model_info)
+    missing_index = np.asarray(missing_index).reshape(-1, 2)
+    series_ids = missing_index[:, 0]
+    missing_years_array = missing_index[:, 1]
+    
     # Estimasi populasi untuk tahun yang hilang (menggunakan model polinomial)
-    missing_years_poly_pop = pop_model_info['poly_features'].transform(missing_years)
-    estimated_population = pop_model_info['model'].predict(missing_years_poly_pop)
+    estimated_population = pop_predictor(missing_years_array, series_ids)
     
     # Estimasi persentase internet untuk tahun yang hilang (menggunakan model logistik)
-    estimated_internet = internet_model_info['function'](missing_years_array, 
-                                                      internet_model_info['L'], 
-                                                      internet_model_info['k'], 
-                                                      internet_model_info['x0'])
+    estimated_internet = internet_predictor(missing_years_array, series_ids)
     
     # Hasil estimasi
-    results = pd.DataFrame({
+    columns = {}
+    if len(pop_predictor.year_center) > 1:
+        columns['Series'] = series_ids
+    columns.update({
         'Year': missing_years_array,
         'Estimated_Population': estimated_population,
         'Estimated_Internet_Percentage': estimated_internet
     })
-    print("\nHasil Estimasi Nilai yang Hilang:")
-    print(results)
+    columns.update(_interval_columns(intervals, {'population': 'Population', 'internet': 'Internet'}))
+    results = pd.DataFrame(columns)
+    print(f"\nHasil Estimasi Nilai yang Hilang:\n{results}")
+    record_metrics(rows=len(results))
+    if metrics_enabled():
+        record_metrics(series=len(np.unique(series_ids)))
     
     return {
         'estimated_population': estimated_population,
@@ -41,7 +89,171 @@ def estimate_missing_values(pop_model_info, internet_model_info, missing_years,
         'results_df': results
     }
 
-def predict_future_values(pop_model_info, internet_model_info, future_years_array):
+# Metode interpolasi lokal untuk estimate_missing_values_spline
+INTERPOLATION_METHODS = ('pchip', 'linear')
+
+def _edge_slope(h0, d0, h1, d1):
+    """
+    Fungsi untuk menghitung turunan PCHIP di titik ujung dari dua interval terdekat.
+    """
+    slope = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+    slope = np.where(np.sign(slope) != np.sign(d0), 0.0, slope)
+    return np.where((np.sign(d0) != np.sign(d1)) & (np.abs(slope) > np.abs(3 * d0)), 3 * d0, slope)
+
+def _pchip_slopes(h, delta, same_series_left, same_series_right):
+    """
+    Fungsi untuk menghitung turunan PCHIP (Fritsch-Carlson) di setiap titik data.
+    
+    Parameter:
+        h: Jarak tahun ke titik berikutnya (panjang n - 1)
+        delta: Kemiringan ke titik berikutnya (panjang n - 1)
+        same_series_left: True jika titik sebelumnya berada pada deret yang sama (panjang n)
+        same_series_right: True jika titik berikutnya berada pada deret yang sama (panjang n)
+    Return:
+        Array turunan di setiap titik (panjang n)
+    """
+    n = len(same_series_left)
+    slopes = np.zeros(n)
+    
+    # Titik interior: rata-rata harmonik berbobot, nol jika kemiringan berganti tanda
+    interior = np.flatnonzero(same_series_left & same_series_right)
+    h0, h1 = h[interior - 1], h[interior]
+    d0, d1 = delta[interior - 1], delta[interior]
+    w1, w2 = 2 * h1 + h0, h1 + 2 * h0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        harmonic = (w1 + w2) / (w1 / d0 + w2 / d1)
+    slopes[interior] = np.where(d0 * d1 > 0, harmonic, 0.0)
+    
+    # Titik ujung: rumus tiga titik satu sisi seperti scipy.interpolate.PchipInterpolator;
+    # deret dengan dua titik saja memakai kemiringan garis lurus
+    starts = np.flatnonzero(~same_series_left & same_series_right)
+    ends = np.flatnonzero(same_series_left & ~same_series_right)
+    three_start = same_series_right[np.minimum(starts + 1, n - 1)]
+    three_end = same_series_left[np.maximum(ends - 1, 0)]
+    slopes[starts] = _edge_slope(h[starts], delta[starts], 
+                                 np.where(three_start, h[np.minimum(starts + 1, n - 2)], 0.0), 
+                                 np.where(three_start, delta[np.minimum(starts + 1, n - 2)], delta[starts]))
+    slopes[ends] = _edge_slope(h[ends - 1], delta[ends - 1], 
+                               np.where(three_end, h[np.maximum(ends - 2, 0)], 0.0), 
+                               np.where(three_end, delta[np.maximum(ends - 2, 0)], delta[ends - 1]))
+    return slopes
+
+def interpolate_panel(series_ids, years, values, valid, query_series, query_years, method='pchip'):
+    """
+    Fungsi untuk menginterpolasi nilai pada pasangan (deret, tahun) dari data panel.
+    
+    Titik data valid dari semua deret diurutkan sekali menurut (deret, tahun); setiap
+    titik kueri dicari interval pengapitnya dengan searchsorted lalu dievaluasi dengan
+    polinomial Hermite kubik (PCHIP, monoton dan tanpa overshoot) atau garis lurus.
+    Tidak ada fitting per deret; biaya sebanding dengan jumlah titik data dan kueri.
+    
+    Parameter:
+        series_ids: Array id deret untuk setiap baris data
+        years: Array tahun untuk setiap baris data
+        values: Array nilai untuk setiap baris data
+        valid: Mask boolean, True jika nilai baris tersedia
+        query_series: Array id deret titik kueri
+        query_years: Array tahun titik kueri
+        method: 'pchip' atau 'linear' (opsional)
+    Return:
+        Array nilai hasil interpolasi; NaN jika titik kueri tidak diapit data deret yang sama
+    """
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError(f"Metode interpolasi tidak dikenal: {method}")
+    
+    valid = np.asarray(valid, dtype=bool)
+    series = np.asarray(series_ids)[valid].astype(np.int64)
+    x = np.asarray(years)[valid].astype(np.int64)
+    y = np.asarray(values, dtype=float)[valid]
+    query_series = np.asarray(query_series).astype(np.int64)
+    query_years = np.asarray(query_years).astype(np.int64)
+    result = np.full(len(query_years), np.nan)
+    if len(x) == 0 or len(query_years) == 0:
+        return result
+    
+    # Kunci gabungan (deret, tahun); pengurutan dilewati jika data sudah terurut
+    first_year = min(x.min(), query_years.min())
+    span = max(x.max(), query_years.max()) - first_year + 1
+    keys = series * span + (x - first_year)
+    if np.any(keys[1:] < keys[:-1]):
+        order = np.argsort(keys, kind='stable')
+        keys, series, x, y = keys[order], series[order], x[order], y[order]
+    
+    query_keys = query_series * span + (query_years - first_year)
+    left = np.searchsorted(keys, query_keys, side='right') - 1
+    right = left + 1
+    exact = (left >= 0) & (keys[np.maximum(left, 0)] == query_keys)
+    result[exact] = y[left[exact]]
+    
+    # Hanya titik yang diapit dua data dari deret yang sama yang diinterpolasi
+    inside = ~exact & (left >= 0) & (right < len(keys))
+    inside[inside] &= (series[left[inside]] == query_series[inside]) & \
+                      (series[right[inside]] == query_series[inside])
+    left, right = left[inside], right[inside]
+    
+    h = np.diff(x).astype(float)
+    same_series = series[1:] == series[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = np.where(same_series, np.diff(y) / h, 0.0)
+    
+    t = (query_years[inside] - x[left]) / h[left]
+    if method == 'linear':
+        result[inside] = y[left] + t * (y[right] - y[left])
+        return result
+    
+    slopes = _pchip_slopes(h, delta, np.r_[False, same_series], np.r_[same_series, False])
+    
+    # Basis Hermite kubik pada interval [x_kiri, x_kanan]
+    t2, t3 = t * t, t * t * t
+    result[inside] = ((2 * t3 - 3 * t2 + 1) * y[left] + (t3 - 2 * t2 + t) * h[left] * slopes[left]
+                      + (-2 * t3 + 3 * t2) * y[right] + (t3 - t2) * h[left] * slopes[right])
+    return result
+
+@instrumented('estimate_missing_values_spline')
+def estimate_missing_values_spline(dataset, method='pchip'):
+    """
+    Fungsi untuk mengestimasi nilai yang hilang dengan interpolasi lokal tanpa training model.
+    
+    Setiap celah diisi dari data di sekitarnya pada deret yang sama (lihat interpolate_panel),
+    sehingga semua celah dari semua deret diisi dalam satu langkah tervektorisasi.
+    
+    Parameter:
+        dataset: Dataset hasil load_data
+        method: 'pchip' (spline kubik monoton) atau 'linear' (opsional)
+    Return:
+        Dictionary berisi hasil estimasi dengan bentuk yang sama seperti estimate_missing_values
+    """
+    missing_index = np.asarray(dataset.missing_index).reshape(-1, 2)
+    series_ids = missing_index[:, 0]
+    missing_years_array = missing_index[:, 1]
+    
+    estimated_population = interpolate_panel(dataset.series_ids, dataset.years, dataset.population, 
+                                             dataset.pop_valid, series_ids, missing_years_array, method)
+    estimated_internet = interpolate_panel(dataset.series_ids, dataset.years, dataset.internet, 
+                                           dataset.internet_valid, series_ids, missing_years_array, method)
+    
+    # Hasil estimasi
+    columns = {}
+    if len(dataset.series_labels) > 1:
+        columns['Series'] = series_ids
+    columns.update({
+        'Year': missing_years_array,
+        'Estimated_Population': estimated_population,
+        'Estimated_Internet_Percentage': estimated_internet
+    })
+    results = pd.DataFrame(columns)
+    print(f"\nHasil Estimasi Nilai yang Hilang (interpolasi {method}):\n{results}")
+    record_metrics(rows=len(results), series=len(dataset.series_labels))
+    
+    return {
+        'estimated_population': estimated_population,
+        'estimated_internet': estimated_internet,
+        'results_df': results
+    }
+
+@instrumented('predict_future_values')
+def predict_future_values(pop_model_info, internet_model_info, future_years_array, intervals=None,
+                          monte_carlo=None):
     """
     Fungsi untuk memprediksi nilai masa depan untuk populasi dan penggunaan internet.
     
@@ -52,20 +264,18 @@ def predict_future_values(pop_model_info, internet_model_info, future_years_arra
         pop_model_info: Dictionary berisi informasi model populasi
         internet_model_info: Dictionary berisi informasi model internet
         future_years_array: Array tahun untuk prediksi masa depan
+        intervals: Hasil bootstrap_intervals untuk tahun yang sama, ditambahkan sebagai
+                   kolom batas bawah dan atas (opsional)
+        monte_carlo: Hasil simulate_internet_users untuk tahun yang sama, ditambahkan sebagai
+                     kolom rata-rata dan kuantil jumlah pengguna internet (opsional)
     Return:
         Dictionary berisi hasil prediksi
     """
-    future_years = future_years_array.reshape(-1, 1)
-    
     # Prediksi populasi (menggunakan model polinomial)
-    future_years_poly_pop = pop_model_info['poly_features'].transform(future_years)
-    predicted_population = pop_model_info['model'].predict(future_years_poly_pop)
+    predicted_population = population_predictor(pop_model_info)(future_years_array)
     
     # Prediksi persentase internet (menggunakan model logistik)
-    predicted_internet_percentage = internet_model_info['function'](future_years_array, 
-                                                                 internet_model_info['L'], 
-                                                                 internet_model_info['k'], 
-                                                                 internet_model_info['x0'])
+    predicted_internet_percentage = LogisticPredictor.from_model_info(internet_model_info)(future_years_array)
     
     # Menghitung jumlah pengguna internet
     predicted_internet_users = (predicted_internet_percentage / 100) * predicted_population
@@ -75,10 +285,14 @@ def predict_future_values(pop_model_info, internet_model_info, future_years_arra
         'Year': future_years_array,
         'Predicted_Population': predicted_population,
         'Predicted_Internet_Percentage': predicted_internet_percentage,
-        'Predicted_Internet_Users': predicted_internet_users
+        'Predicted_Internet_Users': predicted_internet_users,
+        **_interval_columns(intervals, {'population': 'Population', 'internet': 'Internet', 
+                                        'users': 'Users'}),
+        **_monte_carlo_columns(monte_carlo)
     })
-    print("\nHasil Prediksi untuk Tahun 2030 dan 2035:")
-    print(future_results)
+    print(f"\nHasil Prediksi untuk Tahun {' dan '.join(str(year) for year in future_years_array)}:\n"
+          f"{future_results}")
+    record_metrics(rows=len(future_results))
     
     return {
         'predicted_population': predicted_population,
@@ -87,6 +301,7 @@ def predict_future_values(pop_model_info, internet_model_info, future_years_arra
         'results_df': future_results
     }
 
+@instrumented('print_summary')
 def print_summary(pop_model_info, internet_model_info, estimation_results, prediction_results):
     """
     Fungsi untuk mencetak ringkasan hasil analisis.
@@ -99,7 +314,11 @@ def print_summary(pop_model_info, internet_model_info, estimation_results, predi
     """
     print("\nRINGKASAN HASIL ANALISIS:")
     print("==========================")
-    print(f"1. Model Populasi: Polinomial derajat {pop_model_info['degree']} (R² = {pop_model_info['r2']:.4f})")
+    family = pop_model_info.get('family', 'polynomial')
+    if family == 'polynomial':
+        print(f"1. Model Populasi: Polinomial derajat {pop_model_info['degree']} (R² = {pop_model_info['r2']:.4f})")
+    else:
+        print(f"1. Model Populasi: {FAMILY_LABELS[family]} (R² = {pop_model_info['r2']:.4f})")
     print(f"   Persamaan: {pop_model_info['equation']}")
     print(f"2. Model Internet: Logistik (R² = {internet_model_info['r2']:.4f})")
     print(f"   Persamaan: {internet_model_info['equation']}")
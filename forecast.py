@@ -0,0 +1,155 @@
+import os
+import numpy as np
+import pandas as pd
+from predictors import LogisticPredictor, population_predictor
+from instrumentation import instrumented, record_metrics
+
+# Skenario bawaan: tanpa penyesuaian parameter model
+# Kunci yang dikenali per skenario:
+#   population_factor: pengali hasil prediksi populasi
+#   k_factor: pengali laju pertumbuhan k model logistik
+#   x0_shift: pergeseran titik tengah x0 model logistik (tahun)
+DEFAULT_SCENARIOS = {'baseline': {}}
+
+# Jumlah baris maksimum per chunk yang ditulis ke file
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+def _scenario_predictors(pop_predictor, internet_predictor, scenario):
+    """
+    Fungsi untuk menerapkan penyesuaian skenario pada prediktor.
+    Return:
+        Tuple (pop_predictor, internet_predictor, population_factor)
+    """
+    unknown = set(scenario) - {'population_factor', 'k_factor', 'x0_shift'}
+    if unknown:
+        raise ValueError(f"Kunci skenario tidak dikenal: {sorted(unknown)}")
+    
+    if 'k_factor' in scenario or 'x0_shift' in scenario:
+        internet_predictor = LogisticPredictor(internet_predictor.L,
+                                               internet_predictor.k * scenario.get('k_factor', 1.0),
+                                               internet_predictor.x0 + scenario.get('x0_shift', 0.0))
+    return pop_predictor, internet_predictor, scenario.get('population_factor', 1.0)
+
+class _ParquetWriter:
+    """
+    Penulis chunk ke file Parquet (membutuhkan pyarrow).
+    """
+    __slots__ = ('path', '_pa', '_writer')
+    
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError("Menulis file Parquet membutuhkan paket pyarrow "
+                              "(pip install pyarrow), atau gunakan keluaran .csv") from error
+        self.path = path
+        self._pa = (pa, pq)
+        self._writer = None
+    
+    def write(self, columns):
+        pa, pq = self._pa
+        table = pa.table(columns)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+class _CsvWriter:
+    """
+    Penulis chunk ke file CSV; header hanya ditulis pada chunk pertama.
+    """
+    __slots__ = ('_file', '_header')
+    
+    def __init__(self, path):
+        self._file = open(path, 'w', newline='')
+        self._header = True
+    
+    def write(self, columns):
+        pd.DataFrame(columns).to_csv(self._file, header=self._header, index=False)
+        self._header = False
+    
+    def close(self):
+        self._file.close()
+
+@instrumented('write_forecast_table')
+def write_forecast_table(pop_model_info, internet_model_info, years, output_path,
+                         series_labels=None, scenarios=None, chunk_rows=DEFAULT_CHUNK_ROWS,
+                         file_format=None):
+    """
+    Fungsi untuk menulis tabel prediksi populasi, persentase internet dan jumlah
+    pengguna internet untuk semua deret, tahun dan skenario ke file CSV atau Parquet.
+    
+    Tabel ditulis per chunk berisi blok deret sehingga memori yang digunakan dibatasi
+    oleh chunk_rows, bukan oleh ukuran seluruh tabel.
+    
+    Parameter:
+        pop_model_info: Dictionary informasi model populasi, atau list dictionary (satu per deret)
+        internet_model_info: Dictionary informasi model internet, atau list dictionary (satu per deret)
+        years: Array tahun prediksi (misalnya np.arange(2024, 2101))
+        output_path: Path file keluaran (.csv atau .parquet)
+        series_labels: Array nama deret (opsional, bawaan id deret)
+        scenarios: Dictionary nama skenario -> penyesuaian (lihat DEFAULT_SCENARIOS)
+        chunk_rows: Jumlah baris maksimum per chunk (opsional)
+        file_format: 'csv' atau 'parquet' (opsional, bawaan dari ekstensi output_path)
+    Return:
+        Dictionary berisi path file, jumlah baris dan jumlah chunk
+    """
+    years = np.asarray(years)
+    scenarios = DEFAULT_SCENARIOS if scenarios is None else scenarios
+    pop_predictor = population_predictor(pop_model_info)
+    internet_predictor = LogisticPredictor.from_model_info(internet_model_info)
+    n_series = len(pop_predictor.year_center)
+    if len(internet_predictor.L) != n_series:
+        raise ValueError(f"Jumlah model populasi ({n_series}) dan internet "
+                         f"({len(internet_predictor.L)}) tidak sama")
+    if series_labels is None:
+        series_labels = np.arange(n_series).astype(str)
+    series_labels = np.asarray(series_labels)
+    
+    if file_format is None:
+        file_format = 'parquet' if os.path.splitext(output_path)[1].lower() in ('.parquet', '.pq') else 'csv'
+    if file_format not in ('csv', 'parquet'):
+        raise ValueError(f"Format keluaran tidak dikenal: {file_format}")
+    
+    # Jumlah deret per chunk agar setiap chunk berisi paling banyak chunk_rows baris
+    # (minimal satu deret penuh per chunk)
+    series_per_chunk = max(1, chunk_rows // max(len(years), 1))
+    
+    writer = _ParquetWriter(output_path) if file_format == 'parquet' else _CsvWriter(output_path)
+    n_rows = 0
+    n_chunks = 0
+    try:
+        for name, scenario in scenarios.items():
+            scenario_pop, scenario_internet, population_factor = _scenario_predictors(
+                pop_predictor, internet_predictor, scenario)
+            
+            for start in range(0, n_series, series_per_chunk):
+                # Grid (blok deret × tahun) dievaluasi sekaligus lalu diratakan
+                series_ids = np.arange(start, min(start + series_per_chunk, n_series))[:, None]
+                population = scenario_pop(years, series_ids) * population_factor
+                percentage = scenario_internet(years, series_ids)
+                
+                chunk_series = np.broadcast_to(series_ids, population.shape).ravel()
+                writer.write({
+                    'Scenario': np.full(len(chunk_series), name),
+                    'Series': series_labels[chunk_series],
+                    'Year': np.broadcast_to(years, population.shape).ravel(),
+                    'Predicted_Population': population.ravel(),
+                    'Predicted_Internet_Percentage': percentage.ravel(),
+                    'Predicted_Internet_Users': (percentage / 100 * population).ravel()
+                })
+                n_rows += len(chunk_series)
+                n_chunks += 1
+    finally:
+        writer.close()
+    
+    record_metrics(rows=n_rows, series=n_series, chunks=n_chunks)
+    return {
+        'path': output_path,
+        'rows': n_rows,
+        'chunks': n_chunks
+    }
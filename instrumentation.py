@@ -0,0 +1,137 @@
+import contextvars
+import functools
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Tujuan record (callable yang menerima dictionary) dan opsi pengukuran memori
+_sink = None
+_track_memory = False
+
+# Record tahap yang sedang berjalan (per thread/konteks)
+_current_record = contextvars.ContextVar('current_record', default=None)
+
+class JsonLinesSink:
+    """
+    Sink yang menulis setiap record sebagai satu baris JSON ke stream atau file.
+    """
+    __slots__ = ('stream', '_owns_stream')
+    
+    def __init__(self, target=None):
+        """
+        Parameter:
+            target: Path file (ditambahkan di akhir) atau stream yang dapat ditulisi
+                    (opsional, bawaan sys.stderr)
+        """
+        if isinstance(target, str):
+            self.stream = open(target, 'a')
+            self._owns_stream = True
+        else:
+            self.stream = target if target is not None else sys.stderr
+            self._owns_stream = False
+    
+    def __call__(self, record):
+        self.stream.write(json.dumps(record, default=str) + '\n')
+        self.stream.flush()
+    
+    def close(self):
+        if self._owns_stream:
+            self.stream.close()
+
+def configure(sink=None, track_memory=False):
+    """
+    Fungsi untuk mengatur tujuan record metrik.
+    Parameter:
+        sink: Callable yang menerima dictionary record, misalnya JsonLinesSink, atau None
+              untuk menonaktifkan pengiriman record
+        track_memory: Jika True, puncak memori selama setiap tahap diukur dengan tracemalloc
+                      (menambah overhead). tracemalloc bersifat global untuk seluruh proses,
+                      sehingga tahap harus dijalankan berurutan agar puncaknya bermakna
+    """
+    global _sink, _track_memory
+    _sink = sink
+    _track_memory = track_memory
+
+def metrics_enabled():
+    """
+    Fungsi untuk memeriksa apakah record metrik dikirim ke sink.
+    Metrik yang mahal dihitung hanya jika fungsi ini bernilai True.
+    Return:
+        True jika sink sudah diatur dengan configure
+    """
+    return _sink is not None
+
+def tracks_memory():
+    """
+    Fungsi untuk memeriksa apakah pengukuran memori aktif.
+    Return:
+        True jika configure dipanggil dengan track_memory=True
+    """
+    return _track_memory
+
+def record_metrics(**fields):
+    """
+    Fungsi untuk menambahkan metrik (misalnya jumlah baris, deret atau evaluasi fungsi)
+    ke record tahap yang sedang berjalan. Tidak melakukan apa pun di luar tahap.
+    """
+    record = _current_record.get()
+    if record is not None:
+        record.update(fields)
+
+@contextmanager
+def stage(name, **fields):
+    """
+    Context manager untuk mengukur satu tahap dan mengirim record-nya ke sink.
+    
+    Record berisi nama tahap, waktu mulai, durasi, metrik tambahan dari record_metrics
+    dan (jika diaktifkan) process_peak_bytes, yaitu kenaikan puncak memori teralokasi
+    seluruh proses selama tahap berjalan dibandingkan saat tahap dimulai. Alokasi thread
+    lain yang berjalan bersamaan ikut terhitung.
+    Parameter:
+        name: Nama tahap
+        fields: Metrik awal yang disertakan dalam record
+    """
+    record = {'stage': name, 'start': time.time(), **fields}
+    parent = _current_record.get()
+    token = _current_record.set(record)
+    
+    started_tracing = False
+    if _track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+    
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        _current_record.reset(token)
+        
+        if _track_memory:
+            # Puncak tahap anak ikut diperhitungkan karena reset_peak dipanggil olehnya
+            peak = max(tracemalloc.get_traced_memory()[1], record.pop('_child_peak', 0))
+            record['process_peak_bytes'] = peak - start_memory
+            if started_tracing:
+                tracemalloc.stop()
+            if parent is not None:
+                parent['_child_peak'] = max(parent.get('_child_peak', 0), peak)
+        
+        if _sink is not None:
+            _sink(record)
+
+def instrumented(name):
+    """
+    Decorator untuk menjalankan seluruh fungsi di dalam stage(name).
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,7 +1,28 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.linalg import svd
+from scipy.optimize import least_squares
+from scipy.special import expit
 from sklearn.metrics import r2_score
 from utils import format_logistic
+from instrumentation import instrumented, record_metrics
+
+logger = logging.getLogger(__name__)
+
+# Parameter awal untuk model logistik
+# L=100 (batas atas 100%)
+# k=0.3 (tingkat pertumbuhan yang diestimasi)
+# x0=2010 (tahun di mana pertumbuhan paling cepat, sekitar 2010-an)
+DEFAULT_P0 = [100, 0.3, 2010]
+
+# Batasan parameter untuk menghasilkan model yang masuk akal
+# L harus antara 0 dan 100 (persentase)
+# k harus positif
+# x0 harus dalam rentang tahun data
+DEFAULT_BOUNDS = ([0, 0, 1990], [100, 1, 2020])
 
 def logistic_function(x, L, k, x0):
     """
@@ -12,56 +33,300 @@ def logistic_function(x, L, k, x0):
     """
     return L / (1 + np.exp(-k * (x - x0)))
 
-def train_internet_model(internet_years, internet_values):
+def logistic_jacobian(x, L, k, x0):
+    """
+    Fungsi untuk menghitung turunan parsial fungsi logistik terhadap parameter L, k dan x0.
+    
+    Parameter:
+        x: Array tahun
+        L, k, x0: Parameter fungsi logistik
+    Return:
+        Matriks Jacobian berukuran (jumlah tahun × 3)
+    """
+    x = np.asarray(x, dtype=float)
+    f = expit(k * (x - x0))
+    slope = L * f * (1 - f)
+    return np.column_stack((f, slope * (x - x0), -slope * k))
+
+def fit_logistic(years, values, p0, bounds, max_nfev=None):
+    """
+    Fungsi untuk melakukan fitting fungsi logistik dengan Jacobian analitik.
+    
+    Fitting dilakukan dengan least_squares (metode trf, sama seperti curve_fit dengan
+    batasan), tetapi Jacobian dihitung secara analitik sehingga tidak perlu evaluasi
+    fungsi tambahan untuk beda hingga. Parameter awal dapat berupa hasil fitting
+    sebelumnya (warm start).
+    
+    Parameter:
+        years: Array tahun
+        values: Array nilai yang akan di-fit
+        p0: Parameter awal [L, k, x0]
+        bounds: Batasan parameter ([L_min, k_min, x0_min], [L_max, k_max, x0_max])
+        max_nfev: Batas jumlah evaluasi fungsi (opsional)
+    Return:
+        Dictionary berisi parameter, kovariansi, jumlah iterasi, jumlah evaluasi fungsi dan
+        status konvergensi (success); pemanggil wajib memeriksa success
+    """
+    years = np.asarray(years, dtype=float)
+    values = np.asarray(values, dtype=float)
+    lower, upper = (np.asarray(bound, dtype=float) for bound in bounds)
+    
+    # Parameter awal (misalnya dari fitting sebelumnya) dijaga tetap di dalam batasan
+    p0 = np.clip(np.asarray(p0, dtype=float), lower, upper)
+    
+    def residuals(params):
+        return logistic_function(years, *params) - values
+    
+    def jacobian(params):
+        return logistic_jacobian(years, *params)
+    
+    result = least_squares(residuals, p0, jac=jacobian, bounds=(lower, upper), 
+                           method='trf', max_nfev=max_nfev)
+    
+    # Kovariansi dihitung dengan cara yang sama seperti curve_fit
+    _, s, VT = svd(result.jac, full_matrices=False)
+    threshold = np.finfo(float).eps * max(result.jac.shape) * s[0]
+    s = s[s > threshold]
+    VT = VT[:s.size]
+    covariance = np.dot(VT.T / s ** 2, VT)
+    
+    dof = values.size - p0.size
+    if dof > 0:
+        covariance = covariance * (2 * result.cost / dof)
+    else:
+        covariance.fill(np.inf)
+    
+    return {
+        'params': result.x,
+        'covariance': covariance,
+        # Metode trf mengevaluasi Jacobian tepat satu kali per iterasi
+        'nit': result.njev,
+        'nfev': result.nfev,
+        'success': result.success,
+        'message': result.message
+    }
+
+@instrumented('train_internet_model')
+def train_internet_model(internet_years, internet_values, p0=None, bounds=None):
     """
     Fungsi untuk melatih model logistik untuk data penggunaan internet.
     
-    Fungsi ini menggunakan curve_fit dari scipy untuk menemukan parameter
-    optimal dari fungsi logistik yang cocok dengan data persentase pengguna internet.
+    Fungsi ini menggunakan fit_logistic (least squares dengan Jacobian analitik) untuk
+    menemukan parameter optimal dari fungsi logistik yang cocok dengan data persentase
+    pengguna internet.
     
     Parameter:
         internet_years: Array tahun untuk data internet
         internet_values: Array nilai persentase pengguna internet
+        p0: Parameter awal [L, k, x0], misalnya dari model sebelumnya (opsional)
+        bounds: Batasan parameter ([L_min, k_min, x0_min], [L_max, k_max, x0_max]) (opsional)
     Return:
         Dictionary berisi parameter model dan informasi terkait
     """
-    # Parameter awal untuk model logistik
-    # L=100 (batas atas 100%)
-    # k=0.3 (tingkat pertumbuhan yang diestimasi)
-    # x0=2010 (tahun di mana pertumbuhan paling cepat, sekitar 2010-an)
-    p0 = [100, 0.3, 2010]
-    
-    # Batasan parameter untuk menghasilkan model yang masuk akal
-    # L harus antara 0 dan 100 (persentase)
-    # k harus positif
-    # x0 harus dalam rentang tahun data
-    bounds = ([0, 0, 1990], [100, 1, 2020])
+    if p0 is None:
+        p0 = DEFAULT_P0
+    if bounds is None:
+        bounds = DEFAULT_BOUNDS
     
     # Melakukan fitting model logistik
-    params, covariance = curve_fit(logistic_function, internet_years, internet_values, 
-                                  p0=p0, bounds=bounds, maxfev=10000)
+    fit = fit_logistic(internet_years, internet_values, p0, bounds, max_nfev=10000)
+    if not fit['success']:
+        # Sama seperti curve_fit: fitting yang tidak konvergen tidak boleh dipakai untuk prediksi
+        raise RuntimeError(f"Parameter optimal model logistik tidak ditemukan: {fit['message']}")
+    params = fit['params']
+    covariance = fit['covariance']
     
     # Mengambil parameter hasil fitting
     L_fit, k_fit, x0_fit = params
-    print(f"Parameter model logistik: L={L_fit:.2f}, k={k_fit:.4f}, x0={x0_fit:.2f}")
+    logger.info("Parameter model logistik: L=%.2f, k=%.4f, x0=%.2f", L_fit, k_fit, x0_fit)
+    logger.info("Fitting selesai dalam %d iterasi dan %d evaluasi fungsi", fit['nit'], fit['nfev'])
+    record_metrics(rows=len(internet_values), nit=fit['nit'], nfev=fit['nfev'])
     
     # Membuat persamaan
     internet_equation = format_logistic(L_fit, k_fit, x0_fit)
-    print("Persamaan logistik persentase pengguna internet:")
-    print(internet_equation)
+    logger.info("Persamaan logistik persentase pengguna internet:\n%s", internet_equation)
     
     # Menghitung R^2 untuk model logistik
     internet_pred = logistic_function(internet_years, L_fit, k_fit, x0_fit)
     internet_r2 = r2_score(internet_values, internet_pred)
-    print(f"R² model logistik untuk internet: {internet_r2:.4f}")
+    logger.info("R² model logistik untuk internet: %.4f", internet_r2)
     
     # Mengembalikan informasi model
     return {
         'params': params,
+        'covariance': covariance,
         'L': L_fit,
         'k': k_fit,
         'x0': x0_fit,
         'equation': internet_equation,
         'r2': internet_r2,
+        'nit': fit['nit'],
+        'nfev': fit['nfev'],
         'function': logistic_function
-    }
\ No newline at end of file
+    }
+
+# Jumlah observasi terakhir yang digunakan update_internet_model; cukup panjang untuk
+# mencakup kenaikan kurva logistik pada data tahunan
+DEFAULT_UPDATE_WINDOW = 30
+
+def update_internet_model(internet_model_info, internet_years, internet_values, 
+                          window=DEFAULT_UPDATE_WINDOW, bounds=None):
+    """
+    Fungsi untuk memperbarui model logistik ketika data tahun baru tersedia.
+    
+    Optimasi dimulai dari parameter L, k dan x0 model sebelumnya (warm start) sehingga
+    biasanya hanya membutuhkan beberapa iterasi. Hanya observasi terakhir sebanyak
+    window yang digunakan (berupa view, tanpa pengurutan) sehingga biaya tiap pembaruan
+    tetap konstan terlepas dari panjang riwayat data.
+    
+    Parameter:
+        internet_model_info: Dictionary hasil train_internet_model (atau pembaruan sebelumnya)
+        internet_years: Array tahun untuk data internet secara berurutan, termasuk tahun baru
+        internet_values: Array nilai persentase pengguna internet, termasuk nilai baru
+        window: Jumlah observasi terakhir yang digunakan (opsional, None = semua data
+                dengan biaya yang bertambah sesuai panjang riwayat)
+        bounds: Batasan parameter (opsional, bawaan DEFAULT_BOUNDS)
+    Return:
+        Dictionary informasi model baru dengan bentuk yang sama seperti train_internet_model
+    """
+    internet_years = np.asarray(internet_years)
+    internet_values = np.asarray(internet_values)
+    if window is not None:
+        internet_years = internet_years[-window:]
+        internet_values = internet_values[-window:]
+    
+    p0 = [internet_model_info['L'], internet_model_info['k'], internet_model_info['x0']]
+    return train_internet_model(internet_years, internet_values, p0=p0, bounds=bounds)
+
+def _fit_block(arrays, start, stop, p0, bounds, max_nfev):
+    """
+    Fungsi untuk fitting logistik deret start..stop-1 dan menulis hasilnya ke array hasil.
+    Parameter:
+        arrays: Dictionary array years, values, params, covariance, r2 dan nfev
+        start, stop: Rentang indeks deret
+        p0, bounds, max_nfev: Diteruskan ke fit_logistic
+    Return:
+        Jumlah deret yang berhasil di-fit (fitting yang tidak konvergen dilewati)
+    """
+    years, values = arrays['years'], arrays['values']
+    fitted = 0
+    for i in range(start, stop):
+        valid = ~np.isnan(values[i])
+        if valid.sum() <= len(p0):
+            continue
+        series_years, series_values = years[valid], values[i, valid]
+        fit = fit_logistic(series_years, series_values, p0, bounds, max_nfev=max_nfev)
+        if not fit['success']:
+            continue
+        residuals = logistic_function(series_years, *fit['params']) - series_values
+        ss_tot = ((series_values - series_values.mean()) ** 2).sum()
+        
+        arrays['params'][i] = fit['params']
+        arrays['covariance'][i] = fit['covariance']
+        arrays['r2'][i] = 1 - (residuals ** 2).sum() / ss_tot if ss_tot > 0 else np.nan
+        arrays['nfev'][i] = fit['nfev']
+        fitted += 1
+    return fitted
+
+def _fit_shared_block(specs, start, stop, p0, bounds, max_nfev):
+    """
+    Fungsi pekerja process pool: membuka array di shared memory (tanpa salinan) lalu
+    menjalankan _fit_block.
+    Parameter:
+        specs: Dictionary nama array -> (nama shared memory, bentuk, tipe data)
+        start, stop, p0, bounds, max_nfev: Lihat _fit_block
+    Return:
+        Jumlah deret yang berhasil di-fit
+    """
+    blocks = {key: shared_memory.SharedMemory(name=name) for key, (name, _, _) in specs.items()}
+    arrays = {key: np.ndarray(shape, dtype=dtype, buffer=blocks[key].buf)
+              for key, (_, shape, dtype) in specs.items()}
+    try:
+        return _fit_block(arrays, start, stop, p0, bounds, max_nfev)
+    finally:
+        # View dilepas sebelum blok ditutup (buffer tidak boleh masih direferensikan)
+        arrays.clear()
+        for block in blocks.values():
+            block.close()
+
+@instrumented('train_internet_models_parallel')
+def train_internet_models_parallel(years, values_matrix, p0=None, bounds=None, processes=None,
+                                   max_nfev=10000):
+    """
+    Fungsi untuk melatih model logistik bagi banyak deret secara paralel.
+    
+    Matriks tahun dan nilai disalin sekali ke shared memory sehingga pekerja process
+    pool membacanya tanpa salinan; setiap pekerja melakukan fit_logistic per deret untuk
+    blok deretnya dan menulis L, k, x0, kovariansi dan R² langsung ke array hasil
+    bersama yang sudah dialokasikan. Hanya indeks blok yang dikirim ke pekerja.
+    
+    Parameter:
+        years: Array tahun (kolom matriks nilai)
+        values_matrix: Matriks persentase pengguna internet berukuran (jumlah deret × jumlah tahun),
+                       nilai NaN dianggap sebagai data yang hilang
+        p0: Parameter awal [L, k, x0] (opsional, bawaan DEFAULT_P0)
+        bounds: Batasan parameter (opsional, bawaan DEFAULT_BOUNDS)
+        processes: Jumlah proses pekerja (opsional, bawaan jumlah CPU; 1 = di proses utama)
+        max_nfev: Batas jumlah evaluasi fungsi per deret (opsional)
+    Return:
+        Dictionary berisi array params (n × 3), L, k, x0, covariance (n × 3 × 3), r2, nfev
+        dan success; deret dengan data kurang dari jumlah parameter atau yang fittingnya
+        tidak konvergen bernilai NaN (success = False)
+    """
+    p0 = DEFAULT_P0 if p0 is None else p0
+    bounds = DEFAULT_BOUNDS if bounds is None else bounds
+    years = np.asarray(years, dtype=float).ravel()
+    values_matrix = np.atleast_2d(np.asarray(values_matrix, dtype=float))
+    n_series = values_matrix.shape[0]
+    
+    layouts = {
+        'years': (years.shape, np.float64),
+        'values': (values_matrix.shape, np.float64),
+        'params': ((n_series, 3), np.float64),
+        'covariance': ((n_series, 3, 3), np.float64),
+        'r2': ((n_series,), np.float64),
+        'nfev': ((n_series,), np.int64)
+    }
+    blocks = {}
+    arrays = {}
+    try:
+        for key, (shape, dtype) in layouts.items():
+            size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+            blocks[key] = shared_memory.SharedMemory(create=True, size=size)
+            arrays[key] = np.ndarray(shape, dtype=dtype, buffer=blocks[key].buf)
+        arrays['years'][:] = years
+        arrays['values'][:] = values_matrix
+        for key in ('params', 'covariance', 'r2'):
+            arrays[key].fill(np.nan)
+        arrays['nfev'].fill(0)
+        specs = {key: (blocks[key].name, shape, np.dtype(dtype).str) 
+                 for key, (shape, dtype) in layouts.items()}
+        
+        workers = min(processes or os.cpu_count() or 1, n_series)
+        # Beberapa blok per pekerja agar beban tetap seimbang jika lama fitting berbeda-beda
+        edges = np.linspace(0, n_series, min(n_series, 4 * workers) + 1).astype(int)
+        ranges = list(zip(edges[:-1], edges[1:]))
+        if workers <= 1:
+            fitted = sum(_fit_block(arrays, start, stop, p0, bounds, max_nfev) 
+                         for start, stop in ranges)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                fitted = sum(executor.map(_fit_shared_block, *zip(*[
+                    (specs, start, stop, p0, bounds, max_nfev) for start, stop in ranges])))
+        
+        results = {key: arrays[key].copy() for key in ('params', 'covariance', 'r2', 'nfev')}
+    finally:
+        # View dilepas sebelum blok ditutup (buffer tidak boleh masih direferensikan)
+        arrays.clear()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+    
+    logger.info("%d dari %d deret internet berhasil di-fit dengan %d proses", fitted, n_series, workers)
+    if fitted < n_series:
+        logger.warning("%d deret internet tidak di-fit (data kurang atau tidak konvergen)", 
+                       n_series - fitted)
+    record_metrics(series=n_series, fitted=fitted, nfev=int(results['nfev'].sum()))
+    results['L'], results['k'], results['x0'] = results['params'].T
+    results['success'] = results['nfev'] > 0
+    return results
@@ -1,17 +1,51 @@
-import numpy as np
-import pandas as pd
+import argparse
+import logging
+import os
+import subprocess
+import sys
 
-from data_loader import load_data
-from population_model import train_population_model
-from internet_usage_model import train_internet_model
-from visualization import (plot_population_data, plot_internet_data, plot_internet_model,
-                          plot_population_with_estimates, plot_internet_with_estimates)
-from estimation import estimate_missing_values, predict_future_values, print_summary
+logger = logging.getLogger(__name__)
 
-def main():
+# Modul berat (pandas, scipy, sklearn, matplotlib) hanya diimpor di dalam subperintah
+# yang membutuhkannya agar perintah ringan seperti predict dapat dimulai dengan cepat.
+
+DATA_FILE = 'Data Tugas Pemrograman A.csv'
+MODELS_FILE = 'models.json'
+FUTURE_YEARS = [2030, 2035]
+
+# Modul kode pelatihan setiap jenis model
+MODEL_MODULES = {'population': 'population_model', 'internet': 'internet_usage_model'}
+
+# Modul yang diimpor oleh setiap subperintah (harus sesuai dengan impor di fungsi cmd_*)
+COMMAND_MODULES = {
+    'load': ['data_loader'],
+    'fit': ['data_loader', 'population_model', 'internet_usage_model', 'model_cache'],
+    'estimate': ['data_loader', 'estimation', 'model_cache', 'bootstrap', 'monte_carlo'],
+    'predict': ['predictors', 'model_cache', 'data_store'],
+    'forecast': ['forecast', 'data_loader', 'model_cache'],
+    'plot': ['data_loader', 'estimation', 'population_model', 'internet_usage_model', 'model_cache', 
+             'visualization'],
+    'summary': ['data_loader', 'estimation', 'model_cache']
+}
+
+# Batas waktu impor (detik) untuk subperintah ringan beserta modul yang tidak boleh ikut diimpor
+IMPORT_BUDGETS = {'predict': 0.5}
+HEAVY_MODULES = ['pandas', 'scipy', 'sklearn', 'matplotlib']
+
+def run_pipeline(output_dir=None, jobs=None, use_cache=True):
     """
     Fungsi utama yang menjalankan seluruh alur analisis data.
     
+    Tahap-tahap alur dideklarasikan sebagai graf dependensi dan dijalankan dengan
+    run_stages: fitting populasi dan internet, kelima grafik, serta estimasi dan
+    prediksi berjalan bersamaan jika masukannya sudah tersedia.
+    
+    Parameter:
+        output_dir: Jika diisi, grafik disimpan sebagai file PNG di direktori ini
+                    tanpa ditampilkan (opsional)
+        jobs: Jumlah pekerja konkuren (opsional, bawaan jumlah CPU; 1 = berurutan)
+        use_cache: Jika False, semua tahap dijalankan ulang meskipun masukannya tidak berubah
+    
     Alur:
     1. Memuat dan memproses data
     2. Memvisualisasikan data asli
@@ -22,50 +56,472 @@ def main():
     7. Memvisualisasikan hasil dengan estimasi dan prediksi
     8. Mencetak ringkasan hasil
     """
-    # Memuat dan memproses data
-    data_dict = load_data('Data Tugas Pemrograman A.csv')
+    import numpy as np
+    from data_loader import load_data
+    from internet_usage_model import logistic_function
+    from visualization import (plot_population_data, plot_internet_data, plot_internet_model,
+                              plot_population_with_estimates, plot_internet_with_estimates, chart_path)
+    from estimation import estimate_missing_values, predict_future_values, print_summary
+    from pipeline import Stage, run_stages, file_identity, DEFAULT_CACHE_DIR
+    
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    future_years_array = np.array(FUTURE_YEARS)
+    
+    def logistic_params(info):
+        return [info['L'], info['k'], info['x0']]
+    
+    def plot_stage(name, chart, function, inputs):
+        # Grafik interaktif harus dibuat di thread utama (pyplot) dan selalu ditampilkan;
+        # grafik headless memakai Figure/Agg terpisah sehingga aman dijalankan di thread pool
+        output_path = chart_path(output_dir, chart)
+        if output_path is None:
+            return Stage(name, lambda *args: function(*args, None), inputs, executor='main', cache=False)
+        return Stage(name, lambda *args: function(*args, output_path), inputs, outputs=[output_path], 
+                     params=output_path)
+    
+    stages = [
+        # Memuat dan memproses data
+        Stage('load_data', lambda: load_data(DATA_FILE, diagnostics=2, use_store=True), 
+              executor='main', cache=False, params=file_identity(DATA_FILE)),
+        
+        # Memvisualisasikan data asli
+        plot_stage('plot_population_data', 'population', 
+                   lambda dataset, path: plot_population_data(
+                       dataset.pop_years, dataset.pop_values, output_path=path), 
+                   ['load_data']),
+        plot_stage('plot_internet_data', 'internet', 
+                   lambda dataset, path: plot_internet_data(
+                       dataset.internet_years, dataset.internet_values, output_path=path), 
+                   ['load_data']),
+        
+        # Melatih model (atau memuatnya dari cache model jika data dan pengaturannya tidak berubah)
+        # (params memuat pengaturan, versi cache model dan identitas kode model sehingga
+        # grafik yang bergantung pada model dibuat ulang jika salah satunya berubah)
+        Stage('fit_population', fit_population_model, ['load_data'], cache=False, 
+              params=fit_stage_params('population')),
+        Stage('fit_internet', fit_internet_model, ['load_data'], cache=False, 
+              params=fit_stage_params('internet')),
+        
+        # Memvisualisasikan model internet
+        plot_stage('plot_internet_model', 'internet_model', 
+                   lambda dataset, internet_model_info, path: plot_internet_model(
+                       dataset.internet_years, dataset.internet_values, logistic_function, 
+                       logistic_params(internet_model_info), output_path=path), 
+                   ['load_data', 'fit_internet']),
+        
+        # Mengestimasi nilai yang hilang dan memprediksi nilai masa depan
+        # (tidak di-cache karena tabel hasilnya merupakan bagian dari keluaran alur)
+        Stage('estimate', 
+              lambda dataset, pop_model_info, internet_model_info: estimate_missing_values(
+                  pop_model_info, internet_model_info, dataset.missing_index), 
+              ['load_data', 'fit_population', 'fit_internet'], cache=False),
+        Stage('predict', 
+              lambda pop_model_info, internet_model_info: predict_future_values(
+                  pop_model_info, internet_model_info, future_years_array), 
+              ['fit_population', 'fit_internet'], cache=False, params=FUTURE_YEARS),
+        
+        # Memvisualisasikan dengan estimasi dan prediksi
+        plot_stage('plot_population_with_estimates', 'population_estimates', 
+                   lambda dataset, pop_model_info, estimation_results, prediction_results, path: 
+                   plot_population_with_estimates(
+                       dataset.pop_years, dataset.pop_values, pop_model_info, dataset.missing_years, 
+                       estimation_results['estimated_population'], future_years_array.reshape(-1, 1), 
+                       prediction_results['predicted_population'], dataset.all_years, 
+                       output_path=path), 
+                   ['load_data', 'fit_population', 'estimate', 'predict']),
+        plot_stage('plot_internet_with_estimates', 'internet_estimates', 
+                   lambda dataset, internet_model_info, estimation_results, prediction_results, path: 
+                   plot_internet_with_estimates(
+                       dataset.internet_years, dataset.internet_values, logistic_function, 
+                       logistic_params(internet_model_info), dataset.missing_years_array, 
+                       estimation_results['estimated_internet'], future_years_array, 
+                       prediction_results['predicted_internet_percentage'], dataset.all_years, 
+                       output_path=path), 
+                   ['load_data', 'fit_internet', 'estimate', 'predict']),
+        
+        # Mencetak ringkasan
+        Stage('print_summary', print_summary, 
+              ['fit_population', 'fit_internet', 'estimate', 'predict'], executor='main', cache=False)
+    ]
+    
+    run_stages(stages, jobs=jobs, cache_dir=DEFAULT_CACHE_DIR if use_cache else None)
+
+def model_settings(model_type):
+    """
+    Fungsi untuk mengambil pengaturan pelatihan model yang ikut menentukan kunci cache model.
+    Parameter:
+        model_type: 'population' atau 'internet'
+    Return:
+        Dictionary pengaturan model
+    """
+    if model_type == 'population':
+        from population_model import DEFAULT_DEGREES
+        return {'degrees': list(DEFAULT_DEGREES)}
+    from internet_usage_model import DEFAULT_P0, DEFAULT_BOUNDS
+    return {'p0': DEFAULT_P0, 'bounds': DEFAULT_BOUNDS}
+
+def fit_stage_params(model_type):
+    """
+    Fungsi untuk membuat params tahap fitting pada run_pipeline dari pengaturan model,
+    versi cache model dan identitas file kode model.
+    Parameter:
+        model_type: 'population' atau 'internet'
+    Return:
+        Tuple (CACHE_VERSION, pengaturan model, file_identity modul model)
+    """
+    import importlib
+    from model_cache import CACHE_VERSION
+    from pipeline import file_identity
+    
+    module = importlib.import_module(MODEL_MODULES[model_type])
+    return (CACHE_VERSION, model_settings(model_type), file_identity(module.__file__))
+
+def fit_population_model(dataset):
+    """
+    Fungsi untuk melatih model populasi, atau memuatnya dari cache jika data dan
+    pengaturannya tidak berubah.
+    Parameter:
+        dataset: Dataset hasil load_data
+    Return:
+        Dictionary informasi model populasi
+    """
+    from population_model import train_population_model
+    from model_cache import cached_train
     
-    # Memvisualisasikan data asli
-    plot_population_data(data_dict['pop_years'], data_dict['pop_values'])
-    plot_internet_data(data_dict['internet_years'], data_dict['internet_values'])
+    return cached_train(train_population_model, 'population', 
+                        [dataset.pop_years, dataset.pop_values], model_settings('population'))
+
+def fit_internet_model(dataset):
+    """
+    Fungsi untuk melatih model internet, atau memuatnya dari cache jika data dan
+    pengaturannya tidak berubah.
+    Parameter:
+        dataset: Dataset hasil load_data
+    Return:
+        Dictionary informasi model internet
+    """
+    from internet_usage_model import train_internet_model
+    from model_cache import cached_train
     
-    # Melatih model
-    pop_model_info = train_population_model(data_dict['pop_years'], data_dict['pop_values'])
-    internet_model_info = train_internet_model(data_dict['internet_years'], data_dict['internet_values'])
+    return cached_train(train_internet_model, 'internet', 
+                        [dataset.internet_years, dataset.internet_values], model_settings('internet'))
+
+def fit_models(dataset):
+    """
+    Fungsi untuk melatih kedua model, atau memuatnya dari cache jika data dan
+    pengaturannya tidak berubah.
+    Parameter:
+        dataset: Dataset hasil load_data
+    Return:
+        Tuple (pop_model_info, internet_model_info)
+    """
+    return fit_population_model(dataset), fit_internet_model(dataset)
+
+def fit_series_models(dataset):
+    """
+    Fungsi untuk melatih model populasi dan internet setiap deret pada data panel,
+    atau memuatnya dari cache jika data dan pengaturannya tidak berubah.
+    Parameter:
+        dataset: Dataset hasil load_data dengan lebih dari satu deret
+    Return:
+        Tuple (list pop_model_info, list internet_model_info), satu per deret; deret yang
+        tidak dapat di-fit memiliki parameter NaN
+    """
+    from population_model import train_population_models_batch
+    from internet_usage_model import train_internet_models_parallel
+    from model_cache import cached_train
     
-    # Memvisualisasikan model internet
-    plot_internet_model(data_dict['internet_years'], data_dict['internet_values'], 
-                       internet_model_info['function'], 
-                       [internet_model_info['L'], internet_model_info['k'], internet_model_info['x0']])
+    year_axis, pop_grid = dataset.to_grid(dataset.population)
+    _, internet_grid = dataset.to_grid(dataset.internet)
+    pop_models = cached_train(train_population_models_batch, 'population_batch', 
+                              [year_axis, pop_grid], model_settings('population'))
+    internet = cached_train(train_internet_models_parallel, 'internet_batch', 
+                            [year_axis, internet_grid], model_settings('internet'))
+    internet_models = [{'L': L, 'k': k, 'x0': x0} for L, k, x0 in internet['params']]
+    return pop_models, internet_models
+
+def _load_models(args):
+    """
+    Fungsi untuk memuat model dari file JSON, atau melatihnya (melalui cache) jika file
+    belum ada atau model di dalamnya dilatih dari data atau versi model yang berbeda.
+    """
+    from model_cache import load_models_json, save_models_json
     
-    # Mengestimasi nilai yang hilang
+    if os.path.exists(args.models):
+        models = load_models_json(args.models, args.csv if os.path.exists(args.csv) else None)
+        if models is not None:
+            return models
+        logger.info("File model %s usang, model dilatih ulang", args.models)
+    
+    from data_loader import load_data
+    pop_model_info, internet_model_info = fit_models(load_data(args.csv, use_store=True))
+    save_models_json(args.models, pop_model_info, internet_model_info, source_path=args.csv)
+    return pop_model_info, internet_model_info
+
+def cmd_load(args):
+    """Subperintah load: memuat data dan menampilkan diagnostik."""
+    from data_loader import load_data
+    
+    dataset = load_data(args.csv, chunksize=args.chunksize, diagnostics=args.diagnostics, 
+                          use_store=args.chunksize is None)
+    print(f"Baris data: {len(dataset.all_years)}, deret: {len(dataset.series_labels)}, "
+          f"nilai hilang: {len(dataset.missing_index)}")
+
+def cmd_fit(args):
+    """Subperintah fit: melatih kedua model dan menyimpan koefisiennya ke file JSON."""
+    from data_loader import load_data
+    from model_cache import save_models_json
+    
+    pop_model_info, internet_model_info = fit_models(load_data(args.csv, use_store=True))
+    save_models_json(args.models, pop_model_info, internet_model_info, source_path=args.csv)
+    print(f"Model disimpan ke {args.models}")
+
+def cmd_estimate(args):
+    """Subperintah estimate: mengestimasi nilai yang hilang dan memprediksi nilai masa depan."""
+    import numpy as np
+    from data_loader import load_data
+    from estimation import estimate_missing_values, estimate_missing_values_spline, predict_future_values
+    
+    pop_model_info, internet_model_info = _load_models(args)
+    dataset = load_data(args.csv, use_store=True)
+    future_years = np.array(FUTURE_YEARS)
+    
+    missing_intervals = future_intervals = None
+    if args.bootstrap:
+        from bootstrap import bootstrap_intervals
+        
+        # Satu kali bootstrap untuk tahun yang hilang dan tahun prediksi sekaligus
+        missing_years = dataset.missing_years_array
+        intervals = bootstrap_intervals(dataset.pop_years, dataset.pop_values, 
+                                        dataset.internet_years, dataset.internet_values, 
+                                        pop_model_info, internet_model_info, 
+                                        np.concatenate([missing_years, future_years]), 
+                                        n_boot=args.bootstrap)
+        missing_intervals = {key: values[:len(missing_years)] for key, values in intervals.items()}
+        future_intervals = {key: values[len(missing_years):] for key, values in intervals.items()}
+    
+    if args.method == 'model':
+        estimate_missing_values(pop_model_info, internet_model_info, dataset.missing_index, 
+                                intervals=missing_intervals)
+    else:
+        # Interval bootstrap hanya berlaku untuk estimasi berbasis model
+        estimate_missing_values_spline(dataset, method=args.method)
+    
+    monte_carlo = None
+    if args.monte_carlo:
+        from monte_carlo import simulate_internet_users
+        monte_carlo = simulate_internet_users(pop_model_info, internet_model_info, future_years, 
+                                              n_draws=args.monte_carlo, seed=args.seed)
+    predict_future_values(pop_model_info, internet_model_info, future_years, intervals=future_intervals, 
+                          monte_carlo=monte_carlo)
+
+def cmd_predict(args):
+    """Subperintah predict: memprediksi nilai masa depan dari koefisien tersimpan (hanya NumPy)."""
+    from predictors import LogisticPredictor, population_predictor
+    
+    # Tanpa file model, model dilatih sekali dan disimpan (modul berat hanya diimpor saat itu)
+    pop_model_info, internet_model_info = _load_models(args)
+    pop_predictor = population_predictor(pop_model_info)
+    internet_predictor = LogisticPredictor.from_model_info(internet_model_info)
+    
+    for year in args.years:
+        population = pop_predictor.predict_one(year)
+        percentage = internet_predictor.predict_one(year)
+        print(f"   {year}: Populasi = {int(population):,} jiwa, Internet = {percentage:.2f}%, "
+              f"Pengguna = {int(percentage / 100 * population):,} jiwa")
+
+def cmd_forecast(args):
+    """Subperintah forecast: menulis tabel prediksi untuk rentang tahun ke file CSV/Parquet."""
+    import numpy as np
+    from forecast import write_forecast_table
+    
+    pop_model_info, internet_model_info = _load_models(args)
+    years = np.arange(args.start, args.end + 1, args.step)
+    result = write_forecast_table(pop_model_info, internet_model_info, years, args.output, 
+                                  chunk_rows=args.chunk_rows)
+    print(f"{result['rows']} baris prediksi ditulis ke {result['path']} ({result['chunks']} chunk)")
+
+def cmd_plot(args):
+    """Subperintah plot: menyimpan kelima grafik (setiap deret) ke direktori keluaran."""
+    import numpy as np
+    from data_loader import load_data
+    from estimation import estimate_missing_values, predict_future_values
+    from visualization import render_series_charts, render_charts_parallel, series_chart_data
+    
+    dataset = load_data(args.csv, use_store=True)
+    future_years = np.array(FUTURE_YEARS)
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    if len(dataset.series_labels) > 1:
+        # Data panel: model per deret dan grafik setiap deret digambar paralel oleh process pool
+        pop_models, internet_models = fit_series_models(dataset)
+        estimation_results = estimate_missing_values(pop_models, internet_models, dataset.missing_index)
+        paths = render_charts_parallel(
+            series_chart_data(dataset, pop_models, internet_models, estimation_results, future_years), 
+            args.output_dir, processes=args.processes)
+        print("\n".join(paths))
+        return
+    
+    pop_model_info, internet_model_info = _load_models(args)
+    estimation_results = estimate_missing_values(pop_model_info, internet_model_info, 
+                                               dataset.missing_index)
+    prediction_results = predict_future_values(pop_model_info, internet_model_info, future_years)
+    
+    paths = render_series_charts({
+        'pop_years': dataset.pop_years,
+        'pop_values': dataset.pop_values,
+        'internet_years': dataset.internet_years,
+        'internet_values': dataset.internet_values,
+        'pop_model_info': pop_model_info,
+        'internet_model_info': internet_model_info,
+        'missing_years': dataset.missing_years_array,
+        'estimated_population': estimation_results['estimated_population'],
+        'estimated_internet': estimation_results['estimated_internet'],
+        'future_years': future_years,
+        'predicted_population': prediction_results['predicted_population'],
+        'predicted_internet_percentage': prediction_results['predicted_internet_percentage'],
+        'all_years': dataset.all_years
+    }, args.output_dir)
+    print("\n".join(paths))
+
+def cmd_summary(args):
+    """Subperintah summary: mencetak ringkasan hasil analisis."""
+    import numpy as np
+    from data_loader import load_data
+    from estimation import estimate_missing_values, predict_future_values, print_summary
+    
+    pop_model_info, internet_model_info = _load_models(args)
+    dataset = load_data(args.csv, use_store=True)
     estimation_results = estimate_missing_values(pop_model_info, internet_model_info, 
-                                               data_dict['missing_years'], 
-                                               data_dict['missing_years_array'])
-    
-    # Memprediksi nilai masa depan
-    future_years_array = np.array([2030, 2035])
-    prediction_results = predict_future_values(pop_model_info, internet_model_info, future_years_array)
-    
-    # Memvisualisasikan dengan estimasi dan prediksi
-    plot_population_with_estimates(data_dict['pop_years'], data_dict['pop_values'], 
-                                  pop_model_info, data_dict['missing_years'], 
-                                  estimation_results['estimated_population'], 
-                                  future_years_array.reshape(-1, 1), 
-                                  prediction_results['predicted_population'], 
-                                  data_dict['all_years'])
-    
-    plot_internet_with_estimates(data_dict['internet_years'], data_dict['internet_values'], 
-                                internet_model_info['function'], 
-                                [internet_model_info['L'], internet_model_info['k'], internet_model_info['x0']], 
-                                data_dict['missing_years_array'], 
-                                estimation_results['estimated_internet'], 
-                                future_years_array, 
-                                prediction_results['predicted_internet_percentage'], 
-                                data_dict['all_years'])
-    
-    # Mencetak ringkasan
+                                               dataset.missing_index)
+    prediction_results = predict_future_values(pop_model_info, internet_model_info, 
+                                               np.array(FUTURE_YEARS))
     print_summary(pop_model_info, internet_model_info, estimation_results, prediction_results)
 
+def check_import_budget(commands=None):
+    """
+    Fungsi untuk memeriksa waktu impor subperintah ringan di interpreter baru.
+    
+    Setiap subperintah pada IMPORT_BUDGETS mengimpor modul-modulnya dalam proses
+    Python terpisah. Pemeriksaan gagal jika waktunya melebihi batas atau jika salah
+    satu modul berat ikut terimpor.
+    Parameter:
+        commands: List subperintah yang diperiksa (opsional, bawaan semua pada IMPORT_BUDGETS)
+    Return:
+        True jika semua subperintah memenuhi batas
+    """
+    ok = True
+    for command in commands or IMPORT_BUDGETS:
+        script = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"for name in {COMMAND_MODULES[command]!r}: __import__(name)\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+            "print(elapsed, ','.join(heavy))\n"
+        )
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, 
+                                check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        elapsed, _, heavy = output.stdout.strip().partition(' ')
+        elapsed = float(elapsed)
+        
+        budget = IMPORT_BUDGETS[command]
+        passed = elapsed <= budget and not heavy
+        ok = ok and passed
+        status = 'OK' if passed else 'GAGAL'
+        print(f"{command}: impor {elapsed:.3f} s (batas {budget:.3f} s) {status}"
+              + (f", modul berat: {heavy}" if heavy else ''))
+    return ok
+
+def build_parser():
+    """
+    Fungsi untuk membuat parser argumen baris perintah.
+    """
+    parser = argparse.ArgumentParser(description='Analisis populasi dan pengguna internet Indonesia')
+    parser.add_argument('--check-import-budget', action='store_true', 
+                        help='Memeriksa waktu impor subperintah ringan lalu keluar')
+    parser.add_argument('--log-level', default='INFO', 
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], 
+                        help='Tingkat log keluaran konsol (WARNING untuk mode senyap)')
+    parser.add_argument('--metrics', default=None, 
+                        help='File JSON lines untuk record waktu dan metrik setiap tahap')
+    parser.add_argument('--track-memory', action='store_true', 
+                        help='Menyertakan puncak memori proses selama setiap tahap dalam record '
+                             'metrik (tahap dijalankan berurutan)')
+    parser.add_argument('--jobs', type=int, default=None, 
+                        help='Jumlah tahap alur analisis yang berjalan bersamaan (1 = berurutan)')
+    parser.add_argument('--force', action='store_true', 
+                        help='Menjalankan ulang semua tahap alur analisis tanpa cache tahap')
+    parser.add_argument('--output-dir', dest='pipeline_output_dir', default=None, 
+                        help='Menyimpan grafik alur analisis sebagai PNG di direktori ini '
+                             '(headless, grafik dibuat paralel) alih-alih menampilkannya')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    load_parser = subparsers.add_parser('load', help='Memuat data dan menampilkan diagnostik')
+    load_parser.add_argument('--diagnostics', type=int, default=1)
+    load_parser.add_argument('--chunksize', type=int, default=None)
+    
+    subparsers.add_parser('fit', help='Melatih model dan menyimpan koefisien')
+    estimate_parser = subparsers.add_parser('estimate', help='Mengestimasi nilai yang hilang dan masa depan')
+    estimate_parser.add_argument('--bootstrap', type=int, default=0, 
+                                 help='Jumlah sampel bootstrap untuk interval kepercayaan')
+    estimate_parser.add_argument('--method', choices=['model', 'pchip', 'linear'], default='model', 
+                                 help='Pengisian nilai hilang dengan model global atau interpolasi lokal')
+    estimate_parser.add_argument('--monte-carlo', type=int, default=0, 
+                                 help='Jumlah draw Monte Carlo untuk kuantil jumlah pengguna internet')
+    estimate_parser.add_argument('--seed', type=int, default=0, help='Seed simulasi Monte Carlo')
+    
+    predict_parser = subparsers.add_parser('predict', help='Memprediksi nilai masa depan')
+    predict_parser.add_argument('years', type=int, nargs='*', default=FUTURE_YEARS)
+    
+    forecast_parser = subparsers.add_parser('forecast', help='Menulis tabel prediksi ke file CSV/Parquet')
+    forecast_parser.add_argument('output', help='File keluaran (.csv atau .parquet)')
+    forecast_parser.add_argument('--start', type=int, default=2024)
+    forecast_parser.add_argument('--end', type=int, default=2100)
+    forecast_parser.add_argument('--step', type=int, default=1)
+    forecast_parser.add_argument('--chunk-rows', type=int, default=1_000_000)
+    
+    plot_parser = subparsers.add_parser('plot', help='Menyimpan grafik ke file')
+    plot_parser.add_argument('--output-dir', required=True)
+    plot_parser.add_argument('--processes', type=int, default=None, 
+                             help='Jumlah proses pekerja untuk grafik data panel (bawaan jumlah CPU)')
+    
+    subparsers.add_parser('summary', help='Mencetak ringkasan hasil analisis')
+    
+    for subparser in subparsers.choices.values():
+        subparser.add_argument('--csv', default=DATA_FILE)
+        subparser.add_argument('--models', default=MODELS_FILE)
+    return parser
+
+COMMANDS = {
+    'load': cmd_load,
+    'fit': cmd_fit,
+    'estimate': cmd_estimate,
+    'predict': cmd_predict,
+    'forecast': cmd_forecast,
+    'plot': cmd_plot,
+    'summary': cmd_summary
+}
+
+def main(argv=None):
+    """
+    Titik masuk baris perintah. Tanpa subperintah, seluruh alur analisis dijalankan.
+    Parameter:
+        argv: List argumen (opsional, bawaan sys.argv)
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=args.log_level, format='%(message)s', stream=sys.stdout)
+    if args.metrics is not None:
+        import instrumentation
+        instrumentation.configure(instrumentation.JsonLinesSink(args.metrics), 
+                                  track_memory=args.track_memory)
+    if args.check_import_budget:
+        sys.exit(0 if check_import_budget() else 1)
+    if args.command is None:
+        run_pipeline(output_dir=args.pipeline_output_dir, jobs=args.jobs, use_cache=not args.force)
+    else:
+        COMMANDS[args.command](args)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Lokasi dan batas ukuran bawaan cache model
+DEFAULT_CACHE_DIR = '.model_cache'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Dinaikkan jika isi hasil train_* berubah sehingga entri lama tidak terpakai lagi
+CACHE_VERSION = 9
+
+def model_cache_key(model_type, arrays, settings):
+    """
+    Fungsi untuk menghitung kunci cache dari data masukan, jenis model dan pengaturannya.
+    Parameter:
+        model_type: Nama jenis model (misalnya 'population' atau 'internet')
+        arrays: List array masukan untuk fungsi training
+        settings: Dictionary pengaturan model (misalnya derajat, p0, bounds)
+    Return:
+        String heksadesimal SHA-256
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([CACHE_VERSION, model_type, settings], sort_keys=True, 
+                             default=list).encode())
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f'{array.dtype.str}{array.shape}'.encode())
+        digest.update(array.data)
+    return digest.hexdigest()
+
+def load_cached_model(key, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Fungsi untuk memuat model dari cache.
+    
+    Waktu modifikasi file diperbarui setiap kali dibaca sehingga urutan eviksi
+    mengikuti waktu terakhir digunakan (LRU).
+    Parameter:
+        key: Kunci cache dari model_cache_key
+        cache_dir: Direktori cache
+    Return:
+        Informasi model yang tersimpan, atau None jika tidak ada di cache
+    """
+    path = os.path.join(cache_dir, f'{key}.pkl')
+    try:
+        with open(path, 'rb') as f:
+            model_info = pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+    os.utime(path)
+    return model_info
+
+def _evict(cache_dir, max_bytes, keep):
+    """
+    Fungsi untuk menghapus entri cache yang paling lama tidak digunakan
+    sampai ukuran total cache tidak melebihi max_bytes.
+    """
+    # Tahap fitting dapat berjalan bersamaan, sehingga entri dapat dihapus oleh
+    # thread atau proses lain di antara listdir, stat dan remove
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.pkl'):
+            try:
+                stat = os.stat(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        if name == keep:
+            continue
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+
+def store_cached_model(key, model_info, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Fungsi untuk menyimpan model ke cache lalu menjalankan eviksi LRU.
+    Parameter:
+        key: Kunci cache dari model_cache_key
+        model_info: Dictionary hasil train_population_model atau train_internet_model
+        cache_dir: Direktori cache
+        max_bytes: Batas ukuran total cache (byte)
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    name = f'{key}.pkl'
+    path = os.path.join(cache_dir, name)
+    
+    # Ditulis ke file sementara dahulu agar pembaca lain tidak melihat file setengah jadi
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(model_info, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+    
+    _evict(cache_dir, max_bytes, keep=name)
+
+def cached_train(train_function, model_type, arrays, settings, cache_dir=DEFAULT_CACHE_DIR, 
+                 max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Fungsi untuk melatih model atau memuatnya dari cache jika data dan pengaturannya sama.
+    Parameter:
+        train_function: Fungsi training (train_population_model atau train_internet_model)
+        model_type: Nama jenis model untuk kunci cache
+        arrays: List array masukan yang diteruskan ke train_function
+        settings: Dictionary pengaturan yang diteruskan sebagai keyword argument
+        cache_dir: Direktori cache
+        max_bytes: Batas ukuran total cache (byte)
+    Return:
+        Dictionary informasi model
+    """
+    key = model_cache_key(model_type, arrays, settings)
+    model_info = load_cached_model(key, cache_dir)
+    if model_info is not None:
+        logger.info("Model %s dimuat dari cache", model_type)
+        return model_info
+    
+    model_info = train_function(*arrays, **settings)
+    store_cached_model(key, model_info, cache_dir, max_bytes)
+    return model_info
+
+# Kunci berisi objek Python (fungsi logistik) yang tidak disimpan ke file JSON
+JSON_EXCLUDED_KEYS = ('function',)
+
+def _json_models(model_info):
+    """
+    Fungsi untuk membuang kunci JSON_EXCLUDED_KEYS dari dictionary model (atau list dictionary).
+    """
+    if isinstance(model_info, dict):
+        return {key: value for key, value in model_info.items() if key not in JSON_EXCLUDED_KEYS}
+    return [_json_models(model) for model in model_info]
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Tipe {type(value).__name__} tidak dapat disimpan sebagai JSON")
+
+def save_models_json(path, pop_model_info, internet_model_info, source_path=None):
+    """
+    Fungsi untuk menyimpan koefisien model ke file JSON yang ringan dibaca.
+    
+    Berbeda dengan cache pickle, file ini dapat dibaca tanpa mengimpor modul training
+    sehingga perintah prediksi dapat berjalan hanya dengan NumPy. Identitas file data
+    sumber dan CACHE_VERSION dicatat agar model yang sudah usang dapat dikenali.
+    Parameter:
+        path: Path file JSON
+        pop_model_info: Dictionary hasil train_population_model
+        internet_model_info: Dictionary hasil train_internet_model
+        source_path: Path file CSV yang digunakan untuk melatih model (opsional)
+    """
+    from data_store import source_identity
+    
+    with open(path, 'w') as f:
+        json.dump({'population': _json_models(pop_model_info), 
+                   'internet': _json_models(internet_model_info),
+                   'cache_version': CACHE_VERSION,
+                   'source': source_identity(source_path) if source_path is not None else None}, f, 
+                  default=_to_json, indent=2)
+
+def load_models_json(path, source_path=None):
+    """
+    Fungsi untuk memuat koefisien model dari file JSON hasil save_models_json.
+    Parameter:
+        path: Path file JSON
+        source_path: Jika diisi, model hanya dikembalikan bila dilatih dari isi file ini
+                     dengan CACHE_VERSION yang sama (opsional)
+    Return:
+        Tuple (pop_model_info, internet_model_info), atau None jika model sudah usang
+    """
+    from data_store import source_unchanged
+    
+    with open(path) as f:
+        models = json.load(f)
+    if source_path is not None:
+        if models.get('cache_version') != CACHE_VERSION or models.get('source') is None:
+            return None
+        if not source_unchanged(models['source'], source_path):
+            return None
+    return models['population'], models['internet']
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from predictors import population_predictor
+from instrumentation import instrumented, record_metrics
+
+# Kuantil bawaan: interval 95% dan median
+DEFAULT_QUANTILES = (0.025, 0.5, 0.975)
+
+# Jumlah sel (draw × tahun) maksimum yang dievaluasi sekaligus; membatasi memori
+# per blok sekitar 8 array float64 berukuran ini
+DEFAULT_MAX_CELLS = 4_000_000
+
+def _covariance_factor(covariance):
+    """
+    Fungsi untuk menghitung faktor A sehingga A @ A.T = covariance.
+    Dekomposisi eigen digunakan agar kovariansi semi-definit (misalnya dari Jacobian
+    yang singular) tetap dapat disampel.
+    Parameter:
+        covariance: Matriks kovariansi (3 × 3)
+    Return:
+        Matriks faktor (3 × 3)
+    """
+    covariance = np.asarray(covariance, dtype=float)
+    if not np.all(np.isfinite(covariance)):
+        raise ValueError("Kovariansi parameter logistik tidak terhingga "
+                         "(data terlalu sedikit untuk jumlah parameter)")
+    eigenvalues, eigenvectors = np.linalg.eigh((covariance + covariance.T) / 2)
+    return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+def _quantile_column(q):
+    return f'Users_Q{100 * q:g}'
+
+@instrumented('simulate_internet_users')
+def simulate_internet_users(pop_model_info, internet_model_info, years, n_draws=1_000_000,
+                            quantiles=DEFAULT_QUANTILES, max_cells=DEFAULT_MAX_CELLS, seed=0):
+    """
+    Fungsi untuk mensimulasikan distribusi jumlah pengguna internet dengan Monte Carlo.
+    
+    Parameter logistik [L, k, x0] disampel dari distribusi normal dengan kovariansi
+    hasil fitting, dan populasi diberi noise normal dengan simpangan baku residual model
+    populasi. Jumlah pengguna = persentase / 100 × populasi dihitung untuk semua draw
+    dan tahun secara tervektorisasi per blok tahun sehingga setiap blok berisi paling
+    banyak max_cells sel.
+    
+    Parameter:
+        pop_model_info: Dictionary informasi model populasi, atau list dictionary (satu per deret)
+        internet_model_info: Dictionary informasi model internet, atau list dictionary (satu per deret)
+        years: Array tahun prediksi
+        n_draws: Jumlah draw Monte Carlo (opsional)
+        quantiles: Kuantil yang dilaporkan (opsional)
+        max_cells: Jumlah sel (draw × tahun) maksimum per blok (opsional)
+        seed: Seed generator acak; hasil sama untuk seed dan n_draws yang sama, berapa
+              pun max_cells (blok tahun memakai aliran bilangan acak yang sama)
+    Return:
+        Dictionary berisi kuantil dan rata-rata jumlah pengguna internet beserta DataFrame hasil
+    """
+    years = np.asarray(years, dtype=float)
+    quantiles = np.asarray(quantiles, dtype=float)
+    single = isinstance(internet_model_info, dict)
+    pop_models = [pop_model_info] if isinstance(pop_model_info, dict) else list(pop_model_info)
+    internet_models = [internet_model_info] if single else list(internet_model_info)
+    if len(pop_models) != len(internet_models):
+        raise ValueError(f"Jumlah model populasi ({len(pop_models)}) dan internet "
+                         f"({len(internet_models)}) tidak sama")
+    
+    n_series = len(internet_models)
+    base_population = population_predictor(pop_models)(years, np.arange(n_series)[:, None])
+    block = max(1, min(len(years), max_cells // max(n_draws, 1)))
+    
+    users_quantiles = np.empty((len(quantiles), n_series, len(years)))
+    users_mean = np.empty((n_series, len(years)))
+    for s, (pop_model, internet_model) in enumerate(zip(pop_models, internet_models)):
+        rng = np.random.default_rng([seed, s])
+        
+        # Sampel parameter logistik, satu set per draw untuk semua tahun
+        mean = np.array([internet_model['L'], internet_model['k'], internet_model['x0']])
+        factor = _covariance_factor(internet_model['covariance'])
+        params = mean + rng.standard_normal((n_draws, 3)) @ factor.T
+        L, k, x0 = params.T
+        noise_std = pop_model.get('residual_std', 0.0)
+        
+        for start in range(0, len(years), block):
+            stop = min(start + block, len(years))
+            
+            # Persentase (blok tahun × n_draws), dibatasi ke rentang 0-100; draw berada
+            # pada sumbu terakhir agar perhitungan kuantil bekerja pada memori kontigu
+            users = np.subtract(years[start:stop, None], x0)
+            users *= -k
+            np.exp(users, out=users)
+            users += 1
+            np.divide(L, users, out=users)
+            np.clip(users, 0, 100, out=users)
+            users /= 100
+            
+            # Populasi dengan noise residual
+            population = rng.standard_normal(users.shape)
+            population *= noise_std
+            population += base_population[s, start:stop, None]
+            users *= population
+            
+            users_quantiles[:, s, start:stop] = np.quantile(users, quantiles, axis=1)
+            users_mean[s, start:stop] = users.mean(axis=1)
+    
+    results_df = pd.DataFrame({
+        'Series': np.repeat(np.arange(n_series), len(years)),
+        'Year': np.tile(years.astype(int), n_series),
+        'Users_Mean': users_mean.ravel(),
+        **{_quantile_column(q): values.ravel() for q, values in zip(quantiles, users_quantiles)}
+    })
+    if single:
+        results_df = results_df.drop(columns='Series')
+        users_quantiles = users_quantiles[:, 0]
+        users_mean = users_mean[0]
+    print(f"\nSimulasi Monte Carlo Pengguna Internet ({n_draws} draw):\n{results_df}")
+    record_metrics(draws=n_draws, series=n_series, cells=n_draws * len(years) * n_series)
+    
+    return {
+        'quantiles': quantiles,
+        'users_quantiles': users_quantiles,
+        'users_mean': users_mean,
+        'results_df': results_df
+    }
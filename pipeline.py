@@ -0,0 +1,194 @@
+import hashlib
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from instrumentation import instrumented, record_metrics, tracks_memory
+from model_cache import load_cached_model, store_cached_model
+
+logger = logging.getLogger(__name__)
+
+# Lokasi bawaan hasil tahap yang disimpan untuk run berikutnya
+DEFAULT_CACHE_DIR = '.pipeline_cache'
+
+# Dinaikkan jika isi hasil tahap berubah sehingga entri lama tidak terpakai lagi
+PIPELINE_VERSION = 2
+
+# Jenis eksekutor tahap:
+#   thread: thread pool (untuk NumPy/SciPy yang melepas GIL)
+#   process: process pool (fungsi dan masukan harus dapat di-pickle)
+#   main: thread utama (misalnya untuk pyplot interaktif atau pencetakan ringkasan)
+EXECUTORS = ('thread', 'process', 'main')
+
+class Stage:
+    """
+    Satu tahap dalam graf alur analisis.
+    """
+    __slots__ = ('name', 'function', 'inputs', 'executor', 'outputs', 'cache', 'params')
+    
+    def __init__(self, name, function, inputs=(), executor='thread', outputs=(), cache=True, 
+                 params=()):
+        """
+        Parameter:
+            name: Nama tahap (unik dalam satu graf)
+            function: Fungsi yang dipanggil dengan hasil tahap-tahap masukan secara berurutan
+            inputs: Nama tahap yang hasilnya menjadi argumen function
+            executor: Tempat tahap dijalankan (lihat EXECUTORS)
+            outputs: Path file yang ditulis oleh tahap; tahap hanya dilewati jika
+                     semua file ini masih ada
+            cache: Jika True, tahap dilewati dan hasilnya dimuat dari cache ketika
+                   kunci tahap (params dan kunci tahap masukan) tidak berubah
+            params: Nilai lain yang menentukan hasil tahap, misalnya file_identity file
+                    masukan atau pengaturan; harus memiliki repr yang stabil
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Eksekutor tidak dikenal: {executor}")
+        self.name = name
+        self.function = function
+        self.inputs = tuple(inputs)
+        self.executor = executor
+        self.outputs = tuple(outputs)
+        self.cache = cache
+        self.params = params
+
+def _topological_order(stages):
+    """
+    Fungsi untuk mengurutkan tahap sehingga setiap tahap berada setelah masukannya.
+    Urutan deklarasi dipertahankan untuk tahap yang saling independen.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    if len(by_name) != len(stages):
+        raise ValueError("Nama tahap harus unik")
+    for stage in stages:
+        unknown = [name for name in stage.inputs if name not in by_name]
+        if unknown:
+            raise ValueError(f"Tahap {stage.name} bergantung pada tahap yang tidak ada: {unknown}")
+    
+    order = []
+    done = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [stage for stage in remaining if all(name in done for name in stage.inputs)]
+        if not ready:
+            raise ValueError(f"Graf tahap memiliki siklus: {[stage.name for stage in remaining]}")
+        for stage in ready:
+            order.append(stage)
+            done.add(stage.name)
+        remaining = [stage for stage in remaining if stage.name not in done]
+    return order
+
+def file_identity(path):
+    """
+    Fungsi untuk membuat identitas file masukan dari path, waktu modifikasi dan ukurannya.
+    Parameter:
+        path: Path file
+    Return:
+        Tuple (path absolut, mtime dalam nanodetik, ukuran byte)
+    """
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+def _stage_key(stage, keys):
+    """
+    Fungsi untuk menghitung kunci tahap dari nama, params dan kunci tahap-tahap masukannya.
+    Hasil tahap tidak ikut di-hash sehingga kunci dapat dihitung tanpa menserialisasi hasil.
+    """
+    digest = hashlib.sha256(f'{PIPELINE_VERSION}:{stage.name}:{stage.params!r}'.encode())
+    for name in stage.inputs:
+        digest.update(keys[name].encode())
+    return digest.hexdigest()
+
+def _run(function, args):
+    return function(*args)
+
+@instrumented('run_stages')
+def run_stages(stages, jobs=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Fungsi untuk menjalankan graf tahap secara konkuren.
+    
+    Setiap tahap dijalankan segera setelah semua tahap masukannya selesai sehingga
+    tahap-tahap yang saling independen berjalan bersamaan dan total waktu mendekati
+    jalur kritis graf. Setiap tahap memiliki kunci yang diturunkan dari params-nya dan
+    kunci tahap masukannya; tahap dengan cache=True dilewati jika kuncinya sama dengan
+    run sebelumnya.
+    
+    Parameter:
+        stages: List Stage
+        jobs: Jumlah pekerja thread/process pool (opsional, bawaan jumlah CPU);
+              jobs=1 menjalankan semua tahap berurutan di thread utama. Jika pengukuran
+              memori aktif, tahap selalu dijalankan berurutan
+        cache_dir: Direktori cache hasil tahap, atau None untuk selalu menjalankan semua tahap
+    Return:
+        Dictionary nama tahap -> hasil
+    """
+    order = _topological_order(stages)
+    if tracks_memory() and jobs != 1:
+        # Puncak tracemalloc berlaku untuk seluruh proses; tahap yang berjalan bersamaan
+        # akan saling mengatur ulang dan mencampur puncaknya
+        logger.info("Pengukuran memori aktif: tahap dijalankan berurutan")
+        jobs = 1
+    results = {}
+    keys = {}
+    pending = list(order)
+    running = {}
+    skipped = 0
+    
+    def complete(stage, result):
+        results[stage.name] = result
+        if cache_dir is not None and stage.cache:
+            # Dibungkus tuple agar hasil None (misalnya tahap grafik) tetap dapat di-cache
+            store_cached_model(keys[stage.name], (result,), cache_dir)
+    
+    thread_pool = ThreadPoolExecutor(max_workers=jobs)
+    process_pool = None
+    try:
+        while pending or running:
+            ready = [stage for stage in pending if all(name in results for name in stage.inputs)]
+            main_stages = []
+            progressed = False
+            for stage in ready:
+                pending.remove(stage)
+                args = [results[name] for name in stage.inputs]
+                
+                keys[stage.name] = _stage_key(stage, keys)
+                if cache_dir is not None and stage.cache:
+                    cached = load_cached_model(keys[stage.name], cache_dir)
+                    if cached is not None and all(os.path.exists(path) for path in stage.outputs):
+                        logger.info("Tahap %s dilewati (masukan tidak berubah)", stage.name)
+                        results[stage.name], = cached
+                        skipped += 1
+                        progressed = True
+                        continue
+                
+                if stage.executor == 'main' or jobs == 1:
+                    main_stages.append((stage, args))
+                elif stage.executor == 'process':
+                    if process_pool is None:
+                        process_pool = ProcessPoolExecutor(max_workers=jobs)
+                    running[process_pool.submit(_run, stage.function, args)] = stage
+                else:
+                    running[thread_pool.submit(_run, stage.function, args)] = stage
+            
+            # Tahap thread utama dijalankan setelah tahap lain yang siap sudah dikirim ke pool
+            for stage, args in main_stages:
+                complete(stage, stage.function(*args))
+                progressed = True
+            
+            # Tahap yang baru selesai dapat membuat tahap lain siap tanpa menunggu pool
+            if progressed:
+                continue
+            if not running:
+                break
+            
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                complete(stage, future.result())
+    finally:
+        for future in running:
+            future.cancel()
+        thread_pool.shutdown()
+        if process_pool is not None:
+            process_pool.shutdown()
+    
+    record_metrics(stages=len(order), skipped=skipped)
+    return results
@@ -0,0 +1,312 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scipy.optimize import least_squares
+from scipy.special import expit
+from population_model import (search_polynomial_degree, polynomial_model_info, population_model_info, 
+                              nan_model_info, information_criterion, residual_std, DEFAULT_DEGREES)
+from predictors import GROWTH_CURVES
+from utils import format_exponential, format_logistic, format_gompertz
+from instrumentation import instrumented, record_metrics
+
+logger = logging.getLogger(__name__)
+
+# Registry keluarga model populasi: nama -> fungsi fitting
+# Fungsi fitting menerima (tahun, nilai, derajat) dan mengembalikan list kandidat
+# berupa tuple (label, jumlah parameter, jumlah kuadrat residual, informasi model)
+POPULATION_FAMILIES = {}
+
+# Kriteria informasi yang didukung untuk memilih model
+CRITERIA = ('aic', 'bic')
+
+# Batas evaluasi fungsi untuk setiap fitting kurva pertumbuhan
+MAX_NFEV = 50
+
+def register_family(name):
+    """
+    Decorator untuk mendaftarkan fungsi fitting sebuah keluarga model populasi.
+    Parameter:
+        name: Nama keluarga model
+    """
+    def decorator(fit_function):
+        POPULATION_FAMILIES[name] = fit_function
+        return fit_function
+    return decorator
+
+def _scale(years, values):
+    """
+    Fungsi untuk memusatkan dan menskalakan tahun serta menormalkan nilai agar
+    fitting nonlinear terkondisi baik.
+    Return:
+        Tuple (tahun terskala, nilai ternormalisasi, pusat tahun, skala tahun, skala nilai)
+    """
+    year_center = years.mean()
+    year_scale = years.std() or 1.0
+    value_scale = np.abs(values).max() or 1.0
+    return (years - year_center) / year_scale, values / value_scale, year_center, year_scale, value_scale
+
+@register_family('polynomial')
+def fit_polynomial_family(years, values, degrees=DEFAULT_DEGREES):
+    """
+    Fungsi fitting keluarga polinomial; setiap derajat menjadi satu kandidat.
+    """
+    degrees = [degree for degree in degrees if degree + 1 < len(values)]
+    if not degrees:
+        return []
+    
+    search = search_polynomial_degree(years, values, degrees)
+    ss_tot = ((values - values.mean()) ** 2).sum()
+    candidates = []
+    for degree, fit in search['fits'].items():
+        r2 = fit['r2'][0]
+        model_info = polynomial_model_info(years, values, search, degree, r2, fit['scaled_coeffs'][0])
+        candidates.append((f'polynomial {degree}', degree + 1, (1 - r2) * ss_tot, model_info))
+    return candidates
+
+def _growth_candidate(family, years, values, initial, bounds, jacobian, format_equation):
+    """
+    Fungsi untuk melakukan fitting satu kurva pertumbuhan (GROWTH_CURVES) dengan
+    least squares pada tahun terskala dan nilai ternormalisasi.
+    Return:
+        List berisi satu kandidat, atau list kosong jika fitting gagal
+    """
+    n_params = len(bounds[0])
+    if len(values) <= n_params:
+        return []
+    scaled_years, scaled_values, year_center, year_scale, value_scale = _scale(years, values)
+    curve = GROWTH_CURVES[family]
+    
+    try:
+        p0 = initial(scaled_years, scaled_values)
+        if not np.all(np.isfinite(p0)):
+            return []
+        p0 = np.clip(p0, np.asarray(bounds[0]) + 1e-12, np.asarray(bounds[1]) - 1e-12)
+        result = least_squares(lambda p: curve(scaled_years, *p) - scaled_values, p0,
+                               jac=lambda p: jacobian(scaled_years, *p), bounds=bounds, method='trf',
+                               x_scale='jac', max_nfev=MAX_NFEV)
+    except (ValueError, np.linalg.LinAlgError):
+        return []
+    # Batas evaluasi tercapai (status 0) biasanya berarti kurva mendekati batas parameter,
+    # misalnya kapasitas logistik tak terhingga pada data eksponensial; parameter terakhir
+    # tetap merupakan kandidat yang sah dengan residual yang lebih besar
+    if result.status < 0 or not np.all(np.isfinite(result.fun)):
+        return []
+    
+    # Parameter amplitudo (indeks 0) dikembalikan ke satuan nilai asli
+    params = np.zeros(3)
+    params[:n_params] = result.x
+    params[0] *= value_scale
+    rss = float(result.fun @ result.fun) * value_scale ** 2
+    ss_tot = ((values - values.mean()) ** 2).sum()
+    
+    model_info = population_model_info(
+        family=family,
+        params=params,
+        r2=1 - rss / ss_tot,
+        equation=format_equation(params, year_center, year_scale),
+        year_center=year_center,
+        year_scale=year_scale,
+        residual_std=residual_std(rss, len(values), n_params),
+        aic=information_criterion(rss, len(values), n_params, 'aic'),
+        bic=information_criterion(rss, len(values), n_params, 'bic')
+    )
+    return [(family, n_params, rss, model_info)]
+
+def _exponential_initial(s, y):
+    slope, intercept = np.polyfit(s, np.log(y), 1)
+    return np.array([np.exp(intercept), slope])
+
+def _exponential_jacobian(s, a, b):
+    growth = np.exp(b * s)
+    return np.column_stack((growth, a * s * growth))
+
+@register_family('exponential')
+def fit_exponential_family(years, values, degrees=None):
+    """
+    Fungsi fitting keluarga eksponensial y = a * exp(b * s).
+    """
+    if np.any(values <= 0):
+        return []
+    return _growth_candidate(
+        'exponential', years, values, _exponential_initial, ([0, -np.inf], [np.inf, np.inf]),
+        _exponential_jacobian,
+        lambda p, center, scale: format_exponential(p[0], p[1] / scale, center))
+
+# Kapasitas awal (kelipatan nilai maksimum) yang dicoba saat linearisasi kurva jenuh
+INITIAL_CAPACITIES = (1.25, 2.0, 5.0, 20.0, 100.0)
+
+def _best_initial(s, y, curve, guesses):
+    """
+    Fungsi untuk memilih tebakan awal dengan residual terkecil dari beberapa linearisasi.
+    """
+    guesses = [p for p in guesses if np.all(np.isfinite(p))]
+    if not guesses:
+        return np.array([np.nan])
+    return min(guesses, key=lambda p: ((curve(s, *p) - y) ** 2).sum())
+
+def _logistic_initial(s, y):
+    # Linearisasi logit log(y / (K - y)) = r * (s - s0) untuk beberapa kapasitas K
+    guesses = []
+    for K in INITIAL_CAPACITIES:
+        slope, intercept = np.polyfit(s, np.log(y / (K - y)), 1)
+        guesses.append(np.array([K, slope, -intercept / slope]))
+    return _best_initial(s, y, GROWTH_CURVES['logistic'], guesses)
+
+def _logistic_jacobian(s, K, r, s0):
+    g = expit(r * (s - s0))
+    dg = K * g * (1 - g)
+    return np.column_stack((g, dg * (s - s0), -dg * r))
+
+@register_family('logistic')
+def fit_logistic_family(years, values, degrees=None):
+    """
+    Fungsi fitting keluarga logistik y = K / (1 + exp(-r * (s - s0))).
+    """
+    if np.any(values <= 0):
+        return []
+    return _growth_candidate(
+        'logistic', years, values, _logistic_initial, ([1.0, 1e-8, -100], [1e3, 100, 100]),
+        _logistic_jacobian,
+        lambda p, center, scale: format_logistic(p[0], p[1] / scale, center + p[2] * scale))
+
+def _gompertz_initial(s, y):
+    # Linearisasi log(-log(y / K)) = log(b) - c * s untuk beberapa kapasitas K
+    guesses = []
+    for K in INITIAL_CAPACITIES:
+        slope, intercept = np.polyfit(s, np.log(-np.log(y / K)), 1)
+        guesses.append(np.array([K, np.exp(intercept), -slope]))
+    return _best_initial(s, y, GROWTH_CURVES['gompertz'], guesses)
+
+def _gompertz_jacobian(s, K, b, c):
+    u = np.exp(-c * s)
+    f = K * np.exp(-b * u)
+    return np.column_stack((f / K, -f * u, f * b * u * s))
+
+@register_family('gompertz')
+def fit_gompertz_family(years, values, degrees=None):
+    """
+    Fungsi fitting keluarga Gompertz y = K * exp(-b * exp(-c * s)).
+    """
+    if np.any(values <= 0):
+        return []
+    return _growth_candidate(
+        'gompertz', years, values, _gompertz_initial, ([1.0, 1e-8, 1e-8], [1e3, 1e6, 100]),
+        _gompertz_jacobian,
+        lambda p, center, scale: format_gompertz(p[0], p[1], p[2] / scale, center))
+
+def _select_model(years, values, families, criterion, degrees):
+    """
+    Fungsi untuk melakukan fitting semua kandidat dari keluarga yang dipilih dan
+    mengembalikan kandidat dengan kriteria informasi terkecil.
+    Return:
+        Tuple (informasi model terbaik atau None, dictionary label kandidat -> nilai kriteria)
+    """
+    scores = {}
+    best_info = None
+    for family in families:
+        for label, n_params, rss, model_info in POPULATION_FAMILIES[family](years, values, degrees):
+            scores[label] = model_info[criterion]
+            if best_info is None or scores[label] < best_info[criterion]:
+                best_info = model_info
+    
+    if best_info is None:
+        return None, scores
+    return {**best_info, 'criterion': criterion}, scores
+
+def _check_selection(families, criterion):
+    families = list(POPULATION_FAMILIES) if families is None else list(families)
+    unknown = [family for family in families if family not in POPULATION_FAMILIES]
+    if unknown:
+        raise ValueError(f"Keluarga model tidak dikenal: {unknown}")
+    if criterion not in CRITERIA:
+        raise ValueError(f"Kriteria informasi tidak dikenal: {criterion}")
+    return families
+
+@instrumented('train_population_model_zoo')
+def train_population_model_zoo(pop_years, pop_values, families=None, criterion='aic',
+                               degrees=DEFAULT_DEGREES):
+    """
+    Fungsi untuk memilih model populasi terbaik dari beberapa keluarga model.
+    
+    Setiap keluarga yang terdaftar pada POPULATION_FAMILIES (polinomial untuk setiap
+    derajat, eksponensial, logistik dan Gompertz) di-fit lalu dinilai dengan AIC atau
+    BIC; kriteria ini menghukum jumlah parameter sehingga model yang lebih sederhana
+    dipilih jika kecocokannya setara.
+    
+    Parameter:
+        pop_years: Array tahun untuk data populasi
+        pop_values: Array nilai populasi
+        families: Nama keluarga yang dicoba (opsional, bawaan semua yang terdaftar)
+        criterion: 'aic' atau 'bic' (opsional)
+        degrees: Derajat polinomial yang dicoba (opsional)
+    Return:
+        Dictionary informasi model terbaik dengan bentuk hasil train_population_model
+        (lihat population_model_info); kurva pertumbuhan memakai params
+    """
+    families = _check_selection(families, criterion)
+    years = np.asarray(pop_years, dtype=float).ravel()
+    values = np.asarray(pop_values, dtype=float)
+    
+    pop_model_info, scores = _select_model(years, values, families, criterion, degrees)
+    for label, score in scores.items():
+        logger.info("Model %s: %s = %.2f", label, criterion.upper(), score)
+    if pop_model_info is None:
+        raise ValueError("Tidak ada keluarga model yang berhasil di-fit")
+    
+    logger.info("Model populasi terbaik: %s dengan %s = %.2f dan R² = %s", pop_model_info['family'],
+                criterion.upper(), pop_model_info[criterion], pop_model_info['r2'])
+    logger.info("Persamaan model populasi:\n%s", pop_model_info['equation'])
+    record_metrics(rows=len(values), candidates=len(scores))
+    return pop_model_info
+
+def _select_models_block(years, values_block, families, criterion, degrees):
+    """
+    Fungsi pekerja untuk memilih model terbaik bagi sekelompok deret.
+    Nilai NaN dianggap sebagai data yang hilang; deret tanpa model yang berhasil
+    mendapat model NaN (lihat nan_model_info).
+    """
+    results = []
+    for values in values_block:
+        valid = ~np.isnan(values)
+        model_info = _select_model(years[valid], values[valid], families, criterion, degrees)[0]
+        results.append(nan_model_info(criterion=criterion) if model_info is None else model_info)
+    return results
+
+@instrumented('train_population_models_zoo')
+def train_population_models_zoo(years, values_matrix, families=None, criterion='aic',
+                                degrees=DEFAULT_DEGREES, processes=None):
+    """
+    Fungsi untuk memilih model populasi terbaik bagi banyak deret secara paralel.
+    
+    Deret dibagi menjadi blok-blok yang dikerjakan oleh process pool; setiap deret
+    dinilai dengan cara yang sama seperti train_population_model_zoo.
+    
+    Parameter:
+        years: Array tahun (kolom matriks nilai)
+        values_matrix: Matriks nilai populasi berukuran (jumlah deret × jumlah tahun),
+                       nilai NaN dianggap sebagai data yang hilang
+        families: Nama keluarga yang dicoba (opsional, bawaan semua yang terdaftar)
+        criterion: 'aic' atau 'bic' (opsional)
+        degrees: Derajat polinomial yang dicoba (opsional)
+        processes: Jumlah proses pekerja (opsional, bawaan jumlah CPU)
+    Return:
+        List dictionary informasi model (satu per deret); deret yang tidak dapat di-fit
+        mendapat model NaN sehingga prediksinya NaN
+    """
+    families = _check_selection(families, criterion)
+    years = np.asarray(years, dtype=float).ravel()
+    values_matrix = np.atleast_2d(np.asarray(values_matrix, dtype=float))
+    n_series = values_matrix.shape[0]
+    record_metrics(rows=values_matrix.size, series=n_series)
+    
+    workers = min(processes or os.cpu_count() or 1, n_series)
+    if workers <= 1:
+        return _select_models_block(years, values_matrix, families, criterion, degrees)
+    
+    blocks = np.array_split(values_matrix, min(n_series, 4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_select_models_block, [years] * len(blocks), blocks,
+                               [families] * len(blocks), [criterion] * len(blocks),
+                               [degrees] * len(blocks))
+        return [model_info for block in results for model_info in block]
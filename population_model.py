@@ -1,64 +1,488 @@
+import logging
 import numpy as np
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
+from math import comb
+from scipy.linalg import solve_triangular
 from utils import format_polynomial
+from instrumentation import instrumented, record_metrics
 
-def train_population_model(pop_years, pop_values):
+logger = logging.getLogger(__name__)
+
+# Derajat polinomial yang dicoba secara bawaan
+DEFAULT_DEGREES = range(2, 6)
+
+# Kunci informasi model populasi; hasil semua keluarga model dan kriteria pemilihan
+# memiliki kunci yang sama (lihat population_model_info)
+MODEL_INFO_KEYS = ('family', 'degree', 'r2', 'coeffs', 'intercept', 'equation', 'scaled_coeffs', 
+                   'params', 'year_center', 'year_scale', 'residual_std', 'aic', 'bic', 'criterion', 
+                   'gram_inverse', 'xty', 'n_obs', 'sum_y', 'sum_y2')
+
+def search_polynomial_degree(years, values_matrix, degrees=DEFAULT_DEGREES):
+    """
+    Fungsi untuk menghitung fitting polinomial semua derajat kandidat dari satu dekomposisi QR.
+    
+    Tahun dipusatkan dan diskalakan (seperti StandardScaler) sebelum matriks Vandermonde
+    derajat tertinggi dibentuk, sehingga matriksnya terkondisi baik. Koefisien dan R²
+    setiap derajat yang lebih rendah diperoleh dari kolom-kolom awal dekomposisi yang sama.
+    
+    Parameter:
+        years: Array tahun (1-D) yang sama untuk semua deret
+        values_matrix: Array nilai (1-D) atau matriks nilai berukuran (jumlah deret × jumlah tahun)
+        degrees: Derajat polinomial yang dicoba
+    Return:
+        Dictionary berisi pusat dan skala tahun, serta koefisien (dalam tahun terskala)
+        dan skor R² setiap deret untuk tiap derajat
+    """
+    years = np.asarray(years, dtype=float).ravel()
+    values_matrix = np.atleast_2d(np.asarray(values_matrix, dtype=float))
+    degrees = [degree for degree in degrees if degree < len(years)]
+    
+    # Menskalakan tahun agar pangkat tinggi tidak menghasilkan angka sebesar 2000^5
+    year_center = years.mean()
+    year_scale = years.std()
+    if year_scale == 0:
+        year_scale = 1.0
+    scaled_years = (years - year_center) / year_scale
+    
+    fits = {}
+    if not degrees:
+        return {'year_center': year_center, 'year_scale': year_scale, 'fits': fits}
+    
+    V = np.vander(scaled_years, max(degrees) + 1, increasing=True)
+    Q, R = np.linalg.qr(V)
+    
+    # Nilai dipusatkan agar R² dihitung dari proyeksi tanpa kehilangan presisi
+    y_mean = values_matrix.mean(axis=1)
+    centered = values_matrix - y_mean[:, None]
+    qty = Q.T @ centered.T
+    explained = np.cumsum(qty ** 2, axis=0)
+    ss_tot = (centered ** 2).sum(axis=1)
+    
+    for degree in degrees:
+        scaled_coeffs = solve_triangular(R[:degree + 1, :degree + 1], qty[:degree + 1]).T
+        scaled_coeffs[:, 0] += y_mean
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r2 = explained[degree] / ss_tot
+        fits[degree] = {'scaled_coeffs': scaled_coeffs, 'r2': r2}
+    
+    return {'year_center': year_center, 'year_scale': year_scale, 'fits': fits}
+
+def unscale_polynomial(scaled_coeffs, year_center, year_scale):
+    """
+    Fungsi untuk mengubah koefisien polinomial dalam tahun terskala menjadi koefisien
+    dalam tahun asli, dengan bentuk yang sama seperti coef_ dan intercept_ LinearRegression.
+    
+    Parameter:
+        scaled_coeffs: Koefisien terhadap (tahun - year_center) / year_scale, dari pangkat 0
+                       (1-D untuk satu deret atau 2-D untuk banyak deret)
+        year_center: Pusat tahun yang digunakan saat fitting
+        year_scale: Skala tahun yang digunakan saat fitting
+    Return:
+        Tuple (koefisien, intercept) dengan koefisien pangkat 0 bernilai 0
+    """
+    scaled_coeffs = np.asarray(scaled_coeffs, dtype=float)
+    n_terms = scaled_coeffs.shape[-1]
+    
+    # Ekspansi binomial dari ((x - c) / s)^i
+    transform = np.zeros((n_terms, n_terms))
+    for i in range(n_terms):
+        for j in range(i + 1):
+            transform[i, j] = comb(i, j) * (-year_center) ** (i - j) / year_scale ** i
+    
+    raw = scaled_coeffs @ transform
+    intercept = raw[..., 0].copy()
+    raw[..., 0] = 0.0
+    return raw, intercept
+
+@instrumented('train_population_model')
+def train_population_model(pop_years, pop_values, degrees=DEFAULT_DEGREES, selection='r2'):
     """
     Fungsi untuk melatih model regresi polinomial untuk data populasi.
     
     Fungsi ini akan mencoba beberapa derajat polinomial (2-5) dan memilih
-    yang terbaik berdasarkan skor R².
+    yang terbaik berdasarkan skor R², atau berdasarkan galat prediksi di luar
+    sampel (rolling_origin_backtest) jika selection='backtest'. Semua derajat
+    dihitung dari satu dekomposisi QR pada tahun yang sudah dipusatkan dan diskalakan.
+    Dengan selection='aic' atau 'bic', keluarga model lain (eksponensial, logistik,
+    Gompertz) ikut dibandingkan melalui train_population_model_zoo.
     
     Parameter:
         pop_years: Array tahun untuk data populasi
         pop_values: Array nilai populasi
+        degrees: Derajat polinomial yang dicoba (opsional)
+        selection: Kriteria pemilihan, 'r2', 'backtest', 'aic' atau 'bic' (opsional)
     Return:
-        Dictionary berisi model terbaik dan informasi terkait
+        Dictionary berisi model terbaik dan informasi terkait. Koefisien dalam tahun
+        terskala (scaled_coeffs, year_center, year_scale) digunakan oleh PolynomialPredictor.
     """
+    if selection in ('aic', 'bic'):
+        from population_families import train_population_model_zoo
+        return train_population_model_zoo(pop_years, pop_values, degrees=degrees, criterion=selection)
+    
     best_pop_degree = 0
     best_pop_r2 = 0
-    best_model = None
-    best_poly_features = None
+    best_scaled_coeffs = None
     
     # Mencoba berbagai derajat polinomial untuk menemukan yang terbaik
-    for degree in range(2, 6):
-        poly_features = PolynomialFeatures(degree=degree)
-        X_poly = poly_features.fit_transform(pop_years)
-        
-        model = LinearRegression()
-        model.fit(X_poly, pop_values)
-        
-        y_pred = model.predict(X_poly)
-        r2 = r2_score(pop_values, y_pred)
+    search = search_polynomial_degree(pop_years, pop_values, degrees)
+    for degree, fit in search['fits'].items():
+        r2 = fit['r2'][0]
         
-        print(f"Derajat {degree}: R² = {r2}")
+        logger.info("Derajat %d: R² = %s", degree, r2)
         
         if r2 > best_pop_r2:
             best_pop_degree = degree
             best_pop_r2 = r2
-            best_model = model
-            best_poly_features = poly_features
+            best_scaled_coeffs = fit['scaled_coeffs'][0]
     
-    print(f"Derajat polinomial terbaik untuk populasi: {best_pop_degree} dengan R² = {best_pop_r2}")
+    if selection == 'backtest':
+        from backtesting import rolling_origin_backtest
+        
+        # Memilih derajat dengan galat prediksi di luar sampel terkecil
+        backtest = rolling_origin_backtest(pop_years, pop_values, degrees=list(search['fits']), 
+                                           include_logistic=False)
+        for degree, rmse in backtest['rmse'].items():
+            logger.info("Derajat %d: RMSE backtest = %s", degree, rmse)
+        best_pop_degree = backtest['best']
+        best_pop_r2 = search['fits'][best_pop_degree]['r2'][0]
+        best_scaled_coeffs = search['fits'][best_pop_degree]['scaled_coeffs'][0]
+    elif selection != 'r2':
+        raise ValueError(f"Kriteria pemilihan tidak dikenal: {selection}")
     
-    # Mendapatkan koefisien untuk model terbaik
-    pop_coeffs = best_model.coef_
-    pop_intercept = best_model.intercept_
+    logger.info("Derajat polinomial terbaik untuk populasi: %d dengan R² = %s", best_pop_degree, best_pop_r2)
     
-    # Membuat persamaan
-    pop_equation = format_polynomial(pop_coeffs, pop_intercept, best_pop_degree)
-    print("Persamaan polinomial populasi:")
-    print(pop_equation)
+    record_metrics(rows=len(pop_values), degree=best_pop_degree)
+    pop_model_info = polynomial_model_info(pop_years, pop_values, search, best_pop_degree, 
+                                           best_pop_r2, best_scaled_coeffs, selection)
+    logger.info("Persamaan polinomial populasi:\n%s", pop_model_info['equation'])
     
     # Mengembalikan informasi model
+    return pop_model_info
+
+def sklearn_model(pop_model_info):
+    """
+    Fungsi untuk membuat model scikit-learn yang setara dengan model polinomial, untuk
+    kode lama yang memakai model LinearRegression dan fitur polinomial.
+    
+    Model tidak dibuat saat training agar train_population_model dan
+    update_population_model tetap ringan; panggil fungsi ini hanya jika diperlukan.
+    Fitur dibuat dengan StandardScaler (pusat dan skala tahun yang sama) lalu
+    PolynomialFeatures; LinearRegression di-fit tepat pada degree + 1 titik dari polinomial
+    sehingga koefisiennya sama dengan scaled_coeffs.
+    Parameter:
+        pop_model_info: Dictionary informasi model polinomial dari train_population_model
+    Return:
+        Tuple (LinearRegression, pipeline fitur)
+    """
+    from sklearn.linear_model import LinearRegression
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+    
+    degree = pop_model_info['degree']
+    year_center = pop_model_info['year_center']
+    year_scale = pop_model_info['year_scale']
+    poly_features = make_pipeline(StandardScaler(), PolynomialFeatures(degree=degree))
+    poly_features.fit(np.array([[year_center - year_scale], [year_center + year_scale]]))
+    
+    scaled_points = np.linspace(-1, 1, degree + 1)
+    points = np.polynomial.polynomial.polyval(scaled_points, pop_model_info['scaled_coeffs'])
+    model = LinearRegression().fit(
+        poly_features.transform((year_center + year_scale * scaled_points).reshape(-1, 1)), points)
+    return model, poly_features
+
+def residual_std(rss, n_obs, n_params):
+    """
+    Fungsi untuk menghitung simpangan baku residual dengan koreksi derajat bebas.
+    Parameter:
+        rss: Jumlah kuadrat residual
+        n_obs: Jumlah observasi
+        n_params: Jumlah parameter model
+    Return:
+        Simpangan baku residual (float)
+    """
+    return float(np.sqrt(max(rss, 0.0) / max(n_obs - n_params, 1)))
+
+def information_criterion(rss, n_obs, n_params, criterion):
+    """
+    Fungsi untuk menghitung AIC atau BIC model least squares dengan galat Gaussian.
+    Parameter:
+        rss: Jumlah kuadrat residual
+        n_obs: Jumlah observasi
+        n_params: Jumlah parameter model
+        criterion: 'aic' atau 'bic'
+    Return:
+        Nilai kriteria (semakin kecil semakin baik)
+    """
+    log_likelihood_term = n_obs * np.log(max(rss, np.finfo(float).tiny) / n_obs)
+    if criterion == 'aic':
+        return log_likelihood_term + 2 * n_params
+    if criterion == 'bic':
+        return log_likelihood_term + n_params * np.log(n_obs)
+    raise ValueError(f"Kriteria informasi tidak dikenal: {criterion}")
+
+def population_model_info(**fields):
+    """
+    Fungsi untuk menyusun dictionary informasi model populasi dengan kunci MODEL_INFO_KEYS.
+    
+    Semua hasil train_population_model (apa pun kriteria pemilihannya),
+    train_population_models_batch dan train_population_models_zoo dibentuk di sini.
+    Kunci yang tidak berlaku untuk sebuah model bernilai NaN: polinomial NaN berderajat 0
+    untuk kurva pertumbuhan (prediksinya memakai params) dan params NaN untuk polinomial.
+    Statistik pembaruan bertahap berupa array kosong jika model tidak mendukung
+    update_population_model.
+    Parameter:
+        **fields: Nilai kunci yang berlaku untuk model ini
+    Return:
+        Dictionary informasi model populasi
+    """
+    unknown = sorted(set(fields) - set(MODEL_INFO_KEYS))
+    if unknown:
+        raise ValueError(f"Kunci informasi model tidak dikenal: {unknown}")
+    
+    year_center = fields.get('year_center', 0.0)
+    year_scale = fields.get('year_scale', 1.0)
+    scaled_coeffs = np.array([np.nan])
+    coeffs, intercept = unscale_polynomial(scaled_coeffs, year_center, year_scale)
+    model_info = {
+        'family': 'polynomial',
+        'degree': 0,
+        'r2': np.nan,
+        'coeffs': coeffs,
+        'intercept': intercept,
+        'equation': None,
+        'scaled_coeffs': scaled_coeffs,
+        'params': np.full(3, np.nan),
+        'year_center': year_center,
+        'year_scale': year_scale,
+        'residual_std': np.nan,
+        'aic': np.nan,
+        'bic': np.nan,
+        'criterion': 'r2',
+        'gram_inverse': np.empty((0, 0)),
+        'xty': np.empty(0),
+        'n_obs': 0,
+        'sum_y': 0.0,
+        'sum_y2': 0.0
+    }
+    model_info.update(fields)
+    return model_info
+
+def polynomial_model_info(pop_years, pop_values, search, degree, r2, scaled_coeffs, criterion='r2'):
+    """
+    Fungsi untuk menyusun dictionary informasi model polinomial dari hasil search_polynomial_degree.
+    Parameter:
+        pop_years: Array tahun untuk data populasi
+        pop_values: Array nilai populasi
+        search: Hasil search_polynomial_degree untuk deret ini
+        degree: Derajat terpilih
+        r2: Skor R² derajat terpilih
+        scaled_coeffs: Koefisien dalam tahun terskala untuk derajat terpilih
+        criterion: Kriteria yang dipakai untuk memilih model (opsional)
+    Return:
+        Dictionary informasi model dengan bentuk hasil train_population_model
+    """
+    # Statistik cukup untuk pembaruan bertahap (lihat update_population_model)
+    scaled_years = (np.asarray(pop_years, dtype=float).ravel() - search['year_center']) / search['year_scale']
+    V = np.vander(scaled_years, degree + 1, increasing=True)
+    _, R = np.linalg.qr(V)
+    R_inv = solve_triangular(R, np.eye(degree + 1))
+    pop_values = np.asarray(pop_values, dtype=float)
+    ss_tot = ((pop_values - pop_values.mean()) ** 2).sum()
+    rss = (1 - r2) * ss_tot
+    
+    # Mendapatkan koefisien dalam tahun asli
+    pop_coeffs, pop_intercept = unscale_polynomial(scaled_coeffs, search['year_center'], 
+                                                  search['year_scale'])
+    
+    return population_model_info(
+        degree=degree,
+        r2=r2,
+        coeffs=pop_coeffs,
+        intercept=pop_intercept,
+        equation=format_polynomial(pop_coeffs, pop_intercept, degree),
+        scaled_coeffs=scaled_coeffs,
+        year_center=search['year_center'],
+        year_scale=search['year_scale'],
+        residual_std=residual_std(rss, len(pop_values), degree + 1),
+        aic=information_criterion(rss, len(pop_values), degree + 1, 'aic'),
+        bic=information_criterion(rss, len(pop_values), degree + 1, 'bic'),
+        criterion=criterion,
+        gram_inverse=R_inv @ R_inv.T,
+        xty=V.T @ pop_values,
+        n_obs=len(pop_values),
+        sum_y=pop_values.sum(),
+        sum_y2=pop_values @ pop_values
+    )
+
+def update_population_model(pop_model_info, new_years, new_values):
+    """
+    Fungsi untuk memperbarui model polinomial dengan observasi baru tanpa fitting ulang.
+    
+    Menggunakan recursive least squares: invers matriks normal (V^T V)^-1 dan koefisien
+    diperbarui dengan rumus Sherman-Morrison untuk setiap observasi baru, sehingga
+    biayanya hanya bergantung pada derajat, bukan pada panjang riwayat data.
+    Derajat dan skala tahun tetap sama seperti saat training.
+    
+    Parameter:
+        pop_model_info: Dictionary hasil train_population_model (atau pembaruan sebelumnya)
+        new_years: Tahun observasi baru (skalar atau array)
+        new_values: Nilai populasi observasi baru (skalar atau array)
+    Return:
+        Dictionary informasi model baru dengan bentuk yang sama seperti train_population_model
+    """
+    if np.size(pop_model_info.get('gram_inverse', ())) == 0:
+        raise ValueError("Model tidak memiliki statistik untuk pembaruan bertahap, latih ulang model")
+    
+    degree = pop_model_info['degree']
+    year_center = pop_model_info['year_center']
+    year_scale = pop_model_info['year_scale']
+    P = np.array(pop_model_info['gram_inverse'], dtype=float)
+    beta = np.array(pop_model_info['scaled_coeffs'], dtype=float)
+    xty = np.array(pop_model_info['xty'], dtype=float)
+    n_obs = pop_model_info['n_obs']
+    sum_y = pop_model_info['sum_y']
+    sum_y2 = pop_model_info['sum_y2']
+    
+    for year, value in zip(np.atleast_1d(new_years), np.atleast_1d(new_values)):
+        x = ((year - year_center) / year_scale) ** np.arange(degree + 1)
+        Px = P @ x
+        gain = Px / (1 + x @ Px)
+        beta += gain * (value - x @ beta)
+        P -= np.outer(gain, Px)
+        
+        xty += x * value
+        n_obs += 1
+        sum_y += value
+        sum_y2 += value * value
+    
+    # Pada solusi least squares, RSS = y^T y - beta^T V^T y
+    ss_res = sum_y2 - beta @ xty
+    ss_tot = sum_y2 - sum_y * sum_y / n_obs
+    r2 = 1 - ss_res / ss_tot
+    
+    pop_coeffs, pop_intercept = unscale_polynomial(beta, year_center, year_scale)
     return {
-        'model': best_model,
-        'poly_features': best_poly_features,
-        'degree': best_pop_degree,
-        'r2': best_pop_r2,
+        **pop_model_info,
+        'r2': r2,
         'coeffs': pop_coeffs,
         'intercept': pop_intercept,
-        'equation': pop_equation
-    }
\ No newline at end of file
+        'equation': format_polynomial(pop_coeffs, pop_intercept, degree),
+        'scaled_coeffs': beta,
+        'residual_std': residual_std(ss_res, n_obs, degree + 1),
+        'gram_inverse': P,
+        'xty': xty,
+        'n_obs': n_obs,
+        'sum_y': sum_y,
+        'sum_y2': sum_y2
+    }
+
+
+def nan_model_info(year_center=0.0, year_scale=1.0, criterion='r2'):
+    """
+    Fungsi untuk membuat informasi model polinomial bernilai NaN untuk deret yang tidak
+    dapat di-fit (data terlalu sedikit), sehingga prediktor menghasilkan NaN untuk deret
+    tersebut tanpa menggagalkan deret lainnya.
+    Parameter:
+        year_center: Pusat tahun (opsional)
+        year_scale: Skala tahun (opsional)
+        criterion: Kriteria pemilihan yang dicatat pada model (opsional)
+    Return:
+        Dictionary informasi model dengan bentuk hasil train_population_model
+    """
+    return population_model_info(year_center=year_center, year_scale=year_scale, criterion=criterion)
+
+@instrumented('train_population_models_batch')
+def train_population_models_batch(years, values_matrix, degrees=DEFAULT_DEGREES):
+    """
+    Fungsi untuk melatih model regresi polinomial untuk banyak deret populasi sekaligus.
+    
+    Setiap deret memakai tahun terpusat dan terskala dari data yang tersedia (seperti
+    search_polynomial_degree). Persamaan normal bermasker semua deret dibentuk dengan
+    satu einsum dan diselesaikan bertumpuk dengan np.linalg.solve untuk setiap derajat,
+    sehingga pola data hilang yang berbeda-beda tetap diselesaikan secara tervektorisasi.
+    Pemilihan derajat terbaik sama dengan train_population_model (R² tertinggi); deret
+    yang datanya terlalu sedikit mendapat model NaN (lihat nan_model_info).
+    
+    Parameter:
+        years: Array tahun (1-D) yang sama untuk semua deret
+        values_matrix: Matriks nilai populasi berukuran (jumlah deret × jumlah tahun),
+                       nilai NaN dianggap sebagai data yang hilang
+        degrees: Derajat polinomial yang dicoba
+    Return:
+        List dictionary (satu per deret) dengan bentuk hasil train_population_model
+    """
+    years = np.asarray(years, dtype=float).ravel()
+    values_matrix = np.atleast_2d(np.asarray(values_matrix, dtype=float))
+    n_series = values_matrix.shape[0]
+    degrees = sorted(degrees)
+    n_terms = max(degrees, default=0) + 1
+    record_metrics(rows=values_matrix.size, series=n_series)
+    
+    valid = ~np.isnan(values_matrix)
+    weights = valid.astype(float)
+    n_valid = valid.sum(axis=1)
+    
+    # Pusat dan skala tahun per deret dari tahun yang tersedia
+    with np.errstate(divide='ignore', invalid='ignore'):
+        year_center = (weights @ years) / n_valid
+        year_scale = np.sqrt((weights * (years - year_center[:, None]) ** 2).sum(axis=1) / n_valid)
+        y_mean = np.where(valid, values_matrix, 0.0).sum(axis=1) / n_valid
+    year_center = np.where(n_valid > 0, year_center, 0.0)
+    year_scale = np.where(year_scale > 0, year_scale, 1.0)
+    y_mean = np.where(n_valid > 0, y_mean, 0.0)
+    
+    # Matriks Vandermonde bermasker (deret × tahun × suku) dan persamaan normalnya
+    V = ((years - year_center[:, None]) / year_scale[:, None])[..., None] ** np.arange(n_terms)
+    V *= weights[..., None]
+    centered = np.where(valid, values_matrix - y_mean[:, None], 0.0)
+    gram = np.einsum('stj,stk->sjk', V, V)
+    rhs = np.einsum('stj,st->sj', V, centered)
+    ss_tot = (centered ** 2).sum(axis=1)
+    
+    best_degree = np.zeros(n_series, dtype=int)
+    best_r2 = np.zeros(n_series)
+    best_scaled_coeffs = np.full((n_series, n_terms), np.nan)
+    for degree in degrees:
+        fitted = np.flatnonzero(n_valid > degree)
+        if len(fitted) == 0:
+            continue
+        
+        coeffs = np.linalg.solve(gram[fitted, :degree + 1, :degree + 1], 
+                                 rhs[fitted, :degree + 1, None])[..., 0]
+        residual = centered[fitted] - np.einsum('stj,sj->st', V[fitted, :, :degree + 1], coeffs)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r2 = 1 - (residual ** 2).sum(axis=1) / ss_tot[fitted]
+        
+        better = r2 > best_r2[fitted]
+        rows = fitted[better]
+        best_degree[rows] = degree
+        best_r2[rows] = r2[better]
+        best_scaled_coeffs[rows] = 0.0
+        best_scaled_coeffs[rows, :degree + 1] = coeffs[better]
+        best_scaled_coeffs[rows, 0] += y_mean[rows]
+    
+    results = []
+    for series in range(n_series):
+        degree = int(best_degree[series])
+        if np.isnan(best_scaled_coeffs[series, 0]):
+            results.append(nan_model_info(year_center[series], year_scale[series]))
+            continue
+        
+        scaled_coeffs = best_scaled_coeffs[series, :degree + 1]
+        coeffs, intercept = unscale_polynomial(scaled_coeffs, year_center[series], year_scale[series])
+        rss = (1 - best_r2[series]) * ss_tot[series]
+        n_obs = int(n_valid[series])
+        results.append(population_model_info(
+            degree=degree,
+            r2=best_r2[series],
+            coeffs=coeffs,
+            intercept=intercept,
+            equation=format_polynomial(coeffs, intercept, degree),
+            scaled_coeffs=scaled_coeffs,
+            year_center=year_center[series],
+            year_scale=year_scale[series],
+            residual_std=residual_std(rss, n_obs, degree + 1),
+            aic=information_criterion(rss, n_obs, degree + 1, 'aic'),
+            bic=information_criterion(rss, n_obs, degree + 1, 'bic')
+        ))
+    
+    return results
@@ -0,0 +1,289 @@
+import math
+import numpy as np
+
+# Kurva pertumbuhan populasi non-polinomial terhadap tahun terskala s = (tahun - pusat) / skala.
+# Setiap kurva menerima tiga parameter; parameter yang tidak dipakai bernilai 0.
+def exponential_curve(s, a, b, _unused=0.0):
+    return a * np.exp(b * s)
+
+def logistic_curve(s, K, r, s0):
+    return K / (1 + np.exp(-r * (s - s0)))
+
+def gompertz_curve(s, K, b, c):
+    return K * np.exp(-b * np.exp(-c * s))
+
+GROWTH_CURVES = {
+    'exponential': exponential_curve,
+    'logistic': logistic_curve,
+    'gompertz': gompertz_curve
+}
+
+# Nama keluarga model populasi untuk label grafik dan ringkasan
+FAMILY_LABELS = {
+    'polynomial': 'Polinomial',
+    'exponential': 'Eksponensial',
+    'logistic': 'Logistik',
+    'gompertz': 'Gompertz'
+}
+
+class PolynomialPredictor:
+    """
+    Prediktor ringkas untuk model polinomial populasi.
+    
+    Menyimpan koefisien dalam tahun terskala (dari train_population_model) sebagai
+    array mentah dan mengevaluasinya dengan skema Horner. Satu prediktor dapat memuat
+    banyak deret; setiap baris koefisien adalah satu deret.
+    """
+    __slots__ = ('coeffs', 'year_center', 'year_scale', '_scalar_terms')
+    
+    def __init__(self, coeffs, year_center, year_scale):
+        """
+        Parameter:
+            coeffs: Koefisien terhadap (tahun - year_center) / year_scale dari pangkat 0,
+                    berukuran (jumlah deret × jumlah suku) atau 1-D untuk satu deret
+            year_center: Pusat tahun (skalar atau array per deret)
+            year_scale: Skala tahun (skalar atau array per deret)
+        """
+        self.coeffs = np.atleast_2d(np.asarray(coeffs, dtype=float))
+        n_series = self.coeffs.shape[0]
+        self.year_center = np.broadcast_to(np.asarray(year_center, dtype=float), (n_series,)).copy()
+        self.year_scale = np.broadcast_to(np.asarray(year_scale, dtype=float), (n_series,)).copy()
+        
+        # Salinan Python murni untuk jalur skalar tanpa overhead NumPy
+        self._scalar_terms = [(float(center), float(scale), tuple(float(c) for c in row[::-1]))
+                              for center, scale, row in zip(self.year_center, self.year_scale, self.coeffs)]
+    
+    @classmethod
+    def from_model_info(cls, pop_model_info):
+        """
+        Fungsi untuk membangun prediktor dari hasil train_population_model.
+        Parameter:
+            pop_model_info: Dictionary informasi model populasi, atau list dictionary
+                            (satu per deret, indeks sesuai id deret)
+        Return:
+            PolynomialPredictor
+        """
+        models = [pop_model_info] if isinstance(pop_model_info, dict) else list(pop_model_info)
+        n_terms = max(len(model['scaled_coeffs']) for model in models)
+        
+        # Deret dengan derajat lebih rendah diisi nol pada suku berpangkat tinggi
+        coeffs = np.zeros((len(models), n_terms))
+        for i, model in enumerate(models):
+            coeffs[i, :len(model['scaled_coeffs'])] = model['scaled_coeffs']
+        
+        return cls(coeffs, [model['year_center'] for model in models], 
+                   [model['year_scale'] for model in models])
+    
+    def __call__(self, years, series_ids=None):
+        """
+        Fungsi untuk memprediksi nilai secara tervektorisasi.
+        Parameter:
+            years: Array tahun
+            series_ids: Array id deret untuk setiap tahun (opsional, bawaan deret 0)
+        Return:
+            Array nilai prediksi dengan bentuk yang sama seperti years
+        """
+        years = np.asarray(years, dtype=float)
+        if series_ids is None:
+            coeffs = self.coeffs[0]
+            scaled_years = (years - self.year_center[0]) / self.year_scale[0]
+        else:
+            series_ids = np.asarray(series_ids)
+            coeffs = np.moveaxis(self.coeffs[series_ids], -1, 0)
+            scaled_years = (years - self.year_center[series_ids]) / self.year_scale[series_ids]
+        
+        values = np.empty(np.broadcast_shapes(scaled_years.shape, coeffs[-1].shape))
+        values[...] = coeffs[-1]
+        for j in range(len(coeffs) - 2, -1, -1):
+            values *= scaled_years
+            values += coeffs[j]
+        return values
+    
+    def predict_one(self, year, series_id=0):
+        """
+        Fungsi untuk memprediksi satu nilai (jalur skalar).
+        Parameter:
+            year: Tahun
+            series_id: Id deret (opsional)
+        Return:
+            Nilai prediksi (float)
+        """
+        center, scale, coeffs = self._scalar_terms[series_id]
+        t = (year - center) / scale
+        value = 0.0
+        for c in coeffs:
+            value = value * t + c
+        return value
+
+class LogisticPredictor:
+    """
+    Prediktor ringkas untuk model logistik persentase pengguna internet.
+    
+    Menyimpan parameter L, k dan x0 (dari train_internet_model) sebagai array mentah.
+    Satu prediktor dapat memuat banyak deret.
+    """
+    __slots__ = ('L', 'k', 'x0', '_scalar_params')
+    
+    def __init__(self, L, k, x0):
+        """
+        Parameter:
+            L, k, x0: Parameter fungsi logistik (skalar atau array per deret)
+        """
+        self.L, self.k, self.x0 = (np.atleast_1d(np.asarray(p, dtype=float)) for p in (L, k, x0))
+        
+        # Salinan Python murni untuk jalur skalar tanpa overhead NumPy
+        self._scalar_params = [(float(L), float(k), float(x0)) 
+                               for L, k, x0 in zip(self.L, self.k, self.x0)]
+    
+    @classmethod
+    def from_model_info(cls, internet_model_info):
+        """
+        Fungsi untuk membangun prediktor dari hasil train_internet_model.
+        Parameter:
+            internet_model_info: Dictionary informasi model internet, atau list dictionary
+                                 (satu per deret, indeks sesuai id deret)
+        Return:
+            LogisticPredictor
+        """
+        models = [internet_model_info] if isinstance(internet_model_info, dict) else list(internet_model_info)
+        return cls([model['L'] for model in models], [model['k'] for model in models], 
+                   [model['x0'] for model in models])
+    
+    def __call__(self, years, series_ids=None):
+        """
+        Fungsi untuk memprediksi nilai secara tervektorisasi.
+        Parameter:
+            years: Array tahun
+            series_ids: Array id deret untuk setiap tahun (opsional, bawaan deret 0)
+        Return:
+            Array nilai prediksi dengan bentuk yang sama seperti years
+        """
+        years = np.asarray(years, dtype=float)
+        if series_ids is None:
+            L, k, x0 = self.L[0], self.k[0], self.x0[0]
+        else:
+            L, k, x0 = self.L[series_ids], self.k[series_ids], self.x0[series_ids]
+        return L / (1 + np.exp(-k * (years - x0)))
+    
+    def predict_one(self, year, series_id=0):
+        """
+        Fungsi untuk memprediksi satu nilai (jalur skalar).
+        Parameter:
+            year: Tahun
+            series_id: Id deret (opsional)
+        Return:
+            Nilai prediksi (float)
+        """
+        L, k, x0 = self._scalar_params[series_id]
+        exponent = -k * (year - x0)
+        if exponent > 700:
+            return 0.0
+        return L / (1 + math.exp(exponent))
+
+
+class PopulationPredictor:
+    """
+    Prediktor populasi untuk deret dengan keluarga model campuran.
+    
+    Deret polinomial dievaluasi dengan PolynomialPredictor; deret dengan kurva
+    pertumbuhan (GROWTH_CURVES) dievaluasi per keluarga secara tervektorisasi.
+    Gunakan population_predictor untuk memilih prediktor yang sesuai.
+    """
+    __slots__ = ('families', 'params', 'year_center', 'year_scale', 'polynomial')
+    
+    def __init__(self, families, params, year_center, year_scale, polynomial):
+        """
+        Parameter:
+            families: Array nama keluarga model per deret
+            params: Parameter kurva pertumbuhan berukuran (jumlah deret × 3)
+            year_center: Pusat tahun per deret
+            year_scale: Skala tahun per deret
+            polynomial: PolynomialPredictor untuk semua deret (baris non-polinomial bernilai nol)
+        """
+        self.families = np.asarray(families)
+        self.params = np.atleast_2d(np.asarray(params, dtype=float))
+        self.year_center = np.asarray(year_center, dtype=float)
+        self.year_scale = np.asarray(year_scale, dtype=float)
+        self.polynomial = polynomial
+    
+    @classmethod
+    def from_model_info(cls, pop_model_info):
+        """
+        Fungsi untuk membangun prediktor dari hasil train_population_model atau
+        train_population_model_zoo.
+        Parameter:
+            pop_model_info: Dictionary informasi model populasi, atau list dictionary
+                            (satu per deret, indeks sesuai id deret)
+        Return:
+            PopulationPredictor
+        """
+        models = [pop_model_info] if isinstance(pop_model_info, dict) else list(pop_model_info)
+        families = [model.get('family', 'polynomial') for model in models]
+        params = np.zeros((len(models), 3))
+        polynomial_models = []
+        for i, (family, model) in enumerate(zip(families, models)):
+            if family == 'polynomial':
+                polynomial_models.append(model)
+            else:
+                params[i, :len(model['params'])] = model['params']
+                polynomial_models.append({'scaled_coeffs': [0.0], 'year_center': model['year_center'], 
+                                          'year_scale': model['year_scale']})
+        
+        polynomial = PolynomialPredictor.from_model_info(polynomial_models)
+        return cls(families, params, polynomial.year_center, polynomial.year_scale, polynomial)
+    
+    def __call__(self, years, series_ids=None):
+        """
+        Fungsi untuk memprediksi nilai secara tervektorisasi.
+        Parameter:
+            years: Array tahun
+            series_ids: Array id deret untuk setiap tahun (opsional, bawaan deret 0)
+        Return:
+            Array nilai prediksi dengan bentuk hasil broadcast years dan series_ids
+        """
+        years = np.asarray(years, dtype=float)
+        series_ids = np.zeros((), dtype=np.intp) if series_ids is None else np.asarray(series_ids)
+        years, series_ids = np.broadcast_arrays(years, series_ids)
+        
+        values = np.empty(years.shape)
+        row_families = self.families[series_ids]
+        for family in np.unique(row_families):
+            mask = row_families == family
+            ids = series_ids[mask]
+            if family == 'polynomial':
+                values[mask] = self.polynomial(years[mask], ids)
+            else:
+                scaled_years = (years[mask] - self.year_center[ids]) / self.year_scale[ids]
+                values[mask] = GROWTH_CURVES[family](scaled_years, *self.params[ids].T)
+        return values
+    
+    def predict_one(self, year, series_id=0):
+        """
+        Fungsi untuk memprediksi satu nilai (jalur skalar).
+        Parameter:
+            year: Tahun
+            series_id: Id deret (opsional)
+        Return:
+            Nilai prediksi (float)
+        """
+        family = self.families[series_id]
+        if family == 'polynomial':
+            return self.polynomial.predict_one(year, series_id)
+        scaled_year = (year - self.year_center[series_id]) / self.year_scale[series_id]
+        return float(GROWTH_CURVES[family](scaled_year, *self.params[series_id]))
+
+def population_predictor(pop_model_info):
+    """
+    Fungsi untuk membangun prediktor populasi yang sesuai dengan keluarga model.
+    
+    Jika semua deret adalah model polinomial, PolynomialPredictor (jalur tercepat)
+    dikembalikan; jika tidak, PopulationPredictor.
+    Parameter:
+        pop_model_info: Dictionary informasi model populasi, atau list dictionary
+    Return:
+        PolynomialPredictor atau PopulationPredictor
+    """
+    models = [pop_model_info] if isinstance(pop_model_info, dict) else pop_model_info
+    if all(model.get('family', 'polynomial') == 'polynomial' for model in models):
+        return PolynomialPredictor.from_model_info(pop_model_info)
+    return PopulationPredictor.from_model_info(pop_model_info)
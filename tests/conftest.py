@@ -0,0 +1,28 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+# Modul-modul proyek berada di direktori akar repositori (tanpa paket)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def csv_path(tmp_path):
+    # Deret B muncul lebih dulu agar urutan id deret tidak bergantung pada urutan baris
+    data = pd.DataFrame({
+        'Series': np.repeat(['B', 'A', 'C'], 10),
+        'Year': np.tile(np.arange(2000, 2010), 3),
+        'Percentage_Internet_User': np.linspace(0, 60, 30),
+        'Population': np.linspace(1e6, 2e6, 30)
+    })
+    data.loc[[3, 14], 'Population'] = np.nan
+    data.loc[5, 'Percentage_Internet_User'] = np.nan
+    path = tmp_path / 'data.csv'
+    data.to_csv(path, index=False)
+    return str(path)
+
+def assert_same_dataset(left, right):
+    for name in ('years', 'population', 'internet', 'pop_valid', 'internet_valid', 
+                 'series_ids', 'series_labels', 'missing_index'):
+        np.testing.assert_array_equal(getattr(left, name), getattr(right, name), err_msg=name)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from backtesting import rolling_origin_backtest
+from internet_usage_model import logistic_function
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(5)
+    years = np.arange(1970, 2024, dtype=float)
+    values = logistic_function(years, 85.0, 0.25, 2008.0) + rng.normal(0, 0.7, len(years))
+    return years, values
+
+def test_polynomial_rmse_matches_direct_refits(series):
+    years, values = series
+    result = rolling_origin_backtest(years, values, degrees=[1, 2, 3], min_train=20, horizon=5, 
+                                     step=3, processes=1)
+    assert 'logistic' not in result['rmse']
+    
+    scaled = (years - years.mean()) / years.std()
+    for degree in (1, 2, 3):
+        errors = []
+        for origin in range(20, len(years), 3):
+            coeffs = np.polynomial.polynomial.polyfit(scaled[:origin], values[:origin], degree)
+            target = slice(origin, origin + 5)
+            errors.append(np.polynomial.polynomial.polyval(scaled[target], coeffs) - values[target])
+        expected = np.sqrt(np.mean(np.concatenate(errors) ** 2))
+        assert result['rmse'][degree] == pytest.approx(expected, rel=1e-8)
+    np.testing.assert_array_equal(result['origins'], years[20::3])
+
+def test_logistic_candidate_wins_on_logistic_data(series):
+    years, values = series
+    result = rolling_origin_backtest(years, values, degrees=[2, 3], include_logistic=True, min_train=30, 
+                                     processes=1)
+    assert result['best'] == 'logistic'
+
+def test_result_does_not_depend_on_process_count_or_order(series):
+    years, values = series
+    serial = rolling_origin_backtest(years, values, include_logistic=True, processes=1)
+    order = np.random.default_rng(0).permutation(len(years))
+    parallel = rolling_origin_backtest(years[order], values[order], include_logistic=True, processes=3)
+    assert parallel['best'] == serial['best']
+    for candidate, rmse in serial['rmse'].items():
+        assert parallel['rmse'][candidate] == pytest.approx(rmse, rel=1e-4)
+
+def test_too_little_data_is_rejected(series):
+    years, values = series
+    with pytest.raises(ValueError):
+        rolling_origin_backtest(years[:10], values[:10])
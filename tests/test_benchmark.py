@@ -0,0 +1,16 @@
+import benchmark
+
+def test_benchmark_covers_every_stage(tmp_path):
+    record = benchmark.run_benchmark('tiny', plot_series=1, work_dir=str(tmp_path))
+    stages = record['stages']
+    assert {'load_data', 'load_data_streaming', 'load_data_store', 'train_population_model', 
+            'train_population_models_batch', 'train_internet_model', 
+            'train_internet_models_parallel', 'estimate_missing_values', 
+            'estimate_missing_values_spline', 'predict_future_values', 'print_summary', 
+            'plot'} <= set(stages)
+    assert all(stage['seconds'] > 0 for stage in stages.values())
+    
+    # Tahap process pool melaporkan puncak RSS termasuk proses pekerja
+    for name in ('train_internet_models_parallel', 'plot'):
+        assert stages[name]['peak_rss_bytes'] > 0
+    assert stages['load_data']['peak_rss_bytes'] is None
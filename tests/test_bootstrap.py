@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from bootstrap import bootstrap_intervals, _resample_residuals
+from population_model import train_population_model
+from internet_usage_model import train_internet_model, logistic_function
+from predictors import PolynomialPredictor, LogisticPredictor
+
+@pytest.fixture
+def models():
+    rng = np.random.default_rng(4)
+    years = np.arange(1990, 2024, dtype=float)
+    pop_values = 1.8e8 + 3e6 * (years - 1990) + rng.normal(0, 1e6, len(years))
+    internet_values = logistic_function(years, 80.0, 0.3, 2012.0) + rng.normal(0, 1.0, len(years))
+    return (years, pop_values, internet_values, train_population_model(years.reshape(-1, 1), pop_values), 
+            train_internet_model(years, internet_values))
+
+def intervals(models, **kwargs):
+    years, pop_values, internet_values, pop_model, internet_model = models
+    return bootstrap_intervals(years, pop_values, years, internet_values, pop_model, internet_model, 
+                               np.array([2000.0, 2030.0]), **kwargs)
+
+def test_intervals_bracket_point_estimates(models):
+    result = intervals(models, n_boot=200, processes=1)
+    _, _, _, pop_model, internet_model = models
+    target = result['years']
+    population = PolynomialPredictor.from_model_info(pop_model)(target)
+    internet = LogisticPredictor.from_model_info(internet_model)(target)
+    
+    assert np.all((result['population_lower'] < population) & (population < result['population_upper']))
+    assert np.all((result['internet_lower'] < internet) & (internet < result['internet_upper']))
+    assert np.all(result['users_lower'] < result['users_upper'])
+    
+    # Interval prediksi (2030) lebih lebar daripada interval di dalam rentang data (2000)
+    width = result['population_upper'] - result['population_lower']
+    assert width[1] > width[0]
+
+def test_population_interval_matches_per_sample_refit(models):
+    years, pop_values, _, pop_model, _ = models
+    result = intervals(models, n_boot=50, processes=1, seed=7)
+    
+    # Sampel yang sama dengan generator yang sama, di-fit satu per satu
+    rng = np.random.default_rng(7)
+    fitted = PolynomialPredictor.from_model_info(pop_model)(years)
+    samples = _resample_residuals(years, pop_values, fitted, 50, rng)
+    scaled = (years - years.mean()) / years.std()
+    target = (result['years'] - years.mean()) / years.std()
+    degree = pop_model['degree']
+    curves = [np.polynomial.polynomial.polyval(target, np.polynomial.polynomial.polyfit(scaled, sample, degree))
+              for sample in samples]
+    lower, upper = np.percentile(curves, [2.5, 97.5], axis=0)
+    np.testing.assert_allclose(result['population_lower'], lower, rtol=1e-9)
+    np.testing.assert_allclose(result['population_upper'], upper, rtol=1e-9)
+
+def test_intervals_do_not_depend_on_process_count(models):
+    serial = intervals(models, n_boot=40, processes=1)
+    parallel = intervals(models, n_boot=40, processes=2)
+    for key, values in serial.items():
+        np.testing.assert_allclose(parallel[key], values, rtol=1e-12, err_msg=key)
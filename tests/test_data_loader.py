@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+from conftest import assert_same_dataset
+from data_loader import load_data, _read_chunks, SERIES_IDS, SERIES_LABELS
+
+@pytest.mark.parametrize('chunksize', [1, 4, 7, 100])
+def test_streaming_matches_full_read(csv_path, chunksize):
+    assert_same_dataset(load_data(csv_path, chunksize=chunksize), load_data(csv_path))
+
+def test_streaming_returns_series_codes(csv_path):
+    columns = _read_chunks(csv_path, 4)
+    assert 'Series' not in columns
+    assert list(columns[SERIES_LABELS]) == ['A', 'B', 'C']
+    np.testing.assert_array_equal(columns[SERIES_IDS], np.repeat([1, 0, 2], 10))
+    assert columns[SERIES_IDS].dtype == np.uint8
+
+def test_streaming_diagnostics_match_full_read(csv_path, caplog):
+    with caplog.at_level('INFO', logger='data_loader'):
+        load_data(csv_path, diagnostics=2)
+        full = caplog.messages[:]
+        caplog.clear()
+        load_data(csv_path, chunksize=4, diagnostics=2)
+    assert caplog.messages == full
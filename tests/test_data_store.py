@@ -0,0 +1,44 @@
+import json
+import os
+import numpy as np
+from conftest import assert_same_dataset
+from data_loader import load_data, convert_to_store, SERIES_IDS, SERIES_LABELS
+from data_store import default_store_path, open_store, META_FILE
+
+def test_store_round_trip(csv_path):
+    assert_same_dataset(load_data(csv_path, use_store=True), load_data(csv_path))
+    
+    # Run kedua membuka penyimpanan yang sudah ada (memory-mapped)
+    columns, valid = open_store(default_store_path(csv_path), csv_path)
+    assert isinstance(columns['Population'], np.memmap)
+    assert isinstance(columns[SERIES_IDS], np.memmap)
+    assert list(columns[SERIES_LABELS]) == ['A', 'B', 'C']
+    assert not valid['Population'][3] and not valid['Population'][14]
+    assert_same_dataset(load_data(csv_path, use_store=True), load_data(csv_path))
+
+def test_streaming_conversion_matches(csv_path):
+    store_path = convert_to_store(csv_path, chunksize=4)
+    assert open_store(store_path, csv_path) is not None
+    assert_same_dataset(load_data(csv_path, use_store=True), load_data(csv_path))
+
+def test_changed_source_invalidates_store(csv_path):
+    load_data(csv_path, use_store=True)
+    with open(csv_path, 'a') as f:
+        f.write('D,2000,1.0,5.0\n')
+    os.utime(csv_path, ns=(0, 0))
+    
+    assert open_store(default_store_path(csv_path), csv_path) is None
+    dataset = load_data(csv_path, use_store=True)
+    assert list(dataset.series_labels) == ['A', 'B', 'C', 'D']
+
+def test_old_store_version_is_rebuilt(csv_path):
+    store_path = convert_to_store(csv_path)
+    meta_path = os.path.join(store_path, META_FILE)
+    with open(meta_path) as f:
+        meta = json.load(f)
+    del meta['version']
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+    
+    assert open_store(store_path, csv_path) is None
+    assert_same_dataset(load_data(csv_path, use_store=True), load_data(csv_path))
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from scipy.interpolate import PchipInterpolator
+from data_loader import load_data
+from estimation import interpolate_panel, estimate_missing_values_spline
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(1)
+    years = np.tile(np.arange(1990, 2024), 3)
+    series_ids = np.repeat(np.arange(3), 34)
+    values = np.cumsum(rng.uniform(0, 5, len(years))) + 10 * series_ids
+    valid = rng.random(len(years)) > 0.3
+    valid[[0, 33, 34, 67, 68, 101]] = True  # ujung setiap deret tersedia
+    return series_ids, years, values, valid
+
+def test_pchip_matches_scipy(panel):
+    series_ids, years, values, valid = panel
+    query = ~valid
+    result = interpolate_panel(series_ids, years, values, valid, series_ids[query], years[query])
+    
+    for series in range(3):
+        rows = valid & (series_ids == series)
+        expected = PchipInterpolator(years[rows], values[rows])(years[query & (series_ids == series)])
+        np.testing.assert_allclose(result[series_ids[query] == series], expected, rtol=1e-12)
+
+def test_linear_matches_interp(panel):
+    series_ids, years, values, valid = panel
+    query = ~valid
+    result = interpolate_panel(series_ids, years, values, valid, series_ids[query], years[query], 
+                               method='linear')
+    
+    for series in range(3):
+        rows = valid & (series_ids == series)
+        expected = np.interp(years[query & (series_ids == series)], years[rows], values[rows])
+        np.testing.assert_allclose(result[series_ids[query] == series], expected, rtol=1e-12)
+
+def test_outside_series_range_is_nan(panel):
+    series_ids, years, values, valid = panel
+    result = interpolate_panel(series_ids, years, values, valid, [0, 2], [1980, 2030])
+    assert np.isnan(result).all()
+
+@pytest.mark.parametrize('method', ['pchip', 'linear'])
+def test_spline_estimates_recover_linear_data(csv_path, method):
+    dataset = load_data(csv_path)
+    results = estimate_missing_values_spline(dataset, method)
+    
+    # Data uji linear per deret sehingga kedua interpolasi mengembalikan nilai aslinya
+    rows = {'B': 0, 'A': 10, 'C': 20}
+    index = [rows[dataset.series_labels[series]] + year - 2000 for series, year in dataset.missing_index]
+    np.testing.assert_allclose(results['estimated_population'], np.linspace(1e6, 2e6, 30)[index])
+    np.testing.assert_allclose(results['estimated_internet'], np.linspace(0, 60, 30)[index])
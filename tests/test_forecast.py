@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from forecast import write_forecast_table
+from population_model import train_population_models_batch, nan_model_info
+from predictors import LogisticPredictor, population_predictor
+
+@pytest.fixture
+def models():
+    years = np.arange(1990, 2024)
+    growth = np.array([1.0, 1.5, 2.0])[:, None]
+    pop_models = train_population_models_batch(years, 1e6 * (1 + 0.01 * growth * (years - 1990)) ** 2)
+    internet_models = [{'L': 80.0 + i, 'k': 0.2 + 0.05 * i, 'x0': 2005.0 + i} for i in range(3)]
+    return pop_models, internet_models
+
+@pytest.mark.parametrize('chunk_rows', [1, 5, 20, 10 ** 6])
+def test_chunked_table_matches_predictors(models, tmp_path, chunk_rows):
+    pop_models, internet_models = models
+    years = np.arange(2024, 2034)
+    path = str(tmp_path / 'forecast.csv')
+    scenarios = {'baseline': {}, 'fast': {'k_factor': 1.5, 'population_factor': 1.1}}
+    result = write_forecast_table(pop_models, internet_models, years, path, 
+                                  series_labels=['A', 'B', 'C'], scenarios=scenarios, 
+                                  chunk_rows=chunk_rows)
+    
+    # Setiap chunk berisi paling banyak chunk_rows baris, tetapi minimal satu deret penuh
+    series_per_chunk = max(1, chunk_rows // len(years))
+    assert result['rows'] == 2 * 3 * len(years)
+    assert result['chunks'] == 2 * -(-3 // series_per_chunk)
+    
+    table = pd.read_csv(path)
+    assert len(table) == result['rows']
+    baseline = table[table['Scenario'] == 'baseline']
+    series_ids = np.repeat(np.arange(3), len(years))
+    np.testing.assert_array_equal(baseline['Series'], np.repeat(['A', 'B', 'C'], len(years)))
+    np.testing.assert_allclose(baseline['Predicted_Population'], 
+                               population_predictor(pop_models)(np.tile(years, 3), series_ids))
+    
+    fast = table[table['Scenario'] == 'fast']
+    internet = LogisticPredictor.from_model_info(internet_models)
+    expected = LogisticPredictor(internet.L, internet.k * 1.5, internet.x0)(np.tile(years, 3), series_ids)
+    np.testing.assert_allclose(fast['Predicted_Internet_Percentage'], expected)
+    np.testing.assert_allclose(fast['Predicted_Population'], baseline['Predicted_Population'] * 1.1)
+
+def test_nan_series_does_not_break_table(models, tmp_path):
+    pop_models, internet_models = models
+    pop_models[1] = nan_model_info()
+    path = str(tmp_path / 'forecast.csv')
+    write_forecast_table(pop_models, internet_models, [2030], path, chunk_rows=1)
+    table = pd.read_csv(path)
+    assert table['Predicted_Population'].isna().tolist() == [False, True, False]
+
+def test_unknown_scenario_key_is_rejected(models, tmp_path):
+    with pytest.raises(ValueError):
+        write_forecast_table(*models, [2030], str(tmp_path / 'forecast.csv'), 
+                             scenarios={'bad': {'growth': 2}})
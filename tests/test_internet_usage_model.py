@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from scipy.optimize import curve_fit
+import internet_usage_model
+from internet_usage_model import (fit_logistic, train_internet_model, update_internet_model, 
+                                  logistic_function, logistic_jacobian, DEFAULT_P0, DEFAULT_BOUNDS, 
+                                  train_internet_models_parallel, DEFAULT_UPDATE_WINDOW)
+
+@pytest.fixture
+def internet():
+    rng = np.random.default_rng(3)
+    years = np.arange(1990, 2024, dtype=float)
+    values = logistic_function(years, 82.0, 0.28, 2009.5) + rng.normal(0, 0.8, len(years))
+    return years, values
+
+def test_jacobian_matches_finite_differences(internet):
+    years, _ = internet
+    params = np.array([82.0, 0.28, 2009.5])
+    steps = np.array([1e-4, 1e-7, 1e-4])
+    numeric = np.column_stack([
+        (logistic_function(years, *(params + step)) - logistic_function(years, *(params - step))) / (2 * h)
+        for step, h in zip(np.diag(steps), steps)])
+    np.testing.assert_allclose(logistic_jacobian(years, *params), numeric, rtol=1e-5, atol=1e-6)
+
+def test_fit_logistic_matches_curve_fit(internet):
+    years, values = internet
+    fit = fit_logistic(years, values, DEFAULT_P0, DEFAULT_BOUNDS)
+    expected, expected_covariance = curve_fit(logistic_function, years, values, p0=DEFAULT_P0, 
+                                              bounds=DEFAULT_BOUNDS, maxfev=10000)
+    assert fit['success']
+    np.testing.assert_allclose(fit['params'], expected, rtol=1e-5)
+    np.testing.assert_allclose(fit['covariance'], expected_covariance, rtol=1e-3)
+
+def test_warm_start_needs_fewer_evaluations(internet):
+    years, values = internet
+    cold = fit_logistic(years, values, DEFAULT_P0, DEFAULT_BOUNDS)
+    warm = fit_logistic(years, values * 1.01, cold['params'], DEFAULT_BOUNDS)
+    assert warm['success']
+    assert warm['nfev'] < cold['nfev']
+    
+    # Parameter awal di luar batasan dijepit ke dalam batasan
+    clipped = fit_logistic(years, values, [500, 0.3, 1900], DEFAULT_BOUNDS)
+    np.testing.assert_allclose(clipped['params'], cold['params'], rtol=1e-5)
+
+def test_evaluation_limit_reports_failure(internet):
+    years, values = internet
+    assert not fit_logistic(years, values, DEFAULT_P0, DEFAULT_BOUNDS, max_nfev=1)['success']
+
+def test_train_rejects_non_converged_fit(internet, monkeypatch):
+    years, values = internet
+    monkeypatch.setattr(internet_usage_model, 'fit_logistic', 
+                        lambda *args, **kwargs: fit_logistic(*args[:4], max_nfev=1))
+    with pytest.raises(RuntimeError):
+        train_internet_model(years, values)
+
+def test_update_uses_recent_window_with_warm_start(internet):
+    years, values = internet
+    model = train_internet_model(years[:-4], values[:-4])
+    refit = train_internet_model(years, values)
+    
+    # Riwayat sebelum window tidak memengaruhi pembaruan
+    history_years = np.concatenate([np.arange(1900, years[0]), years])
+    history_values = np.concatenate([np.full(len(history_years) - len(years), 50.0), values])
+    updated = update_internet_model(model, history_years, history_values)
+    windowed = train_internet_model(years[-DEFAULT_UPDATE_WINDOW:], values[-DEFAULT_UPDATE_WINDOW:], 
+                                    p0=[model['L'], model['k'], model['x0']])
+    np.testing.assert_allclose(updated['params'], windowed['params'], rtol=1e-9)
+    np.testing.assert_allclose(updated['params'], refit['params'], rtol=0.02)
+    assert updated['nfev'] < refit['nfev']
+
+@pytest.fixture
+def internet_panel(internet):
+    years, values = internet
+    rng = np.random.default_rng(6)
+    matrix = np.vstack([values, 
+                        logistic_function(years, 60.0, 0.4, 2005.0) + rng.normal(0, 0.5, len(years)), 
+                        values[::-1], 
+                        np.full(len(years), np.nan), 
+                        logistic_function(years, 95.0, 0.2, 2015.0) + rng.normal(0, 1.0, len(years))])
+    matrix[1, rng.choice(len(years), 8, replace=False)] = np.nan
+    matrix[3, [4, 11, 20]] = values[[4, 11, 20]]  # hanya tiga titik: tidak cukup untuk 3 parameter
+    return years, matrix
+
+def assert_same_results(left, right):
+    assert set(left) == set(right)
+    for key in left:
+        np.testing.assert_array_equal(left[key], right[key], err_msg=key)
+
+def test_parallel_matches_serial(internet_panel):
+    years, matrix = internet_panel
+    serial = train_internet_models_parallel(years, matrix, processes=1)
+    parallel = train_internet_models_parallel(years, matrix, processes=2)
+    assert_same_results(parallel, serial)
+    
+    np.testing.assert_array_equal(parallel['success'], [True, True, True, False, True])
+    assert np.isnan(parallel['params'][3]).all() and np.isnan(parallel['covariance'][3]).all()
+    assert np.isnan(parallel['r2'][3]) and parallel['nfev'][3] == 0
+    
+    valid = ~np.isnan(matrix[1])
+    single = fit_logistic(years[valid], matrix[1, valid], DEFAULT_P0, DEFAULT_BOUNDS)
+    np.testing.assert_allclose(parallel['params'][1], single['params'], rtol=1e-12)
+
+def test_parallel_marks_non_converged_series(internet_panel):
+    years, matrix = internet_panel
+    serial = train_internet_models_parallel(years, matrix, processes=1, max_nfev=2)
+    parallel = train_internet_models_parallel(years, matrix, processes=2, max_nfev=2)
+    assert_same_results(parallel, serial)
+    
+    assert not parallel['success'].any()
+    assert np.isnan(parallel['params']).all() and np.isnan(parallel['r2']).all()
+    np.testing.assert_array_equal(parallel['nfev'], 0)
@@ -0,0 +1,83 @@
+import json
+import os
+import shutil
+import pandas as pd
+import pytest
+import main
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), main.DATA_FILE)
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    shutil.copy(DATA_FILE, 'data.csv')
+    calls = []
+    fit_models = main.fit_models
+    monkeypatch.setattr(main, 'fit_models', lambda dataset: calls.append(1) or fit_models(dataset))
+    return calls
+
+def predict(capsys):
+    main.main(['predict', '--csv', 'data.csv', '--models', 'models.json', '2030'])
+    return capsys.readouterr().out
+
+def test_predict_reuses_models_for_same_data(workspace, capsys):
+    first = predict(capsys)
+    assert predict(capsys) == first
+    assert workspace == [1]
+    
+    # Waktu modifikasi berubah tetapi isinya sama: hash yang dibandingkan
+    os.utime('data.csv', ns=(0, 0))
+    assert predict(capsys) == first
+    assert workspace == [1]
+
+def test_predict_refits_when_data_changes(workspace, capsys):
+    first = predict(capsys)
+    data = pd.read_csv('data.csv')
+    data['Population'] *= 1.1
+    data.to_csv('data.csv', index=False)
+    
+    assert predict(capsys) != first
+    assert workspace == [1, 1]
+    assert predict(capsys) != first
+    assert workspace == [1, 1]
+
+def test_models_without_source_are_refit(workspace, capsys):
+    predict(capsys)
+    with open('models.json') as f:
+        models = json.load(f)
+    del models['source']
+    with open('models.json', 'w') as f:
+        json.dump(models, f)
+    
+    predict(capsys)
+    assert workspace == [1, 1]
+
+def test_fit_stage_params_follow_model_settings_and_version(monkeypatch):
+    import model_cache
+    import population_model
+    population = main.fit_stage_params('population')
+    internet = main.fit_stage_params('internet')
+    assert population != internet
+    
+    monkeypatch.setattr(population_model, 'DEFAULT_DEGREES', [1, 2])
+    assert main.fit_stage_params('population') != population
+    assert main.fit_stage_params('internet') == internet
+    
+    monkeypatch.setattr(model_cache, 'CACHE_VERSION', model_cache.CACHE_VERSION + 1)
+    assert main.fit_stage_params('internet') != internet
+
+def test_pipeline_replots_model_when_cache_version_changes(tmp_path, monkeypatch):
+    import model_cache
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('MPLBACKEND', 'Agg')
+    shutil.copy(DATA_FILE, main.DATA_FILE)
+    chart = os.path.join('charts', 'internet_model.png')
+    
+    main.run_pipeline(output_dir='charts', jobs=1)
+    os.utime(chart, ns=(0, 0))
+    main.run_pipeline(output_dir='charts', jobs=1)
+    assert os.stat(chart).st_mtime_ns == 0
+    
+    monkeypatch.setattr(model_cache, 'CACHE_VERSION', model_cache.CACHE_VERSION + 1)
+    main.run_pipeline(output_dir='charts', jobs=1)
+    assert os.stat(chart).st_mtime_ns != 0
@@ -0,0 +1,71 @@
+import os
+import numpy as np
+import model_cache
+from model_cache import cached_train, model_cache_key, store_cached_model, load_cached_model
+
+def counting_train(calls):
+    def train(years, values, degree=2):
+        calls.append(degree)
+        return {'degree': degree, 'total': float(values.sum())}
+    return train
+
+def test_key_changes_with_data_and_settings():
+    years, values = np.arange(5), np.ones(5)
+    key = model_cache_key('population', [years, values], {'degree': 2})
+    assert key == model_cache_key('population', [years, values.copy()], {'degree': 2})
+    assert key != model_cache_key('population', [years, values * 2], {'degree': 2})
+    assert key != model_cache_key('population', [years, values], {'degree': 3})
+    assert key != model_cache_key('internet', [years, values], {'degree': 2})
+    assert key != model_cache_key('population', [years, values.astype(np.float32)], {'degree': 2})
+
+def test_cached_train_hits_and_invalidates(tmp_path, monkeypatch):
+    calls = []
+    train = counting_train(calls)
+    years, values = np.arange(5), np.ones(5)
+    
+    first = cached_train(train, 'population', [years, values], {'degree': 2}, cache_dir=str(tmp_path))
+    assert cached_train(train, 'population', [years, values], {'degree': 2}, 
+                        cache_dir=str(tmp_path)) == first
+    assert calls == [2]
+    
+    cached_train(train, 'population', [years, values * 2], {'degree': 2}, cache_dir=str(tmp_path))
+    cached_train(train, 'population', [years, values], {'degree': 3}, cache_dir=str(tmp_path))
+    assert calls == [2, 2, 3]
+    
+    # Versi cache yang berbeda membuat semua entri lama tidak terpakai
+    monkeypatch.setattr(model_cache, 'CACHE_VERSION', model_cache.CACHE_VERSION + 1)
+    cached_train(train, 'population', [years, values], {'degree': 2}, cache_dir=str(tmp_path))
+    assert calls == [2, 2, 3, 2]
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache_dir = str(tmp_path)
+    payload = {'values': np.zeros(1000)}
+    for i, key in enumerate(['a', 'b', 'c']):
+        store_cached_model(key, payload, cache_dir)
+        os.utime(os.path.join(cache_dir, f'{key}.pkl'), ns=(i * 10 ** 9, i * 10 ** 9))
+    size = os.path.getsize(os.path.join(cache_dir, 'a.pkl'))
+    
+    # Membaca 'a' memperbarui waktu pemakaiannya sehingga 'b' menjadi yang tertua
+    assert load_cached_model('a', cache_dir) is not None
+    store_cached_model('d', payload, cache_dir, max_bytes=3 * size)
+    assert sorted(os.listdir(cache_dir)) == ['a.pkl', 'c.pkl', 'd.pkl']
+    
+    # Entri yang baru ditulis tetap disimpan meskipun melebihi batas
+    store_cached_model('e', payload, cache_dir, max_bytes=size // 2)
+    assert os.listdir(cache_dir) == ['e.pkl']
+
+def test_eviction_ignores_entries_removed_concurrently(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+    for key in ['a', 'b', 'c']:
+        store_cached_model(key, {'values': np.zeros(1000)}, cache_dir)
+    
+    # Thread lain menghapus entri di antara listdir dan stat/remove
+    listdir = os.listdir
+    def racing_listdir(path):
+        names = listdir(path)
+        os.remove(os.path.join(path, 'a.pkl'))
+        return names + ['gone.pkl']
+    monkeypatch.setattr(model_cache.os, 'listdir', racing_listdir)
+    model_cache._evict(cache_dir, 0, keep='c.pkl')
+    monkeypatch.undo()
+    assert os.listdir(cache_dir) == ['c.pkl']
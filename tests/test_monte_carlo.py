@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from monte_carlo import simulate_internet_users
+from population_model import train_population_model
+from internet_usage_model import train_internet_model, logistic_function
+from predictors import PolynomialPredictor, LogisticPredictor
+
+TARGET = np.array([2000.0, 2025.0, 2030.0])
+
+@pytest.fixture
+def models():
+    rng = np.random.default_rng(5)
+    years = np.arange(1990, 2024, dtype=float)
+    pop_values = 1.8e8 + 3e6 * (years - 1990) + rng.normal(0, 1e6, len(years))
+    internet_values = logistic_function(years, 80.0, 0.3, 2012.0) + rng.normal(0, 1.0, len(years))
+    return train_population_model(years.reshape(-1, 1), pop_values), train_internet_model(years, internet_values)
+
+def test_same_seed_is_reproducible(models):
+    first = simulate_internet_users(*models, TARGET, n_draws=2000, seed=3)
+    second = simulate_internet_users(*models, TARGET, n_draws=2000, seed=3)
+    other = simulate_internet_users(*models, TARGET, n_draws=2000, seed=4)
+    np.testing.assert_array_equal(first['users_quantiles'], second['users_quantiles'])
+    np.testing.assert_array_equal(first['users_mean'], second['users_mean'])
+    assert not np.array_equal(first['users_mean'], other['users_mean'])
+
+def test_year_blocks_do_not_change_result(models):
+    # max_cells = n_draws memproses satu tahun per blok
+    whole = simulate_internet_users(*models, TARGET, n_draws=2000, seed=1)
+    blocked = simulate_internet_users(*models, TARGET, n_draws=2000, seed=1, max_cells=2000)
+    np.testing.assert_allclose(blocked['users_quantiles'], whole['users_quantiles'], rtol=1e-12)
+    np.testing.assert_allclose(blocked['users_mean'], whole['users_mean'], rtol=1e-12)
+
+def test_quantiles_bracket_point_prediction(models):
+    pop_model, internet_model = models
+    result = simulate_internet_users(pop_model, internet_model, TARGET, n_draws=20000)
+    lower, median, upper = result['users_quantiles']
+    point = (LogisticPredictor.from_model_info(internet_model)(TARGET) / 100 
+             * PolynomialPredictor.from_model_info(pop_model)(TARGET))
+    
+    assert np.all((lower < point) & (point < upper))
+    assert np.all((lower < result['users_mean']) & (result['users_mean'] < upper))
+    np.testing.assert_allclose(median, point, rtol=0.02)
+    assert list(result['results_df'].columns) == ['Year', 'Users_Mean', 'Users_Q2.5', 'Users_Q50', 
+                                                  'Users_Q97.5']
+
+def test_without_uncertainty_matches_point_prediction(models):
+    pop_model, internet_model = models
+    pop_model = {**pop_model, 'residual_std': 0.0}
+    internet_model = {**internet_model, 'covariance': np.zeros((3, 3))}
+    result = simulate_internet_users(pop_model, internet_model, TARGET, n_draws=100)
+    point = (LogisticPredictor.from_model_info(internet_model)(TARGET) / 100 
+             * PolynomialPredictor.from_model_info(pop_model)(TARGET))
+    
+    np.testing.assert_allclose(result['users_quantiles'], np.broadcast_to(point, (3, len(TARGET))), 
+                               rtol=1e-12)
+    np.testing.assert_allclose(result['users_mean'], point, rtol=1e-12)
+
+def test_series_list_matches_single_series(models):
+    pop_model, internet_model = models
+    scaled = {**pop_model, 'scaled_coeffs': np.asarray(pop_model['scaled_coeffs']) * 2}
+    single = simulate_internet_users(pop_model, internet_model, TARGET, n_draws=2000, seed=2)
+    panel = simulate_internet_users([pop_model, scaled], [internet_model, internet_model], TARGET, 
+                                    n_draws=2000, seed=2)
+    
+    assert panel['users_quantiles'].shape == (3, 2, len(TARGET))
+    np.testing.assert_array_equal(panel['users_quantiles'][:, 0], single['users_quantiles'])
+    np.testing.assert_array_equal(panel['users_mean'][0], single['users_mean'])
+    assert np.all(panel['users_mean'][1] > panel['users_mean'][0])
+    assert list(panel['results_df']['Series']) == [0, 0, 0, 1, 1, 1]
+
+def test_mismatched_series_counts_raise(models):
+    pop_model, internet_model = models
+    with pytest.raises(ValueError):
+        simulate_internet_users([pop_model, pop_model], [internet_model], TARGET, n_draws=10)
+
+def test_infinite_covariance_raises(models):
+    pop_model, internet_model = models
+    internet_model = {**internet_model, 'covariance': np.full((3, 3), np.inf)}
+    with pytest.raises(ValueError):
+        simulate_internet_users(pop_model, internet_model, TARGET, n_draws=10)
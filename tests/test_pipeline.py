@@ -0,0 +1,62 @@
+import pytest
+from pipeline import Stage, run_stages
+
+def make_stages(calls, params=1):
+    def record(name, result):
+        def function(*args):
+            calls.append(name)
+            return result(*args)
+        return function
+    
+    return [
+        Stage('source', record('source', lambda: params), params=params),
+        Stage('double', record('double', lambda value: value * 2), ['source']),
+        Stage('plot', record('plot', lambda value: None), ['double'])
+    ]
+
+def test_cache_hit_skips_stages(tmp_path):
+    calls = []
+    first = run_stages(make_stages(calls), jobs=1, cache_dir=str(tmp_path))
+    assert calls == ['source', 'double', 'plot']
+    
+    calls.clear()
+    second = run_stages(make_stages(calls), jobs=1, cache_dir=str(tmp_path))
+    assert calls == []
+    assert second == first
+
+def test_changed_params_miss_cache(tmp_path):
+    calls = []
+    run_stages(make_stages(calls), jobs=1, cache_dir=str(tmp_path))
+    
+    calls.clear()
+    results = run_stages(make_stages(calls, params=5), jobs=1, cache_dir=str(tmp_path))
+    assert calls == ['source', 'double', 'plot']
+    assert results['double'] == 10
+
+def test_uncached_stage_always_runs(tmp_path):
+    calls = []
+    stages = make_stages(calls)
+    stages[1].cache = False
+    run_stages(stages, jobs=1, cache_dir=str(tmp_path))
+    
+    calls.clear()
+    run_stages(stages, jobs=1, cache_dir=str(tmp_path))
+    assert calls == ['double']
+
+def test_missing_output_reruns_stage(tmp_path):
+    calls = []
+    output = tmp_path / 'chart.png'
+    stages = make_stages(calls)
+    stages[2] = Stage('plot', lambda value: calls.append('plot') or output.write_text('x'), ['double'], 
+                      outputs=[str(output)])
+    run_stages(stages, jobs=1, cache_dir=str(tmp_path / 'cache'))
+    
+    output.unlink()
+    calls.clear()
+    run_stages(stages, jobs=1, cache_dir=str(tmp_path / 'cache'))
+    assert calls == ['plot']
+
+def test_cycle_is_rejected():
+    stages = [Stage('a', lambda value: value, ['b']), Stage('b', lambda value: value, ['a'])]
+    with pytest.raises(ValueError):
+        run_stages(stages, jobs=1, cache_dir=None)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from population_model import train_population_model, MODEL_INFO_KEYS
+from population_families import train_population_models_zoo
+from predictors import population_predictor
+
+YEARS = np.arange(1960, 2024, dtype=float)
+
+FAMILIES = ['logistic', 'exponential', 'gompertz']
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(0)
+    logistic = 2e8 / (1 + np.exp(-0.15 * (YEARS - 1990)))
+    exponential = 5e7 * np.exp(0.05 * (YEARS - 1960))
+    gompertz = 2e8 * np.exp(-3 * np.exp(-0.08 * (YEARS - 1960)))
+    return np.vstack([logistic, exponential, gompertz]) * rng.normal(1, 1e-4, (3, len(YEARS)))
+
+@pytest.mark.parametrize('criterion', ['aic', 'bic'])
+def test_selection_picks_true_family(panel, criterion):
+    for values, family in zip(panel, FAMILIES):
+        model = train_population_model(YEARS, values, selection=criterion)
+        assert model['family'] == family
+        assert model['criterion'] == criterion
+
+@pytest.mark.parametrize('criterion', ['aic', 'bic'])
+def test_selection_result_has_r2_shape(panel, criterion):
+    r2_model = train_population_model(YEARS, panel[0])
+    model = train_population_model(YEARS, panel[0], selection=criterion)
+    assert tuple(model) == tuple(r2_model) == MODEL_INFO_KEYS
+    assert model['degree'] == 0
+    assert np.isnan(model['scaled_coeffs']).all()
+    assert np.isnan(r2_model['params']).all()
+
+def test_failed_series_predicts_nan(panel):
+    matrix = np.vstack([panel, np.full(len(YEARS), np.nan)])
+    matrix[-1, :2] = panel[0, :2]
+    
+    models = train_population_models_zoo(YEARS, matrix, processes=1)
+    assert [tuple(model) for model in models] == [MODEL_INFO_KEYS] * len(matrix)
+    predicted = population_predictor(models)(np.full(len(matrix), 2030.0), np.arange(len(matrix)))
+    assert np.isfinite(predicted[:-1]).all()
+    assert np.isnan(predicted[-1])
+
+def test_zoo_processes_match_serial(panel):
+    matrix = np.vstack([panel, panel[::-1, ::-1], np.full(len(YEARS), np.nan)])
+    matrix[1, 5:9] = np.nan
+    
+    serial = train_population_models_zoo(YEARS, matrix, criterion='bic', processes=1)
+    parallel = train_population_models_zoo(YEARS, matrix, criterion='bic', processes=2)
+    assert [model['family'] for model in parallel] == [model['family'] for model in serial]
+    for expected, model in zip(serial, parallel):
+        for key in ('params', 'scaled_coeffs', 'r2', 'aic', 'bic'):
+            np.testing.assert_allclose(model[key], expected[key], rtol=1e-12)
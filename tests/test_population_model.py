@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from population_model import (train_population_model, train_population_models_batch, sklearn_model, 
+                              update_population_model)
+from predictors import PolynomialPredictor, population_predictor
+
+@pytest.fixture
+def population():
+    rng = np.random.default_rng(0)
+    years = np.arange(1960, 2024)
+    values = 9e7 + 3.2e6 * (years - 1960) - 1.1e4 * (years - 1960) ** 2 + rng.normal(0, 4e5, len(years))
+    return years, values
+
+def test_batch_matches_single(population):
+    years, values = population
+    rng = np.random.default_rng(2)
+    matrix = np.vstack([values, values * 1.5, values[::-1]])
+    matrix[1, 10:13] = np.nan
+    matrix[2, rng.choice(len(years), 20, replace=False)] = np.nan
+    
+    batch = train_population_models_batch(years, matrix)
+    for row, model in zip(matrix, batch):
+        valid = ~np.isnan(row)
+        single = train_population_model(years[valid].reshape(-1, 1), row[valid])
+        assert model['degree'] == single['degree']
+        assert model['r2'] == pytest.approx(single['r2'], rel=1e-9)
+        np.testing.assert_allclose(PolynomialPredictor.from_model_info(model)(years), 
+                                   PolynomialPredictor.from_model_info(single)(years), rtol=1e-9)
+
+def test_batch_short_series_predicts_nan(population):
+    years, values = population
+    matrix = np.vstack([values, np.full(len(years), np.nan), np.full(len(years), np.nan)])
+    matrix[1, :2] = values[:2]
+    
+    batch = train_population_models_batch(years, matrix)
+    predicted = population_predictor(batch)(np.array([2000, 2000, 2000]), np.arange(3))
+    assert np.isfinite(predicted[0])
+    assert np.isnan(predicted[1:]).all()
+    assert np.isnan(population_predictor(batch).predict_one(2000, 1))
+
+def test_sklearn_model_matches_predictor(population):
+    years, values = population
+    model = train_population_model(years.reshape(-1, 1), values)
+    assert 'model' not in model
+    
+    regression, poly_features = sklearn_model(model)
+    sklearn_values = regression.predict(poly_features.transform(years.reshape(-1, 1)))
+    np.testing.assert_allclose(sklearn_values, PolynomialPredictor.from_model_info(model)(years), 
+                               rtol=1e-9)
+
+def test_update_matches_refit(population):
+    years, values = population
+    model = train_population_model(years[:-4].reshape(-1, 1), values[:-4])
+    
+    updated = model
+    for year, value in zip(years[-4:], values[-4:]):
+        updated = update_population_model(updated, year, value)
+    refit = train_population_model(years.reshape(-1, 1), values, degrees=[model['degree']])
+    
+    np.testing.assert_allclose(PolynomialPredictor.from_model_info(updated)(years), 
+                               PolynomialPredictor.from_model_info(refit)(years), rtol=1e-9)
+    assert updated['r2'] == pytest.approx(refit['r2'], rel=1e-9)
+    assert updated['residual_std'] == pytest.approx(refit['residual_std'], rel=1e-6)
+    assert updated['n_obs'] == len(years)
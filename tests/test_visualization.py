@@ -0,0 +1,52 @@
+import os
+import numpy as np
+import pytest
+import main
+from population_model import train_population_model
+from visualization import CHART_NAMES, render_charts_parallel, render_series_charts
+
+def series_data(name):
+    years = np.arange(2000, 2010)
+    return {
+        'name': name,
+        'pop_years': years,
+        'pop_values': np.linspace(1e6, 2e6, 10),
+        'internet_years': years,
+        'internet_values': np.linspace(5, 60, 10),
+        'pop_model_info': train_population_model(years.reshape(-1, 1), 
+                                                 np.linspace(1e6, 2e6, 10) ** 1.1),
+        'internet_model_info': {'L': 80.0, 'k': 0.3, 'x0': 2006.0},
+        'missing_years': np.array([2003]),
+        'estimated_population': np.array([1.3e6]),
+        'estimated_internet': np.array([20.0]),
+        'future_years': np.array([2030, 2035]),
+        'predicted_population': np.array([3e6, 3.5e6]),
+        'predicted_internet_percentage': np.array([79.0, 80.0]),
+        'all_years': years
+    }
+
+def test_parallel_rendering_writes_every_chart(tmp_path):
+    paths = render_charts_parallel([series_data('A'), series_data('B')], str(tmp_path), processes=2)
+    expected = [str(tmp_path / f'{name}_{chart}.png') for name in 'AB' for chart in CHART_NAMES]
+    assert paths == expected
+    
+    # Hasil pekerja sama dengan penggambaran berurutan di proses utama
+    serial_dir = tmp_path / 'serial'
+    serial_dir.mkdir()
+    for path in render_series_charts(series_data('A'), str(serial_dir)):
+        with open(path, 'rb') as serial, open(tmp_path / os.path.basename(path), 'rb') as parallel:
+            assert serial.read() == parallel.read()
+
+def test_plot_command_renders_panel_in_parallel(csv_path, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    rendered = []
+    def recording_render(series_list, output_dir, processes=None):
+        rendered.extend(series['name'] for series in series_list)
+        return render_charts_parallel(series_list, output_dir, processes)
+    monkeypatch.setattr('visualization.render_charts_parallel', recording_render)
+    
+    main.main(['plot', '--csv', csv_path, '--output-dir', 'charts', '--processes', '2'])
+    assert rendered == ['A', 'B', 'C']
+    assert sorted(os.listdir('charts')) == sorted(f'{name}_{chart}.png' for name in 'ABC' 
+                                                  for chart in CHART_NAMES)
+    assert not os.path.exists('models.json')
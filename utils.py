@@ -26,4 +26,29 @@ def format_logistic(L, k, x0):
     Return:
         String persamaan logistik
     """
-    return f"y = {L:.2f} / (1 + exp(-{k:.6f} * (x - {x0:.2f})))"
\ No newline at end of file
+    return f"y = {L:.2f} / (1 + exp(-{k:.6f} * (x - {x0:.2f})))"
+
+def format_exponential(a, b, x0):
+    """
+    Fungsi untuk memformat persamaan eksponensial menjadi string yang mudah dibaca.
+    Parameter:
+        a: Nilai pada x = x0
+        b: Tingkat pertumbuhan
+        x0: Titik acuan
+    Return:
+        String persamaan eksponensial
+    """
+    return f"y = {a:.2f} * exp({b:.6f} * (x - {x0:.2f}))"
+
+def format_gompertz(K, b, c, x0):
+    """
+    Fungsi untuk memformat persamaan Gompertz menjadi string yang mudah dibaca.
+    Parameter:
+        K: Nilai asimtot atas
+        b: Parameter pergeseran
+        c: Tingkat pertumbuhan
+        x0: Titik acuan
+    Return:
+        String persamaan Gompertz
+    """
+    return f"y = {K:.2f} * exp(-{b:.6f} * exp(-{c:.6f} * (x - {x0:.2f})))"
\ No newline at end of file
@@ -1,41 +1,90 @@
-import matplotlib.pyplot as plt
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from predictors import FAMILY_LABELS, LogisticPredictor, population_predictor
 
-def plot_population_data(pop_years, pop_values):
+# Nama grafik yang dihasilkan untuk setiap deret
+CHART_NAMES = ['population', 'internet', 'internet_model', 'population_estimates', 'internet_estimates']
+
+def chart_path(output_dir, chart, series_name=''):
+    """
+    Fungsi untuk menentukan path file sebuah grafik dalam mode tanpa tampilan (headless).
+    Parameter:
+        output_dir: Direktori keluaran, atau None untuk mode interaktif
+        chart: Nama grafik (lihat CHART_NAMES)
+        series_name: Nama deret sebagai awalan nama file (opsional)
+    Return:
+        Path file PNG, atau None jika output_dir None
+    """
+    if output_dir is None:
+        return None
+    prefix = f"{str(series_name).replace(os.sep, '_')}_" if series_name != '' else ''
+    return os.path.join(output_dir, f'{prefix}{chart}.png')
+
+def _new_axes(figsize, output_path):
+    """
+    Fungsi untuk membuat figure dan axes baru.
+    
+    Dalam mode interaktif (output_path None) figure dibuat melalui pyplot agar dapat
+    ditampilkan. Dalam mode headless figure dibuat langsung dengan API Figure dan
+    canvas Agg tanpa menyentuh state global pyplot.
+    """
+    if output_path is None:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+def _finish(fig, ax, output_path):
+    """
+    Fungsi untuk menampilkan grafik (mode interaktif) atau menyimpannya ke file (mode headless).
+    """
+    ax.grid(True)
+    ax.legend()
+    if output_path is None:
+        import matplotlib.pyplot as plt
+        plt.show()
+    else:
+        fig.savefig(output_path)
+
+def plot_population_data(pop_years, pop_values, output_path=None):
     """
     Fungsi untuk memvisualisasikan data populasi.
     
     Parameter:
         pop_years: Array tahun untuk data populasi
         pop_values: Array nilai populasi
+        output_path: Path file untuk menyimpan grafik tanpa menampilkannya (opsional)
     """
-    plt.figure(figsize=(12, 6))
-    plt.scatter(pop_years, pop_values, color='blue', label='Data Aktual')
-    plt.title('Pertumbuhan Populasi Indonesia (1960-2023)')
-    plt.xlabel('Tahun')
-    plt.ylabel('Populasi')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    fig, ax = _new_axes((12, 6), output_path)
+    ax.scatter(pop_years, pop_values, color='blue', label='Data Aktual')
+    ax.set_title('Pertumbuhan Populasi Indonesia (1960-2023)')
+    ax.set_xlabel('Tahun')
+    ax.set_ylabel('Populasi')
+    _finish(fig, ax, output_path)
 
-def plot_internet_data(internet_years, internet_values):
+def plot_internet_data(internet_years, internet_values, output_path=None):
     """
     Fungsi untuk memvisualisasikan data penggunaan internet.
     
     Parameter:
         internet_years: Array tahun untuk data internet
         internet_values: Array nilai persentase pengguna internet
+        output_path: Path file untuk menyimpan grafik tanpa menampilkannya (opsional)
     """
-    plt.figure(figsize=(12, 6))
-    plt.scatter(internet_years, internet_values, color='red', label='Data Aktual')
-    plt.title('Persentase Pengguna Internet di Indonesia (1960-2023)')
-    plt.xlabel('Tahun')
-    plt.ylabel('Persentase Pengguna Internet (%)')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    fig, ax = _new_axes((12, 6), output_path)
+    ax.scatter(internet_years, internet_values, color='red', label='Data Aktual')
+    ax.set_title('Persentase Pengguna Internet di Indonesia (1960-2023)')
+    ax.set_xlabel('Tahun')
+    ax.set_ylabel('Persentase Pengguna Internet (%)')
+    _finish(fig, ax, output_path)
 
-def plot_internet_model(internet_years, internet_values, logistic_function, params, years_range=None):
+def plot_internet_model(internet_years, internet_values, logistic_function, params, years_range=None, 
+                        output_path=None):
     """
     Fungsi untuk memvisualisasikan data penggunaan internet dengan model logistik.
     
@@ -45,11 +94,12 @@ def plot_internet_model(internet_years, internet_values, logistic_function, para
         logistic_function: Fungsi logistik untuk memprediksi nilai
         params: Parameter model logistik [L, k, x0]
         years_range: Rentang tahun untuk visualisasi (opsional)
+        output_path: Path file untuk menyimpan grafik tanpa menampilkannya (opsional)
     """
     L_fit, k_fit, x0_fit = params
     
-    plt.figure(figsize=(12, 6))
-    plt.scatter(internet_years, internet_values, color='red', label='Data Aktual')
+    fig, ax = _new_axes((12, 6), output_path)
+    ax.scatter(internet_years, internet_values, color='red', label='Data Aktual')
     
     # Membuat kurva halus untuk plot
     if years_range is None:
@@ -57,16 +107,14 @@ def plot_internet_model(internet_years, internet_values, logistic_function, para
     
     internet_curve = logistic_function(years_range, L_fit, k_fit, x0_fit)
     
-    plt.plot(years_range, internet_curve, 'b-', label='Model Logistik')
-    plt.title('Model Pertumbuhan Persentase Pengguna Internet di Indonesia')
-    plt.xlabel('Tahun')
-    plt.ylabel('Persentase Pengguna Internet (%)')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    ax.plot(years_range, internet_curve, 'b-', label='Model Logistik')
+    ax.set_title('Model Pertumbuhan Persentase Pengguna Internet di Indonesia')
+    ax.set_xlabel('Tahun')
+    ax.set_ylabel('Persentase Pengguna Internet (%)')
+    _finish(fig, ax, output_path)
 
 def plot_population_with_estimates(pop_years, pop_values, pop_model_info, missing_years, estimated_population, 
-                                future_years, predicted_population, all_years):
+                                future_years, predicted_population, all_years, output_path=None):
     """
     Fungsi untuk memvisualisasikan data populasi dengan estimasi dan prediksi.
     
@@ -79,36 +127,39 @@ def plot_population_with_estimates(pop_years, pop_values, pop_model_info, missin
         future_years: Array tahun untuk prediksi masa depan
         predicted_population: Array nilai populasi yang diprediksi
         all_years: Array semua tahun dalam dataset
+        output_path: Path file untuk menyimpan grafik tanpa menampilkannya (opsional)
     """
-    plt.figure(figsize=(14, 7))
+    fig, ax = _new_axes((14, 7), output_path)
     
     # Plot data asli
-    plt.scatter(pop_years, pop_values, color='blue', label='Data Populasi Aktual')
+    ax.scatter(pop_years, pop_values, color='blue', label='Data Populasi Aktual')
     
     # Membuat data untuk kurva
-    years_range = np.linspace(min(all_years), 2035, 100).reshape(-1, 1)
-    years_range_poly_pop = pop_model_info['poly_features'].transform(years_range)
-    pop_curve = pop_model_info['model'].predict(years_range_poly_pop)
+    years_range = np.linspace(min(all_years), 2035, 100)
+    pop_curve = population_predictor(pop_model_info)(years_range)
     
     # Plot kurva regresi
-    plt.plot(years_range, pop_curve, 'g-', label=f'Model Polinomial (Derajat {pop_model_info["degree"]})')
+    family = pop_model_info.get('family', 'polynomial')
+    if family == 'polynomial':
+        label = f'Model Polinomial (Derajat {pop_model_info["degree"]})'
+    else:
+        label = f'Model {FAMILY_LABELS[family]}'
+    ax.plot(years_range, pop_curve, 'g-', label=label)
     
     # Plot nilai yang diestimasi
-    plt.scatter(missing_years, estimated_population, color='red', s=100, marker='x', label='Nilai Populasi yang Diestimasi')
+    ax.scatter(missing_years, estimated_population, color='red', s=100, marker='x', label='Nilai Populasi yang Diestimasi')
     
     # Plot nilai prediksi
-    plt.scatter(future_years, predicted_population, color='purple', s=100, marker='*', label='Nilai Populasi yang Diprediksi')
-    
-    plt.title('Model Pertumbuhan Populasi Indonesia')
-    plt.xlabel('Tahun')
-    plt.ylabel('Populasi')
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    ax.scatter(future_years, predicted_population, color='purple', s=100, marker='*', label='Nilai Populasi yang Diprediksi')
+    
+    ax.set_title('Model Pertumbuhan Populasi Indonesia')
+    ax.set_xlabel('Tahun')
+    ax.set_ylabel('Populasi')
+    _finish(fig, ax, output_path)
 
 def plot_internet_with_estimates(internet_years, internet_values, logistic_function, params, 
                                 missing_years_array, estimated_internet, future_years_array, 
-                                predicted_internet_percentage, all_years):
+                                predicted_internet_percentage, all_years, output_path=None):
     """
     Fungsi untuk memvisualisasikan data penggunaan internet dengan estimasi dan prediksi.
     
@@ -122,31 +173,141 @@ def plot_internet_with_estimates(internet_years, internet_values, logistic_funct
         future_years_array: Array tahun untuk prediksi masa depan
         predicted_internet_percentage: Array nilai persentase internet yang diprediksi
         all_years: Array semua tahun dalam dataset
+        output_path: Path file untuk menyimpan grafik tanpa menampilkannya (opsional)
     """
     L_fit, k_fit, x0_fit = params
     
-    plt.figure(figsize=(14, 7))
+    fig, ax = _new_axes((14, 7), output_path)
     
     # Plot data asli
-    plt.scatter(internet_years, internet_values, color='red', label='Data Persentase Internet Aktual')
+    ax.scatter(internet_years, internet_values, color='red', label='Data Persentase Internet Aktual')
     
     # Membuat data untuk kurva
     years_range_flat = np.linspace(min(all_years), 2035, 100)
     internet_curve = logistic_function(years_range_flat, L_fit, k_fit, x0_fit)
     
     # Plot kurva logistik
-    plt.plot(years_range_flat, internet_curve, 'b-', label='Model Logistik')
+    ax.plot(years_range_flat, internet_curve, 'b-', label='Model Logistik')
     
     # Plot nilai yang diestimasi
-    plt.scatter(missing_years_array, estimated_internet, color='green', s=100, marker='x', label='Nilai Persentase Internet yang Diestimasi')
+    ax.scatter(missing_years_array, estimated_internet, color='green', s=100, marker='x', label='Nilai Persentase Internet yang Diestimasi')
     
     # Plot nilai prediksi
-    plt.scatter(future_years_array, predicted_internet_percentage, color='orange', s=100, marker='*', label='Nilai Persentase Internet yang Diprediksi')
-    
-    plt.title('Model Pertumbuhan Persentase Pengguna Internet di Indonesia')
-    plt.xlabel('Tahun')
-    plt.ylabel('Persentase Pengguna Internet (%)')
-    plt.ylim(0, 105)  # Memastikan visualisasi menunjukkan batas maksimum 100%
-    plt.grid(True)
-    plt.legend()
-    plt.show()
\ No newline at end of file
+    ax.scatter(future_years_array, predicted_internet_percentage, color='orange', s=100, marker='*', label='Nilai Persentase Internet yang Diprediksi')
+    
+    ax.set_title('Model Pertumbuhan Persentase Pengguna Internet di Indonesia')
+    ax.set_xlabel('Tahun')
+    ax.set_ylabel('Persentase Pengguna Internet (%)')
+    ax.set_ylim(0, 105)  # Memastikan visualisasi menunjukkan batas maksimum 100%
+    _finish(fig, ax, output_path)
+
+def render_series_charts(series_data, output_dir):
+    """
+    Fungsi untuk menyimpan kelima grafik satu deret ke file (mode headless).
+    
+    Parameter:
+        series_data: Dictionary berisi data satu deret dengan kunci 'name', 'pop_years',
+                     'pop_values', 'internet_years', 'internet_values', 'pop_model_info',
+                     'internet_model_info', 'missing_years', 'estimated_population',
+                     'estimated_internet', 'future_years', 'predicted_population',
+                     'predicted_internet_percentage' dan 'all_years'
+        output_dir: Direktori keluaran
+    Return:
+        List path file yang ditulis
+    """
+    from internet_usage_model import logistic_function
+    
+    name = series_data.get('name', '')
+    paths = {chart: chart_path(output_dir, chart, name) for chart in CHART_NAMES}
+    internet_info = series_data['internet_model_info']
+    params = [internet_info['L'], internet_info['k'], internet_info['x0']]
+    
+    plot_population_data(series_data['pop_years'], series_data['pop_values'], 
+                         output_path=paths['population'])
+    plot_internet_data(series_data['internet_years'], series_data['internet_values'], 
+                       output_path=paths['internet'])
+    plot_internet_model(series_data['internet_years'], series_data['internet_values'], 
+                        logistic_function, params, output_path=paths['internet_model'])
+    plot_population_with_estimates(series_data['pop_years'], series_data['pop_values'], 
+                                   series_data['pop_model_info'], series_data['missing_years'], 
+                                   series_data['estimated_population'], series_data['future_years'], 
+                                   series_data['predicted_population'], series_data['all_years'], 
+                                   output_path=paths['population_estimates'])
+    plot_internet_with_estimates(series_data['internet_years'], series_data['internet_values'], 
+                                 logistic_function, params, series_data['missing_years'], 
+                                 series_data['estimated_internet'], series_data['future_years'], 
+                                 series_data['predicted_internet_percentage'], series_data['all_years'], 
+                                 output_path=paths['internet_estimates'])
+    return list(paths.values())
+
+def series_chart_data(dataset, pop_models, internet_models, estimation_results, future_years):
+    """
+    Fungsi untuk menyusun data grafik setiap deret pada data panel.
+    
+    Parameter:
+        dataset: Dataset hasil load_data
+        pop_models: List informasi model populasi (satu per deret)
+        internet_models: List informasi model internet (satu per deret)
+        estimation_results: Hasil estimate_missing_values untuk dataset.missing_index
+        future_years: Array tahun prediksi
+    Return:
+        List dictionary data per deret (masukan render_series_charts)
+    """
+    n_series = len(dataset.series_labels)
+    series = np.arange(n_series)
+    predicted_population = population_predictor(pop_models)(future_years, series[:, None])
+    predicted_internet = LogisticPredictor.from_model_info(internet_models)(future_years, series[:, None])
+    
+    # Baris data dan nilai hilang dikelompokkan per deret (missing_index sudah terurut per deret)
+    order = np.argsort(dataset.series_ids, kind='stable')
+    row_bounds = np.searchsorted(dataset.series_ids[order], np.arange(n_series + 1))
+    missing_bounds = np.searchsorted(dataset.missing_index[:, 0], np.arange(n_series + 1))
+    
+    series_list = []
+    for s in series:
+        rows = order[row_bounds[s]:row_bounds[s + 1]]
+        missing = slice(missing_bounds[s], missing_bounds[s + 1])
+        pop_rows = rows[dataset.pop_valid[rows]]
+        internet_rows = rows[dataset.internet_valid[rows]]
+        series_list.append({
+            'name': dataset.series_labels[s],
+            'pop_years': dataset.years[pop_rows],
+            'pop_values': dataset.population[pop_rows],
+            'internet_years': dataset.years[internet_rows],
+            'internet_values': dataset.internet[internet_rows],
+            'pop_model_info': pop_models[s],
+            'internet_model_info': internet_models[s],
+            'missing_years': dataset.missing_index[missing, 1],
+            'estimated_population': estimation_results['estimated_population'][missing],
+            'estimated_internet': estimation_results['estimated_internet'][missing],
+            'future_years': future_years,
+            'predicted_population': predicted_population[s],
+            'predicted_internet_percentage': predicted_internet[s],
+            'all_years': dataset.years[rows]
+        })
+    return series_list
+
+def render_charts_parallel(series_list, output_dir, processes=None):
+    """
+    Fungsi untuk menyimpan grafik banyak deret secara paralel dengan process pool.
+    
+    Setiap proses pekerja menggambar dengan API Figure dan canvas Agg sehingga
+    tidak ada jendela yang dibuka dan tidak ada state pyplot yang dibagi.
+    
+    Parameter:
+        series_list: List dictionary data per deret (lihat render_series_charts)
+        output_dir: Direktori keluaran
+        processes: Jumlah proses pekerja (opsional, bawaan jumlah CPU)
+    Return:
+        List path file yang ditulis
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if not series_list:
+        return []
+    
+    workers = processes or os.cpu_count() or 1
+    chunksize = max(1, len(series_list) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(render_series_charts, series_list, 
+                               [output_dir] * len(series_list), chunksize=chunksize)
+        return [path for paths in results for path in paths]